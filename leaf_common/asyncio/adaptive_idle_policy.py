@@ -0,0 +1,187 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from math import ceil
+
+
+class AdaptiveIdlePolicy:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Demand-adaptive idle policy for the GC of an AsyncioExecutorPool.
+
+    Demand comes in bursts: periods during which executors are in use,
+    separated by gaps during which none are. Gaps shorter than merge_gap_seconds
+    do not end a burst. The policy keeps exponentially weighted moving averages
+    (EWMA) of the peak number of executors in use per burst, and of the gaps
+    between bursts.
+
+    Once it has seen enough bursts, the GC keeps enough available executors
+    to cover the predicted peak demand, however long they have been idle,
+    and collects the excess once it has been idle for longer than the predicted gap
+    (or the fixed idle timeout, if that is shorter).
+    When there is no prediction yet, or when demand has stayed away for more than
+    quiet_factor times the predicted gap, the fixed idle timeout applies as before.
+
+    Not thread-safe: AsyncioExecutorPool calls it with its lock held.
+    """
+
+    MODE_FIXED: str = "fixed"
+    MODE_ADAPTIVE: str = "adaptive"
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, alpha: float = 0.3, *,
+                 merge_gap_seconds: float = 1.0,
+                 quiet_factor: float = 3.0,
+                 min_bursts: int = 2):
+        """
+        Constructor
+        :param alpha: Weight of the latest burst in the moving averages, in (0, 1]
+        :param merge_gap_seconds: Gaps in demand shorter than this do not end a burst
+        :param quiet_factor: Once demand has stayed away for more than this many
+                    predicted gaps, the policy falls back to the fixed idle timeout
+        :param min_bursts: Number of bursts to see before predicting anything
+        """
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        if merge_gap_seconds < 0.0 or quiet_factor <= 0.0 or min_bursts < 1:
+            raise ValueError("merge_gap_seconds must be >= 0, quiet_factor > 0 and min_bursts >= 1")
+        self.alpha: float = alpha
+        self.merge_gap_seconds: float = merge_gap_seconds
+        self.quiet_factor: float = quiet_factor
+        self.min_bursts: int = min_bursts
+
+        self._in_use: int = 0
+        self._peak: int = 0
+        # monotonic() when demand last dropped to zero, while the burst is not over yet
+        self._idle_since: Optional[float] = None
+        # monotonic() when the last burst was over, for the next gap
+        self._burst_ended_at: Optional[float] = None
+        self._bursts: int = 0
+        self._peak_ewma: Optional[float] = None
+        self._gap_ewma: Optional[float] = None
+
+        # Last decision and how it differed from the fixed timeout
+        self._mode: str = self.MODE_FIXED
+        self._keep: int = 0
+        self._spared: int = 0
+        self._collected_early: int = 0
+
+    def observe(self, in_use: int, now: float):
+        """
+        Record a change in demand.
+        :param in_use: Number of executors in use, or being started for use, right now
+        :param now: time.monotonic()
+        """
+        if in_use > 0 and self._in_use == 0:
+            self._finish_burst(now)
+            if self._idle_since is None and self._burst_ended_at is not None:
+                self._gap_ewma = self._smooth(self._gap_ewma, now - self._burst_ended_at)
+                self._burst_ended_at = None
+            self._idle_since = None
+        elif in_use == 0 and self._in_use > 0:
+            self._idle_since = now
+        self._peak = max(self._peak, in_use)
+        self._in_use = in_use
+
+    def decide(self, now: float, idle_timeout_seconds: float) -> Tuple[int, float]:
+        """
+        Decide what the GC should do now.
+        :param now: time.monotonic()
+        :param idle_timeout_seconds: The fixed idle timeout of the pool
+        :return: A tuple of the number of available executors to keep however long
+                they have been idle, and the idle time after which to collect the others
+        """
+        self._finish_burst(now)
+        self._mode = self.MODE_FIXED
+        self._keep = 0
+        if self._bursts < self.min_bursts or self._gap_ewma is None:
+            return 0, idle_timeout_seconds
+        idle_since: Optional[float] = self._idle_since if self._idle_since is not None else self._burst_ended_at
+        if self._in_use == 0 and idle_since is not None \
+                and now - idle_since > self.quiet_factor * self._gap_ewma:
+            return 0, idle_timeout_seconds
+
+        self._mode = self.MODE_ADAPTIVE
+        self._keep = max(0, self.get_predicted_peak() - self._in_use)
+        return self._keep, min(idle_timeout_seconds, self._gap_ewma)
+
+    def record_collections(self, spared: int, collected_early: int):
+        """
+        Record how the last GC sweep differed from what the fixed idle timeout would have done.
+        :param spared: Number of executors kept which the fixed timeout would have collected
+        :param collected_early: Number of executors collected before the fixed timeout
+        """
+        self._spared += spared
+        self._collected_early += collected_early
+
+    def get_predicted_peak(self) -> int:
+        """
+        :return: The predicted peak number of executors in use in the next burst
+        """
+        if self._peak_ewma is None:
+            return 0
+        # Tolerate float error on the EWMA of integer peaks
+        return ceil(self._peak_ewma - 1e-9)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary of the state and decisions of the policy:
+                the "mode" of the last decision, MODE_ADAPTIVE or MODE_FIXED,
+                the number of available executors it kept regardless of idle time ("keep"),
+                the number of "bursts" seen, the "peak_ewma" and "gap_ewma_seconds"
+                moving averages (None until known), the "predicted_peak",
+                and how many executors were "spared" or "collected_early"
+                compared to the fixed idle timeout.
+        """
+        return {
+            "mode": self._mode,
+            "keep": self._keep,
+            "bursts": self._bursts,
+            "peak_ewma": self._peak_ewma,
+            "gap_ewma_seconds": self._gap_ewma,
+            "predicted_peak": self.get_predicted_peak(),
+            "spared": self._spared,
+            "collected_early": self._collected_early,
+        }
+
+    def _finish_burst(self, now: float):
+        """
+        Close the current burst, if demand has been away for at least merge_gap_seconds.
+        :param now: time.monotonic()
+        """
+        if self._idle_since is None or now - self._idle_since < self.merge_gap_seconds:
+            return
+        self._peak_ewma = self._smooth(self._peak_ewma, self._peak)
+        self._bursts += 1
+        self._peak = 0
+        self._burst_ended_at = self._idle_since
+        self._idle_since = None
+
+    def _smooth(self, average: Optional[float], sample: float) -> float:
+        """
+        :return: The moving average updated with the sample
+        """
+        if average is None:
+            return float(sample)
+        return self.alpha * sample + (1.0 - self.alpha) * average
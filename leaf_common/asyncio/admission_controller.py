@@ -0,0 +1,386 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from asyncio import get_running_loop
+from asyncio import wait_for
+from threading import Condition
+from threading import Lock
+from time import monotonic
+
+from leaf_common.asyncio.admission_ticket import AdmissionTicket
+from leaf_common.asyncio.task_priority import TaskPriority
+from leaf_common.asyncio.task_rejected_exception import TaskRejectedException
+
+
+class AdmissionController:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Limits the number of tasks an executor has in flight,
+    overall and/or per submitter_id, and decides what happens
+    to a submission which would go over the limit.
+
+    Overflow policies
+    -----------------
+    OVERFLOW_BLOCK:       The submitting caller waits for a task to finish,
+                          up to block_timeout_seconds, after which the
+                          submission is rejected. Callers on the executor's
+                          own event loop thread cannot block, so for them
+                          the submission is rejected right away.
+    OVERFLOW_REJECT:      The submission is rejected right away.
+    OVERFLOW_SHED_OLDEST: The oldest task in flight (for the same submitter
+                          when the per-submitter limit is the one reached)
+                          is cancelled to make room for the new submission.
+
+    Submissions carry a TaskPriority. Under OVERFLOW_BLOCK, a submission
+    is not admitted while a more urgent one is waiting for admission.
+    Under OVERFLOW_SHED_OLDEST, the least urgent of the tasks in flight is shed,
+    oldest first, and never one more urgent than the new submission.
+
+    Rejections raise TaskRejectedException.
+    """
+
+    OVERFLOW_BLOCK: str = "block"
+    OVERFLOW_REJECT: str = "reject"
+    OVERFLOW_SHED_OLDEST: str = "shed_oldest"
+    OVERFLOW_POLICIES: Tuple[str, ...] = (OVERFLOW_BLOCK, OVERFLOW_REJECT, OVERFLOW_SHED_OLDEST)
+
+    def __init__(self, max_in_flight: int = None,
+                 max_in_flight_per_submitter: int = None,
+                 overflow_policy: str = OVERFLOW_BLOCK,
+                 block_timeout_seconds: float = None):
+        """
+        Constructor.
+
+        :param max_in_flight: Maximum number of tasks in flight overall.
+                    Default of None implies no overall limit.
+        :param max_in_flight_per_submitter: Maximum number of tasks in flight
+                    for any single submitter_id. Default of None implies no
+                    per-submitter limit.
+        :param overflow_policy: One of the OVERFLOW_* constants above.
+                    Default is OVERFLOW_BLOCK.
+        :param block_timeout_seconds: For OVERFLOW_BLOCK, the maximum time
+                    to wait for admission before rejecting. Default of None
+                    implies waiting forever.
+        """
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {self.OVERFLOW_POLICIES}, not {overflow_policy}")
+        for name, value in (("max_in_flight", max_in_flight),
+                            ("max_in_flight_per_submitter", max_in_flight_per_submitter)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be > 0")
+
+        self.max_in_flight: Optional[int] = max_in_flight
+        self.max_in_flight_per_submitter: Optional[int] = max_in_flight_per_submitter
+        self.overflow_policy: str = overflow_policy
+        self.block_timeout_seconds: Optional[float] = block_timeout_seconds
+
+        self._lock = Lock()
+        self._condition = Condition(self._lock)
+        self._sequence: int = 0
+        # Tickets in flight keyed by sequence number. Dicts keep insertion order,
+        # so the first entry is always the oldest.
+        self._in_flight: Dict[int, AdmissionTicket] = {}
+        self._in_flight_by_submitter: Dict[str, Dict[int, AdmissionTicket]] = {}
+        # Callers on some event loop waiting for admission
+        self._async_waiters: List[Tuple[AbstractEventLoop, Future]] = []
+        # Number of callers waiting for admission, sync or async, by priority
+        self._waiting_by_priority: Dict[int, int] = {priority: 0 for priority in TaskPriority.PRIORITIES}
+
+        self._admitted: int = 0
+        self._rejected: int = 0
+        self._shed: int = 0
+
+    def acquire(self, submitter_id: str, block: bool = True,
+                priority: int = TaskPriority.NORMAL) -> AdmissionTicket:
+        """
+        Get admission for one task, applying the overflow policy if needed.
+
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param block: False if the caller must not wait for admission,
+                    in which case the OVERFLOW_BLOCK policy rejects right away.
+        :param priority: The TaskPriority of the task. Default is NORMAL.
+        :return: An AdmissionTicket to release() once the task is done
+        """
+        deadline: Optional[float] = self._get_deadline()
+        ticket: Optional[AdmissionTicket] = None
+        victim: Optional[AdmissionTicket] = None
+        waiting: bool = False
+        with self._condition:
+            try:
+                while True:
+                    ticket, victim = self._try_admit(submitter_id, priority)
+                    if ticket is not None:
+                        break
+                    remaining: Optional[float] = self._get_remaining(deadline)
+                    if not block or (remaining is not None and remaining <= 0.0):
+                        raise self._reject(submitter_id, "timed out waiting for admission")
+                    if not waiting:
+                        waiting = True
+                        self._waiting_by_priority[priority] += 1
+                    self._condition.wait(remaining)
+            finally:
+                if waiting:
+                    self._stop_waiting(priority, ticket)
+
+        if victim is not None:
+            victim.shed()
+        return ticket
+
+    async def acquire_async(self, submitter_id: str, priority: int = TaskPriority.NORMAL) -> AdmissionTicket:
+        """
+        Get admission for one task, applying the overflow policy if needed.
+        Waiting for admission under OVERFLOW_BLOCK happens on the caller's
+        event loop without blocking its thread.
+
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param priority: The TaskPriority of the task. Default is NORMAL.
+        :return: An AdmissionTicket to release() once the task is done
+        """
+        loop: AbstractEventLoop = get_running_loop()
+        deadline: Optional[float] = self._get_deadline()
+        ticket: Optional[AdmissionTicket] = None
+        waiting: bool = False
+        try:
+            while True:
+                with self._lock:
+                    ticket, victim = self._try_admit(submitter_id, priority)
+                    if ticket is None:
+                        remaining: Optional[float] = self._get_remaining(deadline)
+                        if remaining is not None and remaining <= 0.0:
+                            raise self._reject(submitter_id, "timed out waiting for admission")
+                        if not waiting:
+                            waiting = True
+                            self._waiting_by_priority[priority] += 1
+                        waiter: Future = loop.create_future()
+                        self._async_waiters.append((loop, waiter))
+
+                if ticket is not None:
+                    if victim is not None:
+                        victim.shed()
+                    return ticket
+
+                try:
+                    await wait_for(waiter, remaining)
+                except TimeoutError:
+                    # Loop around to reject under the lock
+                    pass
+                finally:
+                    with self._lock:
+                        if (loop, waiter) in self._async_waiters:
+                            self._async_waiters.remove((loop, waiter))
+        finally:
+            if waiting:
+                with self._lock:
+                    self._stop_waiting(priority, ticket)
+
+    def attach(self, ticket: AdmissionTicket, on_shed) -> None:
+        """
+        Make the task holding the ticket eligible for shedding.
+
+        :param ticket: The AdmissionTicket held by the task
+        :param on_shed: A no-argument callable which abandons the task.
+                    Called outside of any lock, from whichever thread
+                    is doing the shedding.
+        """
+        with self._lock:
+            ticket.on_shed = on_shed
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """
+        Give back the admission for a task which is done.
+        Releasing the same ticket more than once is harmless.
+
+        :param ticket: The AdmissionTicket to release
+        """
+        with self._condition:
+            if ticket.released:
+                return
+            self._release_locked(ticket)
+            self._notify_waiters_locked()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary snapshot of admission state and counters:
+                "in_flight", "in_flight_by_submitter", "waiting" (callers
+                currently waiting for admission), "admitted", "rejected", "shed",
+                along with the configured limits and policy.
+        """
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "in_flight_by_submitter": {
+                    submitter_id: len(tickets)
+                    for submitter_id, tickets in self._in_flight_by_submitter.items()
+                },
+                "waiting": sum(self._waiting_by_priority.values()),
+                "waiting_by_priority": {
+                    TaskPriority.NAMES[priority]: count
+                    for priority, count in self._waiting_by_priority.items()
+                },
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "shed": self._shed,
+                "max_in_flight": self.max_in_flight,
+                "max_in_flight_per_submitter": self.max_in_flight_per_submitter,
+                "overflow_policy": self.overflow_policy,
+            }
+
+    def _notify_waiters_locked(self):
+        """
+        Wake all callers waiting for admission so each re-checks.
+        Different waiters may be waiting on different submitter limits
+        or priorities, so all of them are woken.
+        Must be called with the lock held.
+        """
+        waiters: List[Tuple[AbstractEventLoop, Future]] = self._async_waiters
+        self._async_waiters = []
+        self._condition.notify_all()
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(AdmissionController._wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop is closed
+                pass
+
+    def _stop_waiting(self, priority: int, ticket: Optional[AdmissionTicket]):
+        """
+        Account for a caller no longer waiting for admission.
+        Must be called with the lock held.
+        :param priority: The priority the caller was waiting with
+        :param ticket: The ticket the caller got, or None if it gave up
+        """
+        self._waiting_by_priority[priority] -= 1
+        if ticket is None:
+            # Less urgent waiters may have been holding off for this one
+            self._notify_waiters_locked()
+
+    def _has_more_urgent_waiters(self, priority: int) -> bool:
+        """
+        Must be called with the lock held.
+        :return: True if any caller is waiting for admission with a more urgent priority
+        """
+        return any(count > 0 for waiting_priority, count in self._waiting_by_priority.items()
+                   if waiting_priority < priority)
+
+    @staticmethod
+    def _wake(waiter: Future):
+        """
+        Wake an async waiter. Called in the waiter's event loop thread.
+        """
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def _get_deadline(self) -> Optional[float]:
+        if self.overflow_policy != self.OVERFLOW_BLOCK or self.block_timeout_seconds is None:
+            return None
+        return monotonic() + self.block_timeout_seconds
+
+    @staticmethod
+    def _get_remaining(deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(0.0, deadline - monotonic())
+
+    def _reject(self, submitter_id: str, reason: str) -> TaskRejectedException:
+        """
+        Count a rejection. Must be called with the lock held.
+        :return: The exception for the caller to raise
+        """
+        self._rejected += 1
+        return TaskRejectedException(submitter_id, reason)
+
+    def _get_full_scope(self, submitter_id: str) -> Optional[Dict[int, AdmissionTicket]]:
+        """
+        Must be called with the lock held.
+        :return: The table of in-flight tickets whose limit a new submission
+                 would go over, or None if the submission fits.
+        """
+        if self.max_in_flight_per_submitter is not None:
+            submitter_tickets: Dict[int, AdmissionTicket] = self._in_flight_by_submitter.get(submitter_id, {})
+            if len(submitter_tickets) >= self.max_in_flight_per_submitter:
+                return submitter_tickets
+        if self.max_in_flight is not None and len(self._in_flight) >= self.max_in_flight:
+            return self._in_flight
+        return None
+
+    def _try_admit(self, submitter_id: str, priority: int) \
+            -> Tuple[Optional[AdmissionTicket], Optional[AdmissionTicket]]:
+        """
+        Must be called with the lock held.
+        :return: A tuple of (new ticket, ticket shed to make room for it).
+                 The new ticket is None when the caller should wait under
+                 OVERFLOW_BLOCK; the shed ticket is None unless shedding happened.
+        """
+        if self.overflow_policy == self.OVERFLOW_BLOCK and self._has_more_urgent_waiters(priority):
+            return None, None
+        full_scope: Optional[Dict[int, AdmissionTicket]] = self._get_full_scope(submitter_id)
+        victim: Optional[AdmissionTicket] = None
+        if full_scope is not None:
+            if self.overflow_policy == self.OVERFLOW_BLOCK:
+                return None, None
+            if self.overflow_policy == self.OVERFLOW_SHED_OLDEST:
+                victim = self._get_victim(full_scope, priority)
+            if victim is None:
+                raise self._reject(submitter_id, f"too many tasks in flight ({len(full_scope)})")
+            self._release_locked(victim)
+            self._shed += 1
+
+        self._sequence += 1
+        ticket = AdmissionTicket(self._sequence, submitter_id, priority)
+        self._in_flight[ticket.sequence] = ticket
+        self._in_flight_by_submitter.setdefault(submitter_id, {})[ticket.sequence] = ticket
+        self._admitted += 1
+        return ticket, victim
+
+    @staticmethod
+    def _get_victim(full_scope: Dict[int, AdmissionTicket], priority: int) -> Optional[AdmissionTicket]:
+        """
+        :param full_scope: The table of in-flight tickets to pick from, oldest first
+        :param priority: The priority of the submission needing room
+        :return: The oldest of the least urgent tickets no more urgent than priority,
+                 or None if there is no such ticket.
+        """
+        victim: Optional[AdmissionTicket] = None
+        for ticket in full_scope.values():
+            # Tasks still being created cannot be shed yet; skip over those.
+            if ticket.on_shed is None or ticket.priority < priority:
+                continue
+            if victim is None or ticket.priority > victim.priority:
+                victim = ticket
+        return victim
+
+    def _release_locked(self, ticket: AdmissionTicket):
+        """
+        Must be called with the lock held.
+        """
+        ticket.released = True
+        self._in_flight.pop(ticket.sequence, None)
+        submitter_tickets: Dict[int, AdmissionTicket] = self._in_flight_by_submitter.get(ticket.submitter_id)
+        if submitter_tickets is not None:
+            submitter_tickets.pop(ticket.sequence, None)
+            if not submitter_tickets:
+                del self._in_flight_by_submitter[ticket.submitter_id]
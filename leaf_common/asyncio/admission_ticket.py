@@ -0,0 +1,53 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Callable
+
+from leaf_common.asyncio.task_priority import TaskPriority
+
+
+class AdmissionTicket:
+    """
+    Permit for one in-flight task handed out by an AdmissionController.
+    The ticket is released back to the controller when the task is done.
+    """
+
+    __slots__ = ("sequence", "submitter_id", "priority", "released", "on_shed")
+
+    def __init__(self, sequence: int, submitter_id: str, priority: int = TaskPriority.NORMAL):
+        """
+        Constructor.
+
+        :param sequence: Monotonically increasing admission sequence number
+        :param submitter_id: A string id denoting who did the submitting.
+        :param priority: The TaskPriority of the task holding the ticket
+        """
+        self.sequence: int = sequence
+        self.submitter_id: str = submitter_id
+        self.priority: int = priority
+        self.released: bool = False
+        # Set once the corresponding task exists and can be shed
+        self.on_shed: Callable[[], None] = None
+
+    def shed(self):
+        """
+        Ask for the work holding this ticket to be abandoned.
+        """
+        if self.on_shed is not None:
+            self.on_shed()
@@ -23,8 +23,9 @@ from typing import Generator
 from typing import Type
 
 from asyncio import Future
-from time import sleep
-from time import time
+from concurrent import futures
+from threading import Event
+from time import monotonic
 
 from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
 from leaf_common.time.timeout import Timeout
@@ -60,8 +61,8 @@ class AsyncToSyncGenerator:
         :param keep_alive_timeout_seconds: Number of seconds seeking a result before the
                 keep_alive_result is returned.  Default value of 0.0 implies
                 waiting forever for a result.
-        :param poll_seconds: The number of seconds to wait while waiting for
-                asynchronous Futures to come back with results
+        :param poll_seconds: No longer used: waiting for asynchronous Futures to come
+                back with results is event-driven. Kept for backward compatibility.
         :param umbrella_timeout: A Timeout object to check while looking for results.
                                 Default is None implying no timeout.
         """
@@ -128,6 +129,8 @@ class AsyncToSyncGenerator:
                 future = self.asyncio_executor.submit(self.submitter_id, self.my_anext, async_iter)
 
                 # Wait for the result of the awaitable. It should be the iteration type.
+                # The same completion signal serves every keep-alive period.
+                done_event: Event = self.new_done_event(future)
                 iteration_result: Any = self.keep_alive_result
                 got_real_result: bool = False
                 while not got_real_result:
@@ -137,7 +140,8 @@ class AsyncToSyncGenerator:
                             time_left: float = self.umbrella_timeout.get_remaining_time_in_seconds()
                             if use_timeout <= 0.0 or use_timeout > time_left:
                                 use_timeout = time_left
-                        iteration_result = self.wait_for_future(future, self.generated_type, use_timeout)
+                        iteration_result = self.wait_for_future(future, self.generated_type, use_timeout,
+                                                                done_event)
                         Timeout.check_if_not_none(self.umbrella_timeout)
                         got_real_result = True
 
@@ -155,9 +159,30 @@ class AsyncToSyncGenerator:
             except StopAsyncIteration:
                 done = True
 
-    def wait_for_future(self, future: Future, result_type: Type, timeout_seconds: float = 0.0) -> Any:
+    @staticmethod
+    def new_done_event(future: Future) -> Event:
+        """
+        :param future: The asyncio Future, or concurrent.futures.Future, to get a completion signal for
+        :return: A threading Event set once the future is done
+        """
+        done_event = Event()
+        if future.done():
+            done_event.set()
+        elif isinstance(future, futures.Future):
+            future.add_done_callback(lambda _: done_event.set())
+        else:
+            # asyncio Futures are not thread-safe: attach the callback in their own event loop
+            future.get_loop().call_soon_threadsafe(future.add_done_callback, lambda _: done_event.set())
+        return done_event
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def wait_for_future(self, future: Future, result_type: Type, timeout_seconds: float = 0.0,
+                        done_event: Event = None) -> Any:
         """
         Waits for the future of a particular type.
+        The wait blocks on a completion signal for the future, without polling,
+        until either the future is done, timeout_seconds have passed,
+        or the umbrella_timeout is reached, whichever comes first.
 
         :param future: The asyncio Future to synchronously wait for.
         :param result_type: the type of the future's result to expect.
@@ -165,6 +190,9 @@ class AsyncToSyncGenerator:
         :param timeout_seconds: Amount of time to wait before throwing a TimeoutError
                     Any value <= 0.0 indicates the desire to loop forever to wait
                     for the future.
+        :param done_event: An optional completion signal for the future, as per new_done_event(),
+                    to reuse across several waits for the same future.
+                    Default of None creates a new one.
         """
 
         if future is None:
@@ -172,19 +200,10 @@ class AsyncToSyncGenerator:
             return None
 
         # Wait for the future to be done
-        start_time: float = time()
-        while not future.done():
-            # Always exit the loop if the future is done
-            Timeout.check_if_not_none(self.umbrella_timeout)
-
-            # Sleep to give another thread a change
-            sleep(self.poll_seconds)
-            if timeout_seconds > 0.0:
-                # We have a timeout. See if that has been exceeded
-                time_now: float = time()
-                time_elapsed: float = time_now - start_time
-                if time_elapsed >= timeout_seconds:
-                    raise TimeoutError
+        if not future.done():
+            if done_event is None:
+                done_event = self.new_done_event(future)
+            self._wait_for_done_event(done_event, timeout_seconds)
 
         # See if there was an exception in the asynchronous realm.
         # If so, raise it in the synchronous realm.
@@ -202,3 +221,28 @@ class AsyncToSyncGenerator:
             raise ValueError(f"Expected Future result of type {result_type} but got {result.__class__.__name__}")
 
         return result
+
+    def _wait_for_done_event(self, done_event: Event, timeout_seconds: float):
+        """
+        Block until the done_event is set.
+        Raises TimeoutReachedException once the umbrella_timeout is reached,
+        or TimeoutError once timeout_seconds > 0.0 have passed, whichever comes first.
+
+        :param done_event: The completion signal to wait for
+        :param timeout_seconds: Amount of time to wait. Any value <= 0.0 waits forever.
+        """
+        deadline: float = monotonic() + timeout_seconds if timeout_seconds > 0.0 else None
+        while True:
+            Timeout.check_if_not_none(self.umbrella_timeout)
+            wait_seconds: float = None
+            if deadline is not None:
+                wait_seconds = deadline - monotonic()
+                if wait_seconds <= 0.0:
+                    raise TimeoutError
+            if self.umbrella_timeout is not None:
+                umbrella_seconds: float = self.umbrella_timeout.get_remaining_time_in_seconds()
+                # Negative means the umbrella timeout is not set
+                if umbrella_seconds >= 0.0 and (wait_seconds is None or umbrella_seconds < wait_seconds):
+                    wait_seconds = umbrella_seconds
+            if done_event.wait(wait_seconds):
+                return
@@ -17,15 +17,20 @@
 """
 See class comment for details.
 """
+# pylint: disable=too-many-lines
+from collections.abc import Hashable
 from typing import Any
 from typing import Awaitable
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Tuple
 
 from functools import partial
 from inspect import isawaitable
+from inspect import iscoroutine
 from inspect import iscoroutinefunction
 from logging import getLogger
 from logging import Logger
@@ -33,56 +38,133 @@ from threading import Event
 from threading import Lock
 from threading import Thread
 from threading import get_ident
+from time import monotonic
 from traceback import format_exception
 
 from asyncio import AbstractEventLoop
 from asyncio import Future
 from asyncio import Task
 from asyncio import all_tasks
+from asyncio import current_task
 from asyncio import eager_task_factory
 from asyncio import gather
 from asyncio import run_coroutine_threadsafe
 from asyncio import set_event_loop
+from asyncio import sleep
+from asyncio import wait as wait_for_tasks
+from asyncio import wait_for
 from asyncio import to_thread
+from asyncio import wrap_future
 from asyncio.exceptions import CancelledError
 from concurrent import futures
 
+from leaf_common.asyncio.admission_controller import AdmissionController
+from leaf_common.asyncio.admission_ticket import AdmissionTicket
 from leaf_common.asyncio.event_loop_factory import EventLoopFactory
+from leaf_common.asyncio.executor_task_group import ExecutorTaskGroup
+from leaf_common.asyncio.loop_stall_watchdog import LoopStallWatchdog
 from leaf_common.asyncio.task_executor import TaskExecutor
+from leaf_common.asyncio.asyncio_process_pool_executor import AsyncioProcessPoolExecutor
 from leaf_common.asyncio.asyncio_threadpool_executor import AsyncioThreadPoolExecutor
+from leaf_common.asyncio.shared_thread_pool_executor import SharedThreadPoolExecutor
+from leaf_common.asyncio.priority_task_queue import PriorityTaskQueue
+from leaf_common.asyncio.single_flight import SingleFlight
+from leaf_common.asyncio.submitter_rate_limiter import SubmitterRateLimiter
+from leaf_common.asyncio.task_metrics import TaskMetrics
+from leaf_common.asyncio.task_priority import TaskPriority
+from leaf_common.asyncio.task_deadlines import TaskDeadlines
+from leaf_common.asyncio.task_record import TaskRecord
+from leaf_common.asyncio.task_rejected_exception import TaskRejectedException
 from leaf_common.logging.sensitive_logger import SensitiveLogger
 
 EXECUTOR_START_TIMEOUT_SECONDS: int = 5
 
 
 class AsyncioExecutor(TaskExecutor):
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     Class for managing asynchronous background tasks in a single thread
     Riffed from:
     https://stackoverflow.com/questions/38387443/how-to-implement-a-async-grpc-python-server/63020796#63020796
+
+    Submissions can be given a TaskPriority. Tasks submitted from other threads
+    are created in priority order, ahead of less urgent ones still waiting
+    to be created, and any AdmissionController admits them in priority order.
+    Once created, all tasks share the event loop's first-come first-served ready queue,
+    so long-running low priority coroutines should periodically
+    await yield_to_higher_priority() to let more urgent tasks through.
     """
 
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, max_workers: int = None):
+    # Default maximum time in seconds yield_to_higher_priority() waits
+    DEFAULT_MAX_YIELD_SECONDS: float = 0.05
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, max_workers: int = None, *,
+                 admission_controller: AdmissionController = None,
+                 process_pool_executor: AsyncioProcessPoolExecutor = None,
+                 event_loop: str = None,
+                 stall_watchdog: LoopStallWatchdog = None,
+                 shared_thread_pool: SharedThreadPoolExecutor = None):
         """
         Constructor
+        :param max_workers: maximum number of threads to use for running synchronous functions
+        :param admission_controller: An optional AdmissionController limiting
+                    the number of tasks this executor has in flight.
+                    Default of None implies no limit.
+        :param process_pool_executor: An optional AsyncioProcessPoolExecutor
+                    to run synchronous functions marked with
+                    AsyncioProcessPoolExecutor.cpu_bound() in.
+                    It is not shut down along with this executor.
+                    Default of None runs all synchronous functions in worker threads.
+        :param event_loop: The event loop implementation to use, as per
+                    EventLoopFactory.new_event_loop(). Default of None uses
+                    the LEAF_EVENT_LOOP environment variable, or uvloop
+                    when it is installed.
+        :param stall_watchdog: An optional LoopStallWatchdog to watch this executor's
+                    event loop while it runs. It is not stopped along with this executor.
+        :param shared_thread_pool: An optional SharedThreadPoolExecutor to run synchronous
+                    functions in, instead of worker threads of our own; max_workers is then ignored.
+                    Only work submitted by this executor is cancelled on shutdown;
+                    the shared pool itself is not shut down along with this executor.
         """
         super().__init__()
         self._shutdown: bool = False
         self._thread: Thread = None
         # We are going to start new thread for this Executor,
         # so we need a new event loop bound to this particular thread:
-        self._threadpool_executor: AsyncioThreadPoolExecutor = AsyncioThreadPoolExecutor(max_workers=max_workers)
-        self._loop: AbstractEventLoop = EventLoopFactory.new_event_loop()
+        self._threadpool_executor: futures.ThreadPoolExecutor = AsyncioThreadPoolExecutor(max_workers=max_workers) \
+            if shared_thread_pool is None else shared_thread_pool.new_share(str(id(self)))
+        self._process_pool_executor: AsyncioProcessPoolExecutor = process_pool_executor
+        self._loop: AbstractEventLoop = EventLoopFactory.new_event_loop(event_loop)
         self._loop.set_exception_handler(AsyncioExecutor.loop_exception_handler)
         self._loop.set_default_executor(self._threadpool_executor)
         self._loop.set_task_factory(eager_task_factory)
         self._loop_ready = Event()
         self._init_done = Event()
-        self._background_tasks: Dict[int, Dict[str, Any]] = {}
-        # background tasks table will be accessed from different threads,
-        # so protect it:
+        # Background tasks table, keyed by id(task): the one registry of the tasks not done yet,
+        # holding their TaskRecords. Tasks we create are in it from creation until done,
+        # along with the tasks given to track_task(). It will be accessed from different threads,
+        # so protect it: every read and write goes through _background_tasks_lock.
+        self._background_tasks: Dict[int, TaskRecord] = {}
         self._background_tasks_lock = Lock()
+        self._admission_controller: AdmissionController = admission_controller
+        self._task_metrics: TaskMetrics = TaskMetrics()
+        # Number of tasks we created which are not done yet, by priority.
+        # Only ever accessed from the event loop thread, so no lock.
+        self._unfinished_by_priority: Dict[int, int] = {priority: 0 for priority in TaskPriority.PRIORITIES}
+        # Coroutines waiting in yield_to_higher_priority(), with their priority.
+        # Also only accessed from the event loop thread.
+        self._yield_waiters: List[Tuple[int, Future]] = []
+        self._priority_queue: PriorityTaskQueue = PriorityTaskQueue()
+        # Deadlines of tasks submitted with a timeout, also only accessed from the event loop thread.
+        self._deadlines: TaskDeadlines = TaskDeadlines(self._loop, AsyncioExecutor._expire_task)
+        self._draining: bool = False
+        # time.monotonic() by which the event loop thread is to stop waiting
+        # for the tasks left after a graceful shutdown, or None for no limit
+        self._final_gather_deadline: Optional[float] = None
+        self._stall_watchdog: LoopStallWatchdog = stall_watchdog
+        self._single_flight: SingleFlight = SingleFlight()
+        self._rate_limiter: SubmitterRateLimiter = SubmitterRateLimiter()
         self.logger: Logger = getLogger(self.__class__.__name__)
 
     def get_event_loop(self) -> AbstractEventLoop:
@@ -101,13 +183,41 @@ class AsyncioExecutor(TaskExecutor):
             return
 
         self._thread = Thread(target=self.loop_manager,
-                              args=(self._loop, self._loop_ready),
+                              args=(self._loop, self._loop_ready, self._get_final_gather_timeout),
                               daemon=True)
         self._thread.start()
         timeout: int = EXECUTOR_START_TIMEOUT_SECONDS
         was_set: bool = self._loop_ready.wait(timeout=timeout)
         if not was_set:
             raise ValueError(f"FAILED to start executor event loop in {timeout} sec")
+        if self._stall_watchdog is not None:
+            self._stall_watchdog.watch(str(id(self)), self._loop, self._thread.ident)
+
+    def get_loop_thread_id(self) -> Optional[int]:
+        """
+        :return: The ident of the thread running our event loop,
+                 or None if the executor is not running.
+        """
+        thread: Thread = self._thread
+        return thread.ident if thread is not None else None
+
+    def is_healthy(self, timeout: float = 5.0) -> bool:
+        """
+        Check that the event loop thread is alive and that the loop
+        gets around to running a no-op coroutine within the timeout.
+        :param timeout: The maximum time in seconds to wait for the loop to answer
+        :return: True if the executor is fit to run tasks, False otherwise
+        """
+        thread: Thread = self._thread
+        if self._shutdown or thread is None or not thread.is_alive() or not self._loop.is_running():
+            return False
+        ping: futures.Future = run_coroutine_threadsafe(sleep(0), self._loop)
+        try:
+            ping.result(timeout)
+        except futures.TimeoutError:
+            ping.cancel()
+            return False
+        return True
 
     def initialize(self, init_function: Callable):
         """
@@ -147,12 +257,16 @@ class AsyncioExecutor(TaskExecutor):
         loop_ready.set()
 
     @staticmethod
-    def loop_manager(loop: AbstractEventLoop, loop_ready: Event):
+    def loop_manager(loop: AbstractEventLoop, loop_ready: Event,
+                     get_gather_timeout: Callable[[], Optional[float]] = None):
         """
         Entry point static method for the background thread.
 
         :param loop: The AbstractEventLoop to use to run the event loop.
         :param loop_ready: event notifying that loop is ready for execution.
+        :param get_gather_timeout: Optional function returning the maximum time in seconds
+                    to wait for the tasks still pending once the loop is stopped,
+                    or None to wait for all of them. Default of None always waits for all.
         """
         set_event_loop(loop)
         loop.call_soon(AsyncioExecutor.notify_loop_ready, loop_ready)
@@ -161,13 +275,33 @@ class AsyncioExecutor(TaskExecutor):
         # If we reach here, the loop was stopped.
         # We should gather any remaining tasks and finish them.
         pending = all_tasks(loop=loop)
-        if pending:
+        gather_timeout: Optional[float] = get_gather_timeout() if get_gather_timeout is not None else None
+        if pending and gather_timeout is None:
             # We want all possibly pending tasks to execute -
             # don't need them to raise exceptions.
             loop.run_until_complete(gather(*pending, return_exceptions=True))
+        elif pending:
+            done, still_pending = loop.run_until_complete(wait_for_tasks(pending, timeout=gather_timeout))
+            for task in done:
+                if not task.cancelled():
+                    # Retrieved, so it is not reported as never retrieved
+                    _ = task.exception()
+            if still_pending:
+                getLogger(AsyncioExecutor.__name__).warning(
+                    "Closing event loop with %d tasks still pending after %f sec",
+                    len(still_pending), gather_timeout)
         # Close the event loop to free its related resources
         loop.close()
 
+    def _get_final_gather_timeout(self) -> Optional[float]:
+        """
+        :return: The maximum time in seconds for the event loop thread to wait for
+                 the tasks still pending once the loop is stopped, or None for no limit
+        """
+        if self._final_gather_deadline is None:
+            return None
+        return max(0.0, self._final_gather_deadline - monotonic())
+
     @staticmethod
     def loop_exception_handler(loop: AbstractEventLoop, context: Dict[str, Any]):
         """
@@ -175,7 +309,7 @@ class AsyncioExecutor(TaskExecutor):
 
         DEF - I believe this exception handler is for exceptions that happen in
               the event loop itself, *not* the submit()-ed coroutines.
-              Exceptions from the coroutines are handled by submission_done() below.
+              Exceptions from the coroutines are handled by _report_outcome() below.
 
         :param loop: The asyncio event loop
         :param context: A context dictionary described here:
@@ -205,40 +339,302 @@ class AsyncioExecutor(TaskExecutor):
             function_name = f"{submitter_id}:{function_name}"
         return function_name
 
+    def _check_can_submit(self):
+        """
+        Raise RuntimeError if new tasks cannot be submitted to this executor.
+        """
+        if self._shutdown:
+            raise RuntimeError("Cannot schedule new tasks after shutdown")
+
+        if not self._loop.is_running():
+            raise RuntimeError("Loop must be started before any function can "
+                               "be submitted")
+
     def _in_executor_thread(self) -> bool:
         """
         :return: True if we are currently executing in the event loop thread.
         """
         return get_ident() == self._thread.ident
 
-    def _create_in_loop_thread(
-            self, function, task_name: str, task_creation_future: futures.Future, /, *args, **kwargs) -> None:
+    def _call_in_loop_thread(self, function: Callable[[], None]) -> None:
+        """
+        Call the function right away if we are already in the event loop thread,
+        otherwise schedule it to be called there without waiting for it.
+        :param function: The no-argument function to call
+        """
+        if self._in_executor_thread():
+            function()
+        else:
+            self._loop.call_soon_threadsafe(function)
+
+    def _schedule_in_loop_thread(self, priority: int, function: Callable[[], None]) -> None:
+        """
+        Call the function right away if we are already in the event loop thread,
+        otherwise queue it to be called there in priority order, without waiting for it.
+        :param priority: The TaskPriority of the work the function creates
+        :param function: The no-argument function to call
+        """
+        if self._in_executor_thread():
+            function()
+        elif self._priority_queue.put(priority, function):
+            self._loop.call_soon_threadsafe(self._run_priority_queue)
+
+    def _run_priority_queue(self) -> None:
+        """
+        Run the functions queued by _schedule_in_loop_thread(). Called in the event loop thread.
+        """
+        if self._priority_queue.run():
+            # More left: let other ready callbacks have a turn first.
+            self._loop.call_soon(self._run_priority_queue)
+
+    def _create_in_loop_thread(self, function, task_name: str, task_creation_future: futures.Future,
+                               record: TaskRecord, /, *args, **kwargs) -> None:
         """
         Create a task in the event loop thread and set it as a result on the provided Future.
         :param function: The function handle to run
         :param task_name: The name to assign to the task
         :param task_creation_future: The Future to set result/exception on
+        :param record: The TaskRecord for the task, see _new_task_record()
         :param /: Positional or keyword arguments.
             See https://realpython.com/python-asterisk-and-slash-special-parameters/
         :param args: args for the function
         :param kwargs: keyword args for the function
         """
+        if not task_creation_future.set_running_or_notify_cancel():
+            # Caller gave up before we got around to creating the task.
+            AsyncioExecutor._close_if_coroutine(function)
+            self._release_admission(record)
+            return
         try:
-            if isawaitable(function):
-                task = self._loop.create_task(function, name=task_name)
-            elif iscoroutinefunction(function):
-                # function is async def -> create task for its coroutine
-                coro = function(*args, **kwargs)
-                task = self._loop.create_task(coro, name=task_name)
-            else:
-                # function is sync -> run it in a worker thread, but task lives in event loop
-                func = partial(function, *args, **kwargs)
-                task = self._loop.create_task(to_thread(func), name=task_name)
+            task: Task = self._new_task(function, task_name, record, *args, **kwargs)
             task_creation_future.set_result(task)
         except BaseException as exc:  # pylint: disable=broad-except
             task_creation_future.set_exception(exc)
 
-    def _submit_as_task(self, submitter_id: str, function, /, *args, **kwargs) -> futures.Future:
+    def _new_task(self, function, task_name: str, record: TaskRecord, /, *args, **kwargs) -> Task:
+        """
+        Create a task in our event loop. Must be called from the event loop thread.
+        :param function: The function handle (or awaitable) to run
+        :param task_name: The name to assign to the task
+        :param record: The TaskRecord for the task, see _new_task_record().
+                    Any admission held for the task is released when the task
+                    is done, or right away if the task cannot be created.
+                    The task is tracked in the background tasks table until it is done.
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param kwargs: keyword args for the function
+        :return: The newly created Task
+        """
+        if self._draining:
+            AsyncioExecutor._close_if_coroutine(function)
+            self._release_admission(record)
+            raise RuntimeError("Cannot schedule new tasks after shutdown")
+        # A rate limited task starts once its start delay is over
+        start_delay: float = self._rate_limiter.reserve(record.submitter_id)
+        record.started_at = monotonic() + start_delay
+        try:
+            task: Task = self._make_task(function, task_name, start_delay, *args, **kwargs)
+        except BaseException:
+            self._release_admission(record)
+            raise
+        record.task = task
+        if record.admission_ticket is not None:
+            self._admission_controller.attach(record.admission_ticket, partial(self._shed_task, task))
+        self._unfinished_by_priority[record.priority] += 1
+        if record.deadline is not None:
+            self._deadlines.add(record)
+        # Weak references in the asyncio system can cause tasks to disappear
+        # before they execute.  Hold a reference in the table as per
+        # https://docs.python.org/3/library/asyncio-task.html#creating-tasks
+        with self._background_tasks_lock:
+            self._background_tasks[id(task)] = record
+        task.add_done_callback(partial(self._task_done, record))
+        return task
+
+    def _make_task(self, function, task_name: str, start_delay: float, /, *args, **kwargs) -> Task:
+        """
+        Create a task in our event loop. Must be called from the event loop thread.
+        :param function: The function handle (or awaitable) to run
+        :param task_name: The name to assign to the task
+        :param start_delay: Seconds the task has to wait in the event loop
+                    before running the function, as per our rate limits
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param kwargs: keyword args for the function
+        :return: The newly created Task
+        """
+        if isawaitable(function):
+            coro = function
+        elif iscoroutinefunction(function):
+            # function is async def -> create task for its coroutine
+            coro = function(*args, **kwargs)
+        elif self._process_pool_executor is not None and AsyncioProcessPoolExecutor.is_cpu_bound(function):
+            # function is sync and CPU-bound -> run it in a worker process, but task lives in event loop
+            coro = self._run_in_process(partial(function, *args, **kwargs))
+        else:
+            # function is sync -> run it in a worker thread, but task lives in event loop
+            coro = to_thread(partial(function, *args, **kwargs))
+        if start_delay > 0.0:
+            coro = AsyncioExecutor._start_after(start_delay, coro)
+        return self._loop.create_task(coro, name=task_name)
+
+    @staticmethod
+    async def _start_after(start_delay: float, awaitable: Awaitable) -> Any:
+        """
+        :param start_delay: Seconds to wait before awaiting the awaitable
+        :param awaitable: The awaitable to run once the delay is over
+        :return: The result of the awaitable
+        """
+        try:
+            await sleep(start_delay)
+        except CancelledError:
+            AsyncioExecutor._close_if_coroutine(awaitable)
+            raise
+        return await awaitable
+
+    async def _run_in_process(self, func: Callable) -> Any:
+        """
+        :param func: A picklable no-argument callable
+        :return: The result of calling func in our process pool
+        """
+        return await self._loop.run_in_executor(self._process_pool_executor, func)
+
+    def _create_nowait_in_loop_thread(self, function, task_name: str, result_future: futures.Future,
+                                      record: TaskRecord, /, *args, **kwargs) -> None:
+        """
+        Create and track a task in the event loop thread,
+        chaining its eventual outcome to the provided result Future.
+        :param function: The function handle to run
+        :param task_name: The name to assign to the task
+        :param result_future: The Future to eventually set result/exception on
+        :param record: The TaskRecord for the task, see _new_task_record()
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param kwargs: keyword args for the function
+        """
+        if result_future.cancelled():
+            # Caller gave up before we got around to creating the task.
+            AsyncioExecutor._close_if_coroutine(function)
+            self._release_admission(record)
+            return
+        try:
+            task: Task = self._new_task(function, task_name, record, *args, **kwargs)
+        except BaseException as exc:  # pylint: disable=broad-except
+            result_future.set_exception(exc)
+            return
+        self._chain_result_future(task, result_future, record)
+
+    def _create_many_in_loop_thread(self, prepared: List[Tuple[Any, str, TaskRecord,
+                                                               Sequence[Any], Dict[str, Any]]],
+                                    batch_future: futures.Future) -> None:
+        """
+        Create and track a batch of tasks in the event loop thread,
+        setting the list of them as a result on the provided Future.
+        Creation is all-or-nothing: if any item fails to create,
+        tasks already created for the batch are cancelled and
+        the exception is set on the Future instead.
+        :param prepared: List of (function, task_name, record, args, kwargs) tuples
+        :param batch_future: The Future to set result/exception on
+        """
+        tasks: List[Task] = []
+        try:
+            for function, task_name, record, args, kwargs in prepared:
+                tasks.append(self._new_task(function, task_name, record, *args, **kwargs))
+        except BaseException as exc:  # pylint: disable=broad-except
+            for task in tasks:
+                task.cancel("batch-creation-failed")
+            for function, _, record, _, _ in prepared[len(tasks) + 1:]:
+                AsyncioExecutor._close_if_coroutine(function)
+                self._release_admission(record)
+            batch_future.set_exception(exc)
+            return
+        batch_future.set_result(tasks)
+
+    def _create_many_nowait_in_loop_thread(self, prepared: List[Tuple[Any, str, TaskRecord,
+                                                                      Sequence[Any], Dict[str, Any]]],
+                                           result_futures: List[futures.Future]) -> None:
+        """
+        Create and track a batch of tasks in the event loop thread,
+        chaining the eventual outcome of each to its own result Future.
+        An item which fails to create only fails its own result Future.
+        :param prepared: List of (function, task_name, record, args, kwargs) tuples
+        :param result_futures: List of Futures, one per item in prepared
+        """
+        created: List[TaskRecord] = []
+        chained: List[futures.Future] = []
+        for (function, task_name, record, args, kwargs), result_future in zip(prepared, result_futures):
+            if result_future.cancelled():
+                AsyncioExecutor._close_if_coroutine(function)
+                self._release_admission(record)
+                continue
+            try:
+                self._new_task(function, task_name, record, *args, **kwargs)
+                created.append(record)
+                chained.append(result_future)
+            except BaseException as exc:  # pylint: disable=broad-except
+                result_future.set_exception(exc)
+        for record, result_future in zip(created, chained):
+            self._chain_result_future(record.task, result_future, record)
+
+    def _chain_result_future(self, task: Task, result_future: futures.Future,
+                             record: TaskRecord = None) -> None:
+        """
+        Chain the outcome of a Task in our event loop to a thread-safe Future,
+        and cancellation of that Future back to the Task.
+        Must be called from the event loop thread.
+        :param task: The Task whose outcome is to be reported
+        :param result_future: The concurrent.futures.Future to report it on
+        :param record: The TaskRecord for the task, if known.
+                    Used to report a task which timed out as a TimeoutError.
+        """
+        task.add_done_callback(partial(AsyncioExecutor._copy_task_outcome, result_future, record))
+        result_future.add_done_callback(partial(self._propagate_cancel, task))
+
+    @staticmethod
+    def _copy_task_outcome(result_future: futures.Future, record: Optional[TaskRecord], task: Task) -> None:
+        """
+        Intended as a "done_callback" on a Task: copy its outcome to a thread-safe Future.
+        :param result_future: The concurrent.futures.Future to set the outcome on
+        :param record: The TaskRecord for the task, if known
+        :param task: The Task which has completed
+        """
+        if result_future.done():
+            return
+        try:
+            if task.cancelled():
+                # A task which got past the cancellation at its deadline keeps its real outcome
+                if record is not None and record.timed_out:
+                    result_future.set_exception(futures.TimeoutError(f"Task {task.get_name()} timed out"))
+                else:
+                    result_future.cancel()
+            elif task.exception() is not None:
+                result_future.set_exception(task.exception())
+            else:
+                result_future.set_result(task.result())
+        except futures.InvalidStateError:
+            # Future was cancelled by its owner from another thread in the meantime.
+            pass
+
+    def _propagate_cancel(self, task: Task, result_future: futures.Future) -> None:
+        """
+        Intended as a "done_callback" on a thread-safe Future:
+        cancel the Task in our event loop if the Future was cancelled.
+        Can be called from any thread.
+        :param task: The Task to cancel
+        :param result_future: The concurrent.futures.Future which has completed
+        """
+        if not result_future.cancelled() or task.done():
+            return
+        try:
+            self._loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            # Event loop is already closed, nothing left to cancel.
+            pass
+
+    def _submit_as_task(self, record: TaskRecord, function, /, *args, **kwargs) -> futures.Future:
         """
         Submit some executable item as a Task in executor event loop.
         If call is from the outside of AsyncioExecutor running thread,
@@ -248,19 +644,19 @@ class AsyncioExecutor(TaskExecutor):
         If call is from the inside of AsyncioExecutor running thread, we can just create the Task directly
         and set it as a result on the Future we will return to the caller.
 
-        :param submitter_id: A string id denoting who is doing the submitting.
+        :param record: The TaskRecord for the task, see _new_task_record()
         :param function: The function handle to run
         :param /: Positional or keyword arguments.
             See https://realpython.com/python-asterisk-and-slash-special-parameters/
         :param args: args for the function
         :param kwargs: keyword args for the function
-        :return: A Future object which will return a created Task in our event loop.
+        :return: A Future object which will return a created Task in our event loop
         """
         task_creation_future: futures.Future = futures.Future()
-        task_name: str = self.get_function_name(function, submitter_id)
+        task_name: str = self.get_function_name(function, record.submitter_id)
         if self._in_executor_thread():
             # We are already in the event loop thread:
-            self._create_in_loop_thread(function, task_name, task_creation_future, *args, **kwargs)
+            self._create_in_loop_thread(function, task_name, task_creation_future, record, *args, **kwargs)
             # We should have already set the result on the task_creation_future, so just return it:
             return task_creation_future
 
@@ -269,13 +665,153 @@ class AsyncioExecutor(TaskExecutor):
         # Construct a partial function to create the task:
         creation_function = partial(self._create_in_loop_thread,
                                     function, task_name,
-                                    task_creation_future,
+                                    task_creation_future, record,
                                     *args, **kwargs)
-        # Ensure task is created in the event loop thread
-        self._loop.call_soon_threadsafe(creation_function)
+        # Ensure task is created in the event loop thread, in order of priority
+        self._schedule_in_loop_thread(record.priority, creation_function)
         return task_creation_future
 
-    def submit(self, submitter_id: str, function, /, *args, **kwargs) -> Task:
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _new_task_record(self, submitter_id: str, function,
+                         admission_ticket: Optional[AdmissionTicket] = None,
+                         priority: int = None, timeout: float = None) -> TaskRecord:
+        """
+        Start the bookkeeping for a submission on the caller's side,
+        getting admission for it from our AdmissionController, if any.
+        Callers on the event loop thread never block waiting for admission.
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param function: The function handle (or awaitable) being submitted
+        :param admission_ticket: An AdmissionTicket already acquired for the submission, if any
+        :param priority: The TaskPriority of the submission. Default of None implies NORMAL.
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout.
+        :return: A TaskRecord which follows the task to the event loop thread.
+        """
+        priority = TaskPriority.resolve(priority)
+        AsyncioExecutor._check_timeout(function, timeout)
+        if admission_ticket is None and self._admission_controller is not None:
+            try:
+                admission_ticket = self._admission_controller.acquire(submitter_id,
+                                                                      block=not self._in_executor_thread(),
+                                                                      priority=priority)
+            except TaskRejectedException:
+                AsyncioExecutor._close_if_coroutine(function)
+                raise
+        record = TaskRecord(submitter_id, priority, admission_ticket, monotonic())
+        if timeout is not None:
+            record.deadline = record.submitted_at + timeout
+        return record
+
+    @staticmethod
+    def _check_timeout(function, timeout: float):
+        """
+        Raise ValueError for a negative timeout, before any admission is taken for the submission.
+        :param function: The function handle (or awaitable) being submitted
+        :param timeout: Seconds after submission at which to cancel the task, or None
+        """
+        if timeout is not None and timeout < 0:
+            AsyncioExecutor._close_if_coroutine(function)
+            raise ValueError(f"timeout must not be negative, got {timeout}")
+
+    def _new_task_records(self, submitter_id: str, submissions: Sequence[Tuple[Any, Sequence[Any], Dict[str, Any]]],
+                          priority: int = None, timeout: float = None) -> List[TaskRecord]:
+        """
+        Start the bookkeeping for a batch of submissions.
+        Admission is all or nothing.
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param submissions: A sequence of (function, args, kwargs) tuples
+        :param priority: The TaskPriority of the submissions. Default of None implies NORMAL.
+        :param timeout: Seconds after submission at which to cancel each task.
+                    Default of None implies no timeout.
+        :return: A list of TaskRecords, one per submission
+        """
+        records: List[TaskRecord] = []
+        try:
+            for function, _, _ in submissions:
+                records.append(self._new_task_record(submitter_id, function, priority=priority, timeout=timeout))
+        except (TaskRejectedException, ValueError):
+            for record in records:
+                self._release_admission(record)
+            for function, _, _ in submissions:
+                AsyncioExecutor._close_if_coroutine(function)
+            raise
+        return records
+
+    def _release_admission(self, record: TaskRecord):
+        """
+        Release any AdmissionTicket held for a submission.
+        :param record: The TaskRecord for the task
+        """
+        if record.admission_ticket is not None:
+            self._admission_controller.release(record.admission_ticket)
+
+    def _task_done(self, record: TaskRecord, task: Task):
+        """
+        Intended as the one "done_callback" on every task we create:
+        untrack it, finish its bookkeeping and report its outcome.
+        Runs even for tasks which are no longer in the background tasks table.
+        :param record: The TaskRecord for the task
+        :param task: The Task which has completed
+        """
+        self._untrack_task(task)
+        self._task_finished(record, task)
+        self._report_outcome(task, record)
+
+    def _task_finished(self, record: TaskRecord, task: Task):
+        """
+        Release the admission of a task we created, and record its timings.
+        :param record: The TaskRecord for the task
+        :param task: The Task which has completed
+        """
+        finished_at: float = monotonic()
+        if task.cancelled() and record.started_at > finished_at:
+            # Cancelled while waiting for its rate limited start
+            self._rate_limiter.refund(record.submitter_id)
+        self._unfinished_by_priority[record.priority] -= 1
+        if self._yield_waiters:
+            self._wake_yield_waiters()
+        if record.deadline is not None:
+            self._deadlines.finished(record)
+        self._release_admission(record)
+
+        outcome: str = TaskMetrics.OUTCOME_OK
+        if task.cancelled():
+            outcome = TaskMetrics.OUTCOME_TIMEOUT if record.timed_out else TaskMetrics.OUTCOME_CANCELLED
+        elif task.exception() is not None and not isinstance(task.exception(), StopAsyncIteration):
+            outcome = TaskMetrics.OUTCOME_ERROR
+        self._task_metrics.record(record.submitter_id, outcome,
+                                  record.submitted_at, min(record.started_at, finished_at), finished_at)
+
+    @staticmethod
+    def _expire_task(record: TaskRecord):
+        """
+        Cancel a task whose deadline has passed. Called from the event loop thread.
+        :param record: The TaskRecord for the task
+        """
+        record.task.cancel("timeout")
+
+    def _shed_task(self, task: Task):
+        """
+        Cancel a task shed by our AdmissionController. Can be called from any thread.
+        :param task: The Task to cancel
+        """
+        try:
+            self._loop.call_soon_threadsafe(task.cancel, "shed-oldest")
+        except RuntimeError:
+            # Event loop is already closed, nothing left to cancel.
+            pass
+
+    @staticmethod
+    def _close_if_coroutine(function):
+        """
+        Close a coroutine object which will never be run,
+        to avoid "coroutine was never awaited" warnings.
+        """
+        if iscoroutine(function):
+            function.close()
+
+    def submit(self, submitter_id: str, function, /, *args, priority: int = None, timeout: float = None,
+               **kwargs) -> Task:
         """
         Submit a function to be run in the asyncio event loop.
 
@@ -284,48 +820,357 @@ class AsyncioExecutor(TaskExecutor):
         :param /: Positional or keyword arguments.
             See https://realpython.com/python-asterisk-and-slash-special-parameters/
         :param args: args for the function
+        :param priority: The TaskPriority of the task. Default of None implies NORMAL.
+                    Note this is keyword-only and is not passed on to the function.
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout.
+                    Note this is keyword-only and is not passed on to the function.
         :param kwargs: keyword args for the function
         :return: An asyncio.Task that corresponds to the submitted task
         """
-        if self._shutdown:
-            raise RuntimeError("Cannot schedule new tasks after shutdown")
-
-        if not self._loop.is_running():
-            raise RuntimeError("Loop must be started before any function can "
-                               "be submitted")
+        self._check_can_submit()
 
         # The execution logic here looks like this:
         # Call the helper method -> get a Future back ->
         # block until task submitted to internal event loop runs and creates our Task ->
         # get this Task as a result of Future happening.
-        task_creation_future: futures.Future = self._submit_as_task(submitter_id, function, *args, **kwargs)
+        record: TaskRecord = self._new_task_record(submitter_id, function, priority=priority, timeout=timeout)
+        task_creation_future: futures.Future = self._submit_as_task(record, function, *args, **kwargs)
         # Wait for task to be created in event loop thread (blocking calling thread)
         task: Task = task_creation_future.result()
+        return task
+
+    def submit_nowait(self, submitter_id: str, function, /, *args, priority: int = None,
+                      timeout: float = None, **kwargs) -> futures.Future:
+        """
+        Submit a function to be run in the asyncio event loop
+        without waiting for the corresponding Task to be created.
+
+        Unlike submit(), a call from outside the event loop thread
+        does not block on a round trip to the event loop:
+        task creation is scheduled and a thread-safe Future
+        for the eventual result of the function is returned right away.
+        The Task itself is tracked in the background tasks table as usual.
+        Cancelling the returned Future cancels the Task.
+
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param function: The function handle to run
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param priority: The TaskPriority of the task. Default of None implies NORMAL.
+                    Note this is keyword-only and is not passed on to the function.
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout.
+                    Note this is keyword-only and is not passed on to the function.
+        :param kwargs: keyword args for the function
+        :return: A concurrent.futures.Future which will hold the result
+                 (or exception) of the submitted function.
+                 A task which timed out raises TimeoutError from it.
+        """
+        self._check_can_submit()
+
+        record: TaskRecord = self._new_task_record(submitter_id, function, priority=priority, timeout=timeout)
+        result_future: futures.Future = futures.Future()
+        task_name: str = self.get_function_name(function, submitter_id)
+        creation_function = partial(self._create_nowait_in_loop_thread,
+                                    function, task_name,
+                                    result_future, record,
+                                    *args, **kwargs)
+        self._schedule_in_loop_thread(record.priority, creation_function)
+        return result_future
+
+    def submit_and_wait(self, submitter_id: str, function, /, *args, timeout: float = None,
+                        priority: int = None, **kwargs) -> Any:
+        """
+        Submit a function to be run in the asyncio event loop
+        and synchronously wait for its result.
+
+        Intended for synchronous callers on other threads.
+        The wait is on a thread-safe Future chained to the Task's completion,
+        so there is no polling.  As with the other submit methods, the timeout
+        is the Task's own deadline: the Task is cancelled when it is reached,
+        which also ends the wait.
+
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param function: The function handle to run
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout, and waiting forever.
+                    Note this is keyword-only and is not passed on to the function.
+        :param priority: The TaskPriority of the task. Default of None implies NORMAL.
+                    Note this is keyword-only and is not passed on to the function.
+        :param kwargs: keyword args for the function
+        :return: The result of the function.
+                 Any exception raised by the function is raised here.
+                 TimeoutError is raised if the timeout is reached, and
+                 CancelledError is raised if the Task was cancelled.
+        """
+        self._check_can_submit()
+        if self._in_executor_thread():
+            raise RuntimeError("submit_and_wait() would deadlock when called from the event loop thread")
+
+        result_future: futures.Future = self.submit_nowait(submitter_id, function, *args,
+                                                           priority=priority, timeout=timeout, **kwargs)
+        # The task's deadline settles the Future with TimeoutError, if need be.
+        return result_future.result()
+
+    # pylint: disable=too-many-arguments
+    def submit_coalesced(self, submitter_id: str, key: Hashable, function, /, *args, ttl: float = None,
+                         priority: int = None, timeout: float = None, **kwargs) -> futures.Future:
+        """
+        Submit an idempotent function to be run in the asyncio event loop,
+        coalescing it with identical submissions by key: while a task for the key
+        is in flight, further submissions with the same key get its result
+        instead of starting new tasks, and their function and arguments are ignored.
 
-        self.track_task(task)
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param key: A hashable key identifying the work, for instance ("model-metadata", model_id).
+                    Keys are shared by all submitters of this executor.
+        :param function: The function handle to run
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param ttl: Seconds for which a successful result is also reused
+                    after the task is done. Default of None implies
+                    only sharing tasks in flight.
+                    Note this is keyword-only and is not passed on to the function.
+        :param priority: The TaskPriority of a new task. Default of None implies NORMAL.
+                    Note this is keyword-only and is not passed on to the function.
+        :param timeout: Seconds after submission at which to cancel a new task.
+                    Default of None implies no timeout.
+                    Note this is keyword-only and is not passed on to the function.
+        :param kwargs: keyword args for the function
+        :return: A concurrent.futures.Future, specific to this call, which will hold
+                 the result (or exception) of the shared task. Cancelling it
+                 does not cancel the shared task.
+        """
+        self._check_can_submit()
+        result_future, started = self._single_flight.do(
+            key, partial(self.submit_nowait, submitter_id, function, *args,
+                         priority=priority, timeout=timeout, **kwargs), ttl)
+        if not started:
+            AsyncioExecutor._close_if_coroutine(function)
+        return result_future
+
+    def forget_coalesced(self, key: Hashable):
+        """
+        Stop reusing the result for a key given to submit_coalesced(),
+        so that the next submission with the key starts a new task.
+        :param key: The key identifying the work
+        """
+        self._single_flight.forget(key)
+
+    def get_coalescing_metrics(self) -> Dict[str, Any]:
+        """
+        Get metrics of submit_coalesced(): the number of submissions which joined
+        a task in flight ("hits"), reused a result within its ttl ("cached_hits"),
+        or started a new task ("misses"), and the number of keys
+        with a task "in_flight" and with a "cached" result right now.
+        :return: A dictionary of coalescing metrics
+        """
+        return self._single_flight.get_metrics()
+
+    def set_rate_limit(self, submitter_id: str, rate: float, burst: float = None):
+        """
+        Limit the rate at which tasks from a submitter start, replacing any previous limit.
+        Tasks over the limit are still created right away, but wait inside
+        the event loop before starting, so neither the submitting threads
+        nor other submitters are held back.
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param rate: Maximum average number of task starts per second
+        :param burst: Maximum number of task starts at once.
+                    Default of None implies max(1, rate).
+        """
+        self._rate_limiter.set_policy(submitter_id, rate, burst)
+
+    def remove_rate_limit(self, submitter_id: str):
+        """
+        Stop limiting the rate at which tasks from a submitter start.
+        Tasks already waiting to start are not affected.
+        :param submitter_id: A string id denoting who is doing the submitting.
+        """
+        self._rate_limiter.remove_policy(submitter_id)
+
+    def get_rate_limit_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-submitter rate limit metrics: for each submitter_id with a rate limit,
+        its "rate" and "burst", the number of tasks "started", how many of those
+        were "throttled", and the total and maximum time tasks waited
+        ("throttled_seconds", "max_throttled_seconds"). A task cancelled before
+        it started gives back its place in the rate limit, and is counted as "refunded".
+        :return: A dictionary of rate limit metrics keyed by submitter_id
+        """
+        return self._rate_limiter.get_metrics()
+
+    def submit_group(self, submitter_id: str) -> ExecutorTaskGroup:
+        """
+        Start a group of tasks which can be waited on and cancelled together,
+        without affecting any other tasks of this executor.
+
+        :param submitter_id: A string id denoting who is doing the submitting,
+                    used for all the tasks of the group.
+        :return: An ExecutorTaskGroup to submit the tasks of the group through
+        """
+        self._check_can_submit()
+        return ExecutorTaskGroup(self, submitter_id)
+
+    def get_result_future(self, task: Task) -> futures.Future:
+        """
+        Bridge a Task in our event loop to synchronous callers on other threads.
+
+        Safe to call from any thread, including the event loop thread.
+        The returned Future supports result(timeout) like any
+        concurrent.futures.Future, and cancelling it cancels the Task.
+
+        :param task: A Task bound to our event loop, such as those
+                    returned by submit() or create_task().
+        :return: A thread-safe concurrent.futures.Future which will hold
+                 the result (or exception) of the Task
+        """
+        result_future: futures.Future = futures.Future()
+        self._call_in_loop_thread(partial(self._chain_result_future, task, result_future))
+        return result_future
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def submit_many(self, submitter_id: str,
+                    submissions: Sequence[Tuple[Any, Sequence[Any], Dict[str, Any]]],
+                    result_futures: bool = False, priority: int = None, timeout: float = None) -> List[Any]:
+        """
+        Submit a batch of functions to be run in the asyncio event loop.
+
+        All the tasks are created in a single event loop callback
+        and registered in the background tasks table under a single lock
+        acquisition, instead of paying one loop wakeup and one blocking
+        handoff per item as repeated calls to submit() would.
+
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param submissions: A sequence of (function, args, kwargs) tuples,
+                    one per task to submit. args and kwargs may be None.
+        :param result_futures: When False (the default), block once for
+                    the whole batch to be created and return the list of
+                    asyncio.Tasks. Creation is all-or-nothing: if any item
+                    fails to create, the rest are cancelled and the exception
+                    is raised here.
+                    When True, do not block on creation: return a list of thread-safe
+                    concurrent.futures.Futures for the eventual results,
+                    as submit_nowait() does for a single function.
+                    With an AdmissionController, admission is all-or-nothing
+                    for the batch.
+        :param priority: The TaskPriority of all the tasks. Default of None implies NORMAL.
+        :param timeout: Seconds after submission at which to cancel each task.
+                    Default of None implies no timeout.
+        :return: A list of Tasks or result Futures, in the order of submissions
+        """
+        self._check_can_submit()
+
+        records: List[TaskRecord] = self._new_task_records(submitter_id, submissions, priority, timeout)
+        prepared: List[Tuple[Any, str, TaskRecord, Sequence[Any], Dict[str, Any]]] = []
+        for (function, args, kwargs), record in zip(submissions, records):
+            task_name: str = self.get_function_name(function, submitter_id)
+            prepared.append((function, task_name, record, args or (), kwargs or {}))
+
+        if result_futures:
+            returned: List[futures.Future] = [futures.Future() for _ in prepared]
+            self._schedule_in_loop_thread(TaskPriority.resolve(priority),
+                                          partial(self._create_many_nowait_in_loop_thread, prepared, returned))
+            return returned
+
+        batch_future: futures.Future = futures.Future()
+        self._schedule_in_loop_thread(TaskPriority.resolve(priority),
+                                      partial(self._create_many_in_loop_thread, prepared, batch_future))
+        # Wait once for the whole batch to be created (blocking calling thread)
+        return batch_future.result()
+
+    async def submit_async(self, submitter_id: str, function, /, *args, priority: int = None,
+                           timeout: float = None, **kwargs) -> Task:
+        """
+        Submit a function to be run in the asyncio event loop
+        from a coroutine running on any event loop, including our own.
+
+        Same as submit(), except that waiting for admission and for task
+        creation does not block the caller's event loop.
+
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param function: The function handle to run
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param priority: The TaskPriority of the task. Default of None implies NORMAL.
+                    Note this is keyword-only and is not passed on to the function.
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout.
+                    Note this is keyword-only and is not passed on to the function.
+        :param kwargs: keyword args for the function
+        :return: An asyncio.Task bound to our event loop that corresponds to the submitted task
+        """
+        self._check_can_submit()
+
+        priority = TaskPriority.resolve(priority)
+        AsyncioExecutor._check_timeout(function, timeout)
+        ticket: Optional[AdmissionTicket] = None
+        if self._admission_controller is not None:
+            try:
+                ticket = await self._admission_controller.acquire_async(submitter_id, priority)
+            except TaskRejectedException:
+                AsyncioExecutor._close_if_coroutine(function)
+                raise
+
+        record: TaskRecord = self._new_task_record(submitter_id, function, ticket, priority, timeout)
+        task_creation_future: futures.Future = futures.Future()
+        task_name: str = self.get_function_name(function, submitter_id)
+        self._schedule_in_loop_thread(priority, partial(self._create_in_loop_thread,
+                                                        function, task_name,
+                                                        task_creation_future, record,
+                                                        *args, **kwargs))
+        try:
+            task: Task = await wrap_future(task_creation_future)
+        except CancelledError:
+            # Creation may already be under way: nobody will see that task, so cancel it once created.
+            task_creation_future.add_done_callback(self._cancel_abandoned_task)
+            raise
         return task
 
-    def create_task(self, awaitable: Awaitable, submitter_id: str, raise_exception: bool = False) -> Future:
+    def _cancel_abandoned_task(self, task_creation_future: futures.Future):
+        """
+        Intended as a "done_callback" on the task creation Future of a submit_async()
+        whose caller was cancelled: cancel the task, if one got created.
+        :param task_creation_future: The Future which the created Task was set on, if any
+        """
+        if task_creation_future.cancelled() or task_creation_future.exception() is not None:
+            return
+        task: Task = task_creation_future.result()
+        try:
+            self._loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            # Event loop is already closed, nothing left to cancel.
+            pass
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def create_task(self, awaitable: Awaitable, submitter_id: str, raise_exception: bool = False,
+                    priority: int = None, timeout: float = None) -> Future:
         """
         Creates a task for the event loop given an Awaitable
         :param awaitable: The Awaitable to create and schedule a task for
         :param submitter_id: A string id denoting who is doing the submitting.
         :param raise_exception: True if exceptions are to be raised in the executor.
                     Default is False.
+        :param priority: The TaskPriority of the task. Default of None implies NORMAL.
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout.
         :return: The Task object bound to our event loop
         """
-        if self._shutdown:
-            raise RuntimeError("Cannot schedule new tasks after shutdown")
-
-        if not self._loop.is_running():
-            raise RuntimeError("Loop must be started before any function can "
-                               "be submitted")
+        self._check_can_submit()
 
+        record: TaskRecord = self._new_task_record(submitter_id, awaitable, priority=priority, timeout=timeout)
+        # Set before the task is created, as it can be done before we get it back
+        record.raise_exception = raise_exception
         # self._submit_as_task will handle the logic of whether we are in the event loop thread or not.
-        task_creation_future: futures.Future = self._submit_as_task(submitter_id, awaitable)
+        task_creation_future: futures.Future = self._submit_as_task(record, awaitable)
         # Wait for task to be created and returned as the result of the Future (blocking calling thread)
         task: Task = task_creation_future.result()
-        self.track_task(task, raise_exception=raise_exception)
         return task
 
     def track_task(self, task: Task, raise_exception: bool = False):
@@ -334,17 +1179,14 @@ class AsyncioExecutor(TaskExecutor):
         :param raise_exception: True if exceptions are to be raised in the executor.
                     Default is False.
         """
-
+        record = TaskRecord(task=task)
+        record.raise_exception = raise_exception
         # Weak references in the asyncio system can cause tasks to disappear
-        # before they execute.  Hold a reference in a global as per
+        # before they execute.  Hold a reference in the table as per
         # https://docs.python.org/3/library/asyncio-task.html#creating-tasks
-
-        task_info_dict: Dict[str, Any] = {
-            "task": task,
-            "raise_exception": raise_exception
-        }
-        task_id = id(task)
-        self._background_tasks[task_id] = task_info_dict
+        with self._background_tasks_lock:
+            self._background_tasks[id(task)] = record
+        # Registered first, so the table is up to date by the time the callback runs
         task.add_done_callback(self.submission_done)
         return task
 
@@ -373,11 +1215,11 @@ class AsyncioExecutor(TaskExecutor):
             # Clear the background tasks map
             # and allow next tasks (if any) to be added.
             # Currently present tasks will be cancelled below.
-            background_tasks_save: Dict[int, Dict[str, Any]] = self._background_tasks
+            background_tasks_save: Dict[int, TaskRecord] = self._background_tasks
             self._background_tasks = {}
 
-        for task_dict in background_tasks_save.values():
-            task: Task = task_dict.get("task", None)
+        for record in background_tasks_save.values():
+            task: Task = record.task
             if task and not task.done():
                 tasks_to_cancel.append(task)
         cancel_task = run_coroutine_threadsafe(AsyncioExecutor._cancel_and_drain(tasks_to_cancel), self._loop)
@@ -401,36 +1243,52 @@ class AsyncioExecutor(TaskExecutor):
             # We only register this callback on Tasks, so this is unexpected.
             raise RuntimeError(f"Future {task_id} is expected to be Task.")
 
-        origination: str = task.get_name()
-        if task_id not in self._background_tasks:
+    def _untrack_task(self, task: Task) -> Optional[TaskRecord]:
+        """
+        Remove a task from the table we use to keep its reference around.
+        :param task: The Task which has completed
+        :return: The TaskRecord the task was tracked with,
+                 or None if it is not in the table.
+        """
+        task_id: int = id(task)
+        with self._background_tasks_lock:
+            record: Optional[TaskRecord] = self._background_tasks.pop(task_id, None)
+        if record is None:
             # That could happen if the task is being cancelled by us,
             # and background tasks table is already cleared.
-            self.logger.info("Task %s/%s is not present in the tasks table.", task_id, origination)
+            self.logger.info("Task %s/%s is not present in the tasks table.", task_id, task.get_name())
+        return record
 
     def submission_done(self, task: Task):
         """
-        Intended as a "done_callback" method on tasks created by submit() above.
+        Intended as a "done_callback" method on tasks given to track_task() above.
         Does some processing on a task that has been marked as done
         (for whatever reason).
 
         :param task: The Task which has completed
         """
 
-        # Get a dictionary entry describing some metadata about the future itself.
-        task_id: int = id(task)
-        empty: Dict[str, Any] = {}
-        task_info: Dict[str, Any] = self._background_tasks.get(task_id, empty)
-
         self._check_task(task)
-        origination: str = task.get_name()
 
+        # Get the record describing some metadata about the task itself.
+        record: Optional[TaskRecord] = self._untrack_task(task)
+        self._report_outcome(task, record)
+
+    def _report_outcome(self, task: Task, record: Optional[TaskRecord]):
+        """
+        Log the outcome of a task which is done, raising its exception
+        if its record asks for it.
+        :param task: The Task which has completed
+        :param record: The TaskRecord the task was tracked with, if any
+        """
+        origination: str = task.get_name()
         try:
             # First see if there was any exception,
             # note that if the task was cancelled,
             # calling task.exception() itself raises CancelledError.
             # But it will be handled below in general exception handler.
             exception = task.exception()
-            if exception is not None and task_info.get("raise_exception"):
+            if exception is not None and record is not None and record.raise_exception:
                 raise exception
 
             # If we want to quietly ignore any possible task exception,
@@ -449,7 +1307,8 @@ class AsyncioExecutor(TaskExecutor):
 
         except CancelledError:
             # Cancelled task is OK - it may happen for different reasons.
-            self.logger.info("Task from %s was cancelled", origination)
+            reason: str = "timed out" if record is not None and record.timed_out else "was cancelled"
+            self.logger.info("Task from %s %s", origination, reason)
 
         # pylint: disable=broad-exception-caught
         except Exception as exc:
@@ -460,11 +1319,6 @@ class AsyncioExecutor(TaskExecutor):
                 sensitive_logger = SensitiveLogger(self.logger)
                 sensitive_logger.info("%s", line)
 
-        # As a last gesture, remove the background task from the map
-        # we use to keep its reference around. Do it safely:
-        with self._background_tasks_lock:
-            self._background_tasks.pop(task_id, None)
-
     def get_threads_metrics(self) -> Tuple[int, int]:
         """
         For ThreadExecutorPool used by our event loop,
@@ -475,6 +1329,115 @@ class AsyncioExecutor(TaskExecutor):
             return self._threadpool_executor.get_threads_metrics()
         return 0, 0
 
+    def get_processes_metrics(self) -> Tuple[int, int]:
+        """
+        For the AsyncioProcessPoolExecutor used for CPU-bound functions, if any,
+        get number of worker processes and number of submitted functions not finished yet.
+         :return: Tuple of (number of processes in the pool, number of unfinished functions)
+        """
+        if self._process_pool_executor:
+            return self._process_pool_executor.get_processes_metrics()
+        return 0, 0
+
+    def get_task_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-submitter task metrics: for each submitter_id, how many tasks
+        finished ("count"), how many of those raised ("errors"), were
+        cancelled ("cancelled") or hit their submission timeout ("timeouts"),
+        and percentiles of the time between submission
+        and start in the event loop ("queue_delay") and of the time between
+        start and finish ("run_time"). See TaskMetrics for details.
+
+        Note that for synchronous functions the run time includes
+        any wait for a free worker thread.
+
+        Cheap enough to be called every few seconds by a metrics scraper.
+        :return: A dictionary of task metrics keyed by submitter_id
+        """
+        return self._task_metrics.get_metrics()
+
+    def get_priority_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get starvation metrics for each TaskPriority, keyed by priority name:
+        "in_flight" tasks not done yet, and, for submissions from other threads,
+        how many are "waiting" to be created, how many have been ("dequeued"),
+        and how many of those waited longer than a second ("starved").
+        Also "queue_wait" and "yield_wait" summaries of the time spent
+        waiting to be created and in yield_to_higher_priority().
+        See PriorityTaskQueue for details.
+        :return: A dictionary of priority metrics keyed by priority name
+        """
+        metrics: Dict[str, Dict[str, Any]] = self._priority_queue.get_metrics()
+        for priority, count in self._unfinished_by_priority.items():
+            metrics[TaskPriority.NAMES[priority]]["in_flight"] = count
+        return metrics
+
+    async def yield_to_higher_priority(self, priority: int = None,
+                                       max_wait: float = DEFAULT_MAX_YIELD_SECONDS):
+        """
+        Cooperative yield for long-running coroutines in our event loop:
+        let other ready tasks run, and if tasks more urgent than the given
+        priority are in flight, wait for them to finish, up to max_wait.
+        Must be awaited from our event loop thread.
+
+        :param priority: The TaskPriority to yield as. Default of None uses the
+                    priority the calling task was submitted with, or LOW
+                    if it was not submitted to this executor.
+        :param max_wait: The maximum time in seconds to wait for more urgent tasks,
+                    which bounds how long the caller can be held up.
+        """
+        if priority is None:
+            with self._background_tasks_lock:
+                record: Optional[TaskRecord] = self._background_tasks.get(id(current_task(self._loop)))
+            priority = record.priority if record is not None else TaskPriority.LOW
+        await sleep(0)
+        if not self._has_more_urgent_unfinished(priority):
+            return
+        waiter: Future = self._loop.create_future()
+        self._yield_waiters.append((priority, waiter))
+        started_at: float = monotonic()
+        try:
+            await wait_for(waiter, max_wait)
+        except TimeoutError:
+            pass
+        finally:
+            if (priority, waiter) in self._yield_waiters:
+                self._yield_waiters.remove((priority, waiter))
+            self._priority_queue.record_yield(priority, monotonic() - started_at)
+
+    def _has_more_urgent_unfinished(self, priority: int) -> bool:
+        """
+        Must be called from the event loop thread.
+        :return: True if any task more urgent than the given priority is not done yet
+        """
+        return any(count > 0 for unfinished_priority, count in self._unfinished_by_priority.items()
+                   if unfinished_priority < priority)
+
+    def _wake_yield_waiters(self):
+        """
+        Wake the coroutines in yield_to_higher_priority() which no longer
+        have more urgent tasks to wait for. Must be called from the event loop thread.
+        """
+        still_waiting: List[Tuple[int, Future]] = []
+        for priority, waiter in self._yield_waiters:
+            if waiter.done():
+                continue
+            if self._has_more_urgent_unfinished(priority):
+                still_waiting.append((priority, waiter))
+            else:
+                waiter.set_result(None)
+        self._yield_waiters = still_waiting
+
+    def get_admission_metrics(self) -> Dict[str, Any]:
+        """
+        Get metrics from the AdmissionController limiting the tasks in flight, if any.
+        See AdmissionController.get_metrics() for the keys.
+        :return: A dictionary of admission metrics, empty if there is no admission control.
+        """
+        if self._admission_controller:
+            return self._admission_controller.get_metrics()
+        return {}
+
     def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
         """
         Shuts down the event loop.
@@ -494,7 +1457,114 @@ class AsyncioExecutor(TaskExecutor):
         # 3. shutdown() joins the finished executor thread and peacefully finishes itself.
         # 4. shutdown() call returns to caller.
         self._shutdown = True
+        if self._stall_watchdog is not None:
+            self._stall_watchdog.unwatch(str(id(self)))
         self._loop.call_soon_threadsafe(self._loop.stop)
         if wait:
             self._thread.join()
         self._thread = None
+
+    def shutdown_gracefully(self, drain_timeout: float, cancel_timeout: float = 5.0,
+                            wait: bool = True) -> Dict[str, Any]:
+        """
+        Shuts down the event loop after draining the tasks in flight.
+
+        New submissions are refused right away, while tasks already in flight,
+        including those given to track_task(), get until drain_timeout to finish.
+        Whatever is still running at that point is cancelled, and reported grouped
+        by submitter_id, which is None for tasks given to track_task().
+        Work queued for worker threads but not yet started is dropped
+        when the drain deadline passes, and the worker threads are not joined.
+        Joining the event loop thread, and its wait for any tasks left,
+        count against the same deadline, so the whole call stays
+        within drain_timeout + cancel_timeout.
+
+        :param drain_timeout: Maximum time in seconds to let tasks in flight finish
+        :param cancel_timeout: Maximum time in seconds to wait for the remaining
+                    tasks to acknowledge their cancellation. Default is 5 seconds.
+        :param wait: True if we should wait (up to cancel_timeout, and no later
+                     than drain_timeout + cancel_timeout after the call)
+                     for the background thread to join up.
+                     False otherwise.  Default is True.
+        :return: A dictionary report of the drain:
+                "completed": number of tasks which finished within drain_timeout,
+                "cancelled": number of tasks cancelled at the deadline,
+                "cancelled_by_submitter": dictionary of submitter_id to the list
+                    of names of its cancelled tasks,
+                "drain_seconds": how long the drain took.
+        """
+        if self._shutdown:
+            raise RuntimeError("Executor is already shut down")
+        self._shutdown = True
+        if self._stall_watchdog is not None:
+            self._stall_watchdog.unwatch(str(id(self)))
+        started_at: float = monotonic()
+        deadline: float = started_at + drain_timeout + cancel_timeout
+        self._final_gather_deadline = deadline
+        report: Dict[str, Any] = {
+            "completed": 0,
+            "cancelled": 0,
+            "cancelled_by_submitter": {},
+            "drain_seconds": 0.0,
+        }
+        if self._loop.is_running() and not self._in_executor_thread():
+            drain_future: futures.Future = run_coroutine_threadsafe(
+                self._drain(drain_timeout, cancel_timeout, report), self._loop)
+            try:
+                drain_future.result(drain_timeout + cancel_timeout)
+            except futures.TimeoutError:
+                self.logger.warning("Timeout %f sec exceeded while draining AsyncioExecutor %s",
+                                    drain_timeout + cancel_timeout, id(self))
+
+        # Let worker threads wind down alongside the event loop thread,
+        # instead of one after the other.
+        self._threadpool_executor.shutdown(wait=False, cancel_futures=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait and self._thread is not None:
+            join_timeout: float = max(0.0, min(cancel_timeout, deadline - monotonic()))
+            self._thread.join(join_timeout)
+            if self._thread.is_alive():
+                self.logger.warning("AsyncioExecutor %s event loop thread did not finish in %f sec",
+                                    id(self), join_timeout)
+        self._thread = None
+
+        report["drain_seconds"] = monotonic() - started_at
+        if report["cancelled"] > 0:
+            self.logger.warning("AsyncioExecutor %s cancelled %d unfinished tasks on shutdown: %s",
+                                id(self), report["cancelled"],
+                                {submitter_id: len(names)
+                                 for submitter_id, names in report["cancelled_by_submitter"].items()})
+        return report
+
+    async def _drain(self, drain_timeout: float, cancel_timeout: float, report: Dict[str, Any]):
+        """
+        Runs in the event loop thread: wait for the unfinished tasks
+        up to drain_timeout, then cancel the rest, filling in the report.
+        :param drain_timeout: Maximum time in seconds to let tasks finish
+        :param cancel_timeout: Maximum time in seconds to wait for cancellations
+        :param report: The report dictionary to fill in, see shutdown_gracefully()
+        """
+        self._draining = True
+        with self._background_tasks_lock:
+            unfinished: List[TaskRecord] = list(self._background_tasks.values())
+        pending: List[Task] = [record.task for record in unfinished if not record.task.done()]
+        if pending:
+            _, still_pending = await wait_for_tasks(pending, timeout=drain_timeout)
+        else:
+            still_pending = set()
+        report["completed"] = len(pending) - len(still_pending)
+
+        # Report the cancelled tasks oldest first
+        cancelled_by_submitter: Dict[str, List[str]] = report["cancelled_by_submitter"]
+        for record in unfinished:
+            task: Task = record.task
+            if task not in still_pending:
+                continue
+            cancelled_by_submitter.setdefault(str(record.submitter_id), []).append(task.get_name())
+            task.cancel("shutdown-drain-deadline")
+        report["cancelled"] = len(still_pending)
+
+        # Queued sync work would never get cancelled otherwise
+        self._threadpool_executor.shutdown(wait=False, cancel_futures=True)
+        if still_pending:
+            await wait_for_tasks(still_pending, timeout=cancel_timeout)
@@ -17,29 +17,45 @@
 """
 See class comments
 """
+# pylint: disable=too-many-lines
+from collections import Counter
+from collections import deque
 from collections.abc import Sequence
 from typing import Any
+from typing import Callable
+from typing import Deque
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from copy import copy
+from functools import partial
 from asyncio import AbstractEventLoop
 from asyncio import Task
 from asyncio import all_tasks
 from asyncio import current_task
 from asyncio import run_coroutine_threadsafe
 from concurrent.futures import Future
-from concurrent.futures import TimeoutError as ConcurrentFuturesTimeoutError
+from concurrent.futures import wait as wait_for_futures
 from logging import getLogger
 from logging import Logger
+from threading import Condition
 from threading import Event
 from threading import Lock
 from threading import Thread
 from threading import current_thread
 from time import monotonic
 
+from leaf_common.asyncio.adaptive_idle_policy import AdaptiveIdlePolicy
 from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.executor_lease import ExecutorLease
+from leaf_common.asyncio.executor_pool_exhausted_exception import ExecutorPoolExhaustedException
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+from leaf_common.asyncio.loop_stall_watchdog import LoopStallWatchdog
+from leaf_common.asyncio.prometheus_text_writer import PrometheusTextWriter
+from leaf_common.asyncio.shared_thread_pool_executor import SharedThreadPoolExecutor
 from leaf_common.logging.sensitive_logger import SensitiveLogger
 
 
@@ -52,7 +68,10 @@ class AsyncioExecutorPool:
     -------------------------
     When reuse_mode is True, executors are returned to pool_available rather
     than shut down. Each time an executor is returned, its return timestamp
-    is recorded.
+    is recorded. pool_available is a stack: get_executor() reuses the most
+    recently returned executor, whose threads and caches are still warm,
+    while the least recently returned ones sink to the cold end and are
+    the ones garbage collected.
 
     Garbage collection is performed by a dedicated daemon GC thread that
     runs on its own schedule, independent of any get_executor() /
@@ -66,6 +85,41 @@ class AsyncioExecutorPool:
     configurable via constructor parameters, with defaults given by
     DEFAULT_IDLE_TIMEOUT_SECONDS and DEFAULT_GC_SWEEP_INTERVAL_SECONDS.
 
+    Warm-up and bounds
+    ------------------
+    With min_idle > 0, a dedicated daemon warmer thread keeps at least
+    min_idle executors started and waiting in pool_available, so that
+    get_executor() does not pay for starting a new event loop thread.
+    The GC never collects idle executors below min_idle.
+
+    With max_size set, the pool never has more than max_size executors
+    in use, available and being started, all together. Once it has,
+    get_executor() waits for one to be returned, up to its timeout,
+    then raises ExecutorPoolExhaustedException.
+
+    Adaptive idle timeout
+    ---------------------
+    With an AdaptiveIdlePolicy, the GC follows the demand instead of only
+    idle_timeout_seconds: it keeps enough executors for the predicted peak
+    of the next burst of demand, and collects the excess sooner.
+    Its decisions are part of get_pool_metrics().
+
+    Reset on return
+    ---------------
+    In reuse mode, return_executor() returns right away: a dedicated daemon
+    reset worker thread cancels and drains the returned executor's tasks,
+    checks its event loop still answers, and only then puts it back in
+    pool_available. Executors whose drain or health check times out are
+    quarantined: shut down without waiting, and replaced by a new executor.
+    Returned executors count towards max_size until their reset is done.
+
+    Leases
+    ------
+    lease() wraps get_executor() and return_executor() in a context manager,
+    for both with and async with, which always returns the executor,
+    even when the block raises. How long leases wait for an executor
+    and how long they hold one are reported by get_lease_metrics().
+
     Lifecycle: callers should invoke shutdown() to stop the GC thread when
     the pool is no longer needed. The GC thread holds a strong reference to
     the pool, so omitting shutdown() will keep the pool (and its state) alive
@@ -82,10 +136,25 @@ class AsyncioExecutorPool:
     # thread wakes to look for stale executors.
     DEFAULT_GC_SWEEP_INTERVAL_SECONDS: float = 30.0
 
+    # Internal configuration: default time (seconds) the reset worker gives
+    # a returned executor's tasks to drain, and its loop to answer a ping.
+    DEFAULT_RESET_TIMEOUT_SECONDS: float = 5.0
+
+    # Internal configuration: time (seconds) dump_tasks_in_used_executors()
+    # gives a probe which already ran by its deadline to deliver its result.
+    PROBE_RESULT_GRACE_SECONDS: float = 0.1
+
+    # pylint: disable=too-many-arguments,too-many-statements
     def __init__(self, reuse_mode: bool = True, *,
                  idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
                  gc_sweep_interval_seconds: float = DEFAULT_GC_SWEEP_INTERVAL_SECONDS,
-                 max_workers: int = None):
+                 max_workers: int = None,
+                 stall_watchdog: LoopStallWatchdog = None,
+                 min_idle: int = 0,
+                 max_size: int = None,
+                 reset_timeout_seconds: float = DEFAULT_RESET_TIMEOUT_SECONDS,
+                 idle_policy: AdaptiveIdlePolicy = None,
+                 shared_thread_pool: SharedThreadPoolExecutor = None):
         """
         Constructor.
         :param reuse_mode: True, if requested executor instances
@@ -105,116 +174,506 @@ class AsyncioExecutorPool:
                                  being collected. Only applies when
                                  reuse_mode is True.
         :param max_workers: maximum number of threads to use for each AsyncioExecutor
+        :param stall_watchdog: An optional LoopStallWatchdog to watch the event loops
+                                 of all the executors of this pool. It is not stopped
+                                 by shutdown().
+        :param min_idle: Number of started executors a background warmer
+                                 keeps in pool_available, and below which the GC
+                                 does not collect. Only applies when reuse_mode is True.
+                                 Default is 0: executors are only started on demand.
+        :param max_size: Maximum number of executors of the pool, used, available
+                                 and being started. Default of None implies no limit.
+        :param reset_timeout_seconds: Maximum time the background reset worker gives
+                                 a returned executor's tasks to drain, and then its
+                                 event loop to answer a health check ping. Executors
+                                 failing either are quarantined and replaced.
+                                 Only applies when reuse_mode is True.
+        :param idle_policy: An optional AdaptiveIdlePolicy with which the GC keeps
+                                 enough executors for the predicted peak demand,
+                                 falling back to idle_timeout_seconds when it has
+                                 no prediction. Default of None only uses
+                                 idle_timeout_seconds. Only applies when reuse_mode is True.
+        :param shared_thread_pool: An optional SharedThreadPoolExecutor which all the executors
+                                 of this pool run their synchronous functions in, instead
+                                 of max_workers threads each. It is not shut down by shutdown().
         """
         self.reuse_mode: bool = reuse_mode
         self.idle_timeout_seconds: float = idle_timeout_seconds
         self.gc_sweep_interval_seconds: float = gc_sweep_interval_seconds
         self.max_workers: Optional[int] = max_workers
+        self.stall_watchdog: Optional[LoopStallWatchdog] = stall_watchdog
+        self.min_idle: int = min_idle
+        self.max_size: Optional[int] = max_size
+        self.reset_timeout_seconds: float = reset_timeout_seconds
+        self.idle_policy: Optional[AdaptiveIdlePolicy] = idle_policy
+        self.shared_thread_pool: Optional[SharedThreadPoolExecutor] = shared_thread_pool
+        if self.min_idle < 0:
+            raise ValueError("min_idle must be >= 0")
+        if self.min_idle > 0 and not self.reuse_mode:
+            raise ValueError("min_idle requires reuse_mode=True")
+        if self.max_size is not None and self.max_size < max(1, self.min_idle):
+            raise ValueError("max_size must be >= 1 and >= min_idle")
         if self.reuse_mode:
             if self.gc_sweep_interval_seconds <= 0:
                 raise ValueError("gc_sweep_interval_seconds must be > 0 when reuse_mode=True")
             if self.idle_timeout_seconds < 0:
                 raise ValueError("idle_timeout_seconds must be >= 0 when reuse_mode=True")
-        # List of available (not currently used) AsyncioExecutor instances in the pool.
-        self.pool_available: List[AsyncioExecutor] = []
+            if self.reset_timeout_seconds <= 0:
+                raise ValueError("reset_timeout_seconds must be > 0 when reuse_mode=True")
+        # Available (not currently used) AsyncioExecutor instances in the pool,
+        # ordered by return time: the cold end on the left, the warm end on the right.
+        self.pool_available: Deque[AsyncioExecutor] = deque()
 
-        # List of currently used AsyncioExecutor instances in the pool.
-        self.pool_used: List[AsyncioExecutor] = []
+        # Currently used AsyncioExecutor instances in the pool.
+        self.pool_used: Set[AsyncioExecutor] = set()
 
         # Maps id(executor) -> monotonic timestamp when the executor was
         # returned to pool_available. Only contains entries for executors
         # currently in pool_available; pruned on get_executor() and on sweep.
         self._returned_at: Dict[int, float] = {}
 
+        # Executors being started by get_executor() and by the warmer, respectively.
+        # They count towards max_size.
+        self._starting: int = 0
+        self._warming: int = 0
+
+        # Returned executors waiting for the reset worker, oldest first,
+        # and the number being reset right now. They count towards max_size.
+        self._resetting: Deque[AsyncioExecutor] = deque()
+        self._reset_in_progress: int = 0
+        self._resets: int = 0
+        self._quarantined: int = 0
+        self._replaced: int = 0
+        self._reset_time: LatencyHistogram = LatencyHistogram()
+
+        # Lifetime event counters, protected by the lock, so that short-lived
+        # executors still show up in metrics scraped at intervals.
+        self._created: int = 0
+        self._creation_time: LatencyHistogram = LatencyHistogram()
+        self._reuse_hits: int = 0
+        self._reuse_misses: int = 0
+        self._exhausted: int = 0
+        self._returns: int = 0
+        self._collected: int = 0
+
+        # Lease bookkeeping, protected by the lock.
+        # Maps id(executor) -> monotonic timestamp when it was leased.
+        self._leased_at: Dict[int, float] = {}
+        self._leases: int = 0
+        self._lease_timeouts: int = 0
+        self._lease_wait: LatencyHistogram = LatencyHistogram()
+        self._lease_duration: LatencyHistogram = LatencyHistogram()
+
         self.lock = Lock()
+        # Signalled whenever an executor is returned, or capacity is freed.
+        self._returned_condition: Condition = Condition(self.lock)
         self.logger: Logger = getLogger(self.__class__.__name__)
 
         # Active GC: a daemon thread runs _gc_loop, sweeping on its own
         # schedule. The stop event lets shutdown() interrupt the sweep
         # interval wait promptly.
         self._gc_stop_event: Event = Event()
-        self._gc_thread: Optional[Thread] = None
-        if self.reuse_mode:
-            self._gc_thread = Thread(
-                target=self._gc_loop,
-                name=f"AsyncioExecutorPool-GC-{id(self)}",
-                daemon=True,
-            )
-            self._gc_thread.start()
+        self._gc_thread: Optional[Thread] = self._start_daemon_thread(self._gc_loop, "GC") \
+            if self.reuse_mode else None
+
+        # Warmer: a daemon thread runs _warm_loop, starting executors
+        # whenever pool_available falls below min_idle.
+        self._warm_event: Event = Event()
+        self._warm_thread: Optional[Thread] = self._start_daemon_thread(self._warm_loop, "Warmer") \
+            if self.min_idle > 0 else None
+
+        # Reset worker: a daemon thread runs _reset_loop, cleaning up
+        # returned executors off the caller's thread.
+        self._reset_event: Event = Event()
+        self._reset_thread: Optional[Thread] = self._start_daemon_thread(self._reset_loop, "Reset") \
+            if self.reuse_mode else None
 
         self.logger.debug(
             "AsyncioExecutorPool created: %s reuse: %s idle_timeout: %.1fs sweep_interval: %.1fs",
             id(self), str(self.reuse_mode), self.idle_timeout_seconds, self.gc_sweep_interval_seconds)
 
-    def get_executor(self) -> AsyncioExecutor:
+    def _start_daemon_thread(self, target: Callable[[], None], role: str) -> Thread:
+        """
+        :param target: The loop function the thread runs
+        :param role: What the thread does, for its name
+        :return: A started daemon thread for one of the background loops of this pool
+        """
+        thread = Thread(target=target, name=f"AsyncioExecutorPool-{role}-{id(self)}", daemon=True)
+        thread.start()
+        return thread
+
+    def get_executor(self, timeout: Optional[float] = 0.0) -> AsyncioExecutor:
         """
         Get active (running) executor from the pool. Does not sweep;
         sweeping is the GC thread's responsibility. If a stale executor
-        happens to sit at the head of pool_available before the next
+        happens to be the only one in pool_available before the next
         sweep, get_executor() will reuse it -- which is fine, since
         "stale" only means "would otherwise be collected as idle".
+        :param timeout: Only applies when the pool already has max_size executors:
+                    maximum number of seconds to wait for one to be returned.
+                    Default of 0.0 does not wait, None waits forever.
         :return: AsyncioExecutor instance
         """
-        if self.reuse_mode:
-            with self.lock:
-                if len(self.pool_available) > 0:
-                    result = self.pool_available.pop(0)
+        deadline: Optional[float] = None if timeout is None else monotonic() + timeout
+        with self.lock:
+            while True:
+                if self.reuse_mode and len(self.pool_available) > 0:
+                    # Most recently returned first
+                    result = self.pool_available.pop()
                     self._returned_at.pop(id(result), None)
                     self.logger.debug("Reusing AsyncioExecutor %s", id(result))
-                    self.pool_used.append(result)
+                    self.pool_used.add(result)
+                    self._reuse_hits += 1
+                    self._observe_demand_locked()
+                    self._wake_warmer_locked()
                     return result
+                if self.max_size is None or self._get_size_locked() < self.max_size:
+                    self._starting += 1
+                    self._reuse_misses += 1
+                    self._observe_demand_locked()
+                    break
+                remaining: Optional[float] = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0.0:
+                    self._exhausted += 1
+                    raise ExecutorPoolExhaustedException(self.max_size, timeout)
+                self._returned_condition.wait(remaining)
+            self._wake_warmer_locked()
+
         # Create AsyncioExecutor outside of lock
         # to avoid potentially longer locked periods
-        result = AsyncioExecutor(max_workers=self.max_workers)
-        result.start()
+        try:
+            result = self._new_executor()
+        except BaseException:
+            with self.lock:
+                self._starting -= 1
+                self._observe_demand_locked()
+                self._returned_condition.notify()
+            raise
         self.logger.debug("Creating AsyncioExecutor %s", id(result))
         with self.lock:
-            self.pool_used.append(result)
+            self._starting -= 1
+            self.pool_used.add(result)
+        return result
+
+    def lease(self, timeout: Optional[float] = None) -> ExecutorLease:
+        """
+        Lease an executor from the pool for the duration of a with or async with block:
+
+            with pool.lease(timeout=2.0) as executor:
+                ...
+
+        The executor is returned to the pool on exit, whether the block raises or not.
+        :param timeout: Only applies when the pool already has max_size executors:
+                    maximum number of seconds to wait for one to be returned,
+                    after which ExecutorPoolExhaustedException is raised on entry.
+                    Default of None waits forever.
+        :return: An ExecutorLease context manager giving the executor on entry
+        """
+        return ExecutorLease(partial(self._acquire_lease, timeout), self._release_lease)
+
+    def _acquire_lease(self, timeout: Optional[float]) -> AsyncioExecutor:
+        """
+        Get an executor for an ExecutorLease, recording the wait.
+        :param timeout: As per get_executor()
+        :return: AsyncioExecutor instance
+        """
+        started_at: float = monotonic()
+        try:
+            executor: AsyncioExecutor = self.get_executor(timeout)
+        except ExecutorPoolExhaustedException:
+            with self.lock:
+                self._lease_timeouts += 1
+            raise
+        leased_at: float = monotonic()
+        with self.lock:
+            self._leases += 1
+            self._leased_at[id(executor)] = leased_at
+            self._lease_wait.record(leased_at - started_at)
+        return executor
+
+    def _release_lease(self, executor: AsyncioExecutor) -> None:
+        """
+        Return the executor of an ExecutorLease, recording how long it was leased.
+        :param executor: AsyncioExecutor to return.
+        """
+        with self.lock:
+            leased_at: Optional[float] = self._leased_at.pop(id(executor), None)
+            if leased_at is not None:
+                self._lease_duration.record(monotonic() - leased_at)
+        self.return_executor(executor)
+
+    def get_lease_metrics(self) -> Dict[str, Any]:
+        """
+        Get metrics of the leases taken with lease(), to size the pool from:
+        the total number of "leases", how many are "active" right now,
+        how many "timeouts" waiting for an executor at max_size there were,
+        and summaries of the time spent waiting for an executor ("wait")
+        and of the time executors were held ("duration"),
+        as per LatencyHistogram.get_metrics().
+        :return: A dictionary of lease metrics
+        """
+        with self.lock:
+            return {
+                "leases": self._leases,
+                "active": len(self._leased_at),
+                "timeouts": self._lease_timeouts,
+                "wait": self._lease_wait.get_metrics(),
+                "duration": self._lease_duration.get_metrics(),
+            }
+
+    def _new_executor(self) -> AsyncioExecutor:
+        """
+        :return: A new, started AsyncioExecutor configured as per this pool
+        """
+        started_at: float = monotonic()
+        result = AsyncioExecutor(max_workers=self.max_workers, stall_watchdog=self.stall_watchdog,
+                                 shared_thread_pool=self.shared_thread_pool)
+        result.start()
+        with self.lock:
+            self._created += 1
+            self._creation_time.record(monotonic() - started_at)
         return result
 
+    def _get_size_locked(self) -> int:
+        """
+        Must be called with the lock held.
+        :return: The number of executors counting towards max_size
+        """
+        return len(self.pool_used) + len(self.pool_available) + self._starting + self._warming \
+            + len(self._resetting) + self._reset_in_progress
+
+    def _observe_demand_locked(self) -> None:
+        """
+        Tell the idle policy, if any, how many executors are in use now.
+        Must be called with the lock held.
+        """
+        if self.idle_policy is not None:
+            self.idle_policy.observe(len(self.pool_used) + self._starting, monotonic())
+
+    def _wake_warmer_locked(self) -> None:
+        """
+        Wake the warmer thread if pool_available is below min_idle.
+        Must be called with the lock held.
+        """
+        if self._warm_thread is not None and len(self.pool_available) + self._warming < self.min_idle:
+            self._warm_event.set()
+
     def return_executor(self, executor: AsyncioExecutor):
         """
         Return AsyncioExecutor instance back to the pool of available instances.
         Does not sweep; the GC thread handles stale collection on its own
         schedule.
+
+        In reuse mode this does not wait for the executor's tasks to be cancelled:
+        the executor is handed over to the background reset worker, which
+        puts it back in pool_available once it is clean.
+        Use wait_for_resets() to wait for that to happen.
         :param executor: AsyncioExecutor to return.
         """
         with self.lock:
-            if executor not in self.pool_used:
-                raise ValueError(f"Returned executor {id(executor)} is not in the pool of used executors")
-            self.pool_used.remove(executor)
+            try:
+                self.pool_used.remove(executor)
+            except KeyError as exc:
+                raise ValueError(f"Returned executor {id(executor)} is not in the pool of used executors") from exc
+            self._returns += 1
+            self._observe_demand_locked()
+            if self.reuse_mode:
+                if self._reset_thread is not None:
+                    self._resetting.append(executor)
+                    self._reset_event.set()
+                    return
+                # No reset worker after shutdown(): reset on the caller's thread.
+                self._reset_in_progress += 1
 
-        # Executor clean up: cancel current tasks and shutdown if not in reuse mode.
         if self.reuse_mode:
-            executor.cancel_current_tasks()
-        else:
-            self.logger.debug("Shutting down: AsyncioExecutor %s", id(executor))
-            executor.shutdown()
+            self._reset_and_recycle(executor)
+            return
 
-        if self.reuse_mode:
+        self.logger.debug("Shutting down: AsyncioExecutor %s", id(executor))
+        executor.shutdown()
+        with self.lock:
+            self._returned_condition.notify()
+
+    def wait_for_resets(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the reset worker to be done with all the executors returned so far.
+        :param timeout: Maximum number of seconds to wait. Default of None waits forever.
+        :return: True if no executor is being reset anymore, False if timed out.
+        """
+        with self.lock:
+            return self._returned_condition.wait_for(
+                lambda: len(self._resetting) == 0 and self._reset_in_progress == 0, timeout)
+
+    def get_reset_metrics(self) -> Dict[str, Any]:
+        """
+        Get metrics of the reset worker: the number of executors "resetting" right now,
+        of "resets" done, how many executors failed theirs and were "quarantined",
+        how many of those were "replaced" by a new executor, and a summary
+        of the time resets took ("reset_time") as per LatencyHistogram.get_metrics().
+        :return: A dictionary of reset metrics
+        """
+        with self.lock:
+            return {
+                "resetting": len(self._resetting) + self._reset_in_progress,
+                "resets": self._resets,
+                "quarantined": self._quarantined,
+                "replaced": self._replaced,
+                "reset_time": self._reset_time.get_metrics(),
+            }
+
+    def _reset_loop(self) -> None:
+        """
+        Reset worker loop: reset returned executors until there are none left,
+        then wait to be woken up by return_executor().
+        On shutdown(), resets whatever is left before exiting.
+        """
+        while not self._gc_stop_event.is_set():
+            self._reset_pending()
+            self._reset_event.wait()
+            self._reset_event.clear()
+        self._reset_pending()
+
+    def _reset_pending(self) -> None:
+        """
+        Reset the returned executors, oldest first, one at a time.
+        """
+        while True:
             with self.lock:
-                self.pool_available.append(executor)
-                self._returned_at[id(executor)] = monotonic()
+                if len(self._resetting) == 0:
+                    return
+                executor: AsyncioExecutor = self._resetting.popleft()
+                self._reset_in_progress += 1
+            self._reset_and_recycle(executor)
+
+    def _reset_and_recycle(self, executor: AsyncioExecutor) -> None:
+        """
+        Reset an executor counted in _reset_in_progress, then put it back in pool_available,
+        or quarantine it and put a new executor there instead.
+        :param executor: AsyncioExecutor to reset
+        """
+        started_at: float = monotonic()
+        healthy: bool = self._reset_executor(executor)
+        with self.lock:
+            self._resets += 1
+            self._reset_time.record(monotonic() - started_at)
+            if not healthy:
+                self._quarantined += 1
+
+        replacement: Optional[AsyncioExecutor] = executor
+        if not healthy:
+            replacement = self._replace_executor(executor)
+
+        with self.lock:
+            self._reset_in_progress -= 1
+            if replacement is not None:
+                self.pool_available.append(replacement)
+                self._returned_at[id(replacement)] = monotonic()
                 self.logger.debug("Returned to pool: AsyncioExecutor %s pool size: %d",
-                                  id(executor), len(self.pool_available))
+                                  id(replacement), len(self.pool_available))
+            # Wake both get_executor() and wait_for_resets() callers
+            self._returned_condition.notify_all()
+
+    def _reset_executor(self, executor: AsyncioExecutor) -> bool:
+        """
+        Cancel and drain the tasks of an executor, then check its event loop still answers.
+        :param executor: AsyncioExecutor to reset
+        :return: True if the executor is fit for reuse, False otherwise
+        """
+        sensitive_logger = SensitiveLogger(self.logger)
+        try:
+            executor.cancel_current_tasks(timeout=self.reset_timeout_seconds)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            sensitive_logger.warning("Reset: quarantining AsyncioExecutor %s whose tasks did not drain: %r",
+                                     id(executor), exc)
+            return False
+        if not executor.is_healthy(self.reset_timeout_seconds):
+            sensitive_logger.warning("Reset: quarantining AsyncioExecutor %s which failed its health check",
+                                     id(executor))
+            return False
+        return True
+
+    def _replace_executor(self, executor: AsyncioExecutor) -> Optional[AsyncioExecutor]:
+        """
+        Shut a quarantined executor down, without waiting for its possibly wedged
+        event loop thread, and start a new executor in its place.
+        :param executor: The quarantined AsyncioExecutor
+        :return: The new AsyncioExecutor, or None if starting one failed
+        """
+        executor.shutdown(wait=False)
+        try:
+            replacement: AsyncioExecutor = self._new_executor()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            sensitive_logger = SensitiveLogger(self.logger)
+            sensitive_logger.warning("Reset: starting a replacement AsyncioExecutor raised %s", exc, exc_info=True)
+            return None
+        with self.lock:
+            self._replaced += 1
+        self.logger.debug("Reset: replaced AsyncioExecutor %s with %s", id(executor), id(replacement))
+        return replacement
 
     def shutdown(self, wait: bool = True) -> None:
         """
-        Stop the background GC thread. After this returns, the pool no
-        longer reaps idle executors. Idempotent. Executors still held in
-        pool_used or pool_available are NOT shut down here; callers that
-        want those gone should handle them explicitly.
+        Stop the background GC, warmer and reset threads. After this returns, the pool no
+        longer reaps idle executors nor starts new ones ahead of time,
+        and returned executors are reset on the returning thread. Idempotent.
+        Executors still held in pool_used or pool_available are NOT shut down here;
+        callers that want those gone should handle them explicitly.
         """
         with self.lock:
-            gc_thread = self._gc_thread
-            if gc_thread is None:
+            threads = [thread for thread in (self._gc_thread, self._warm_thread, self._reset_thread)
+                       if thread is not None]
+            if not threads:
                 return
             # Clear first to make concurrent shutdown() calls safe.
             self._gc_thread = None
+            self._warm_thread = None
+            self._reset_thread = None
 
         self._gc_stop_event.set()
-        if wait and current_thread() is not gc_thread:
-            gc_thread.join()
+        self._warm_event.set()
+        self._reset_event.set()
+        for thread in threads:
+            if wait and current_thread() is not thread:
+                thread.join()
+
+    def _warm_loop(self) -> None:
+        """
+        Warmer loop: top pool_available up to min_idle, then wait until woken up
+        by get_executor() or for the GC sweep interval, whichever comes first.
+        Exits cleanly when shutdown() sets the stop event.
+        """
+        while not self._gc_stop_event.is_set():
+            self._warm_once()
+            self._warm_event.wait(timeout=self.gc_sweep_interval_seconds)
+            self._warm_event.clear()
+
+    def _warm_once(self) -> None:
+        """
+        Start executors, one at a time, until pool_available holds min_idle of them
+        or the pool reaches max_size.
+        """
+        while not self._gc_stop_event.is_set():
+            with self.lock:
+                if len(self.pool_available) + self._warming >= self.min_idle:
+                    return
+                if self.max_size is not None and self._get_size_locked() >= self.max_size:
+                    return
+                self._warming += 1
+            try:
+                executor = self._new_executor()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                with self.lock:
+                    self._warming -= 1
+                    self._returned_condition.notify()
+                sensitive_logger = SensitiveLogger(self.logger)
+                sensitive_logger.warning("Warmer: starting an AsyncioExecutor raised %s", exc, exc_info=True)
+                return
+            with self.lock:
+                self._warming -= 1
+                self.pool_available.append(executor)
+                self._returned_at[id(executor)] = monotonic()
+                self._returned_condition.notify()
+            self.logger.debug("Warmer: started AsyncioExecutor %s", id(executor))
 
     def _gc_loop(self) -> None:
         """
@@ -240,6 +699,8 @@ class AsyncioExecutorPool:
             try:
                 sensitive_logger.debug("GC: shutting down idle AsyncioExecutor %s", id(executor))
                 executor.shutdown(wait=True)
+                with self.lock:
+                    self._collected += 1
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 sensitive_logger.warning(
                     "GC: shutdown failed for AsyncioExecutor %s: %s", id(executor), exc, exc_info=True)
@@ -248,10 +709,12 @@ class AsyncioExecutorPool:
         """
         Identify any executors in pool_available whose idle time exceeds
         idle_timeout_seconds, remove them from the pool, and shut them
-        down. No-op when not in reuse mode.
+        down. No-op when not in reuse mode. With an idle_policy, the number
+        of executors kept and the idle time are as it decides instead.
 
-        pool_available is FIFO-ordered by return time (oldest at the head),
-        so the scan stops at the first non-stale entry.
+        pool_available is ordered by return time (oldest at the cold end, on the left),
+        so the scan stops at the first non-stale entry. At least min_idle
+        executors are left in pool_available, stale or not.
 
         Run by the GC thread on its periodic schedule; tests may call it
         directly with a synthetic `now` for deterministic verification.
@@ -267,30 +730,51 @@ class AsyncioExecutorPool:
             now = monotonic()
         to_collect: List[AsyncioExecutor] = []
         with self.lock:
-            keep_from: int = 0
-            prev_returned_at: float = 0.0
-            for executor in self.pool_available:
-                if id(executor) not in self._returned_at:
-                    # This should never happen, but log this and record executor
-                    # as returned at the same time as the previous one - to keep sequence invariant still valid.
-                    self.logger.warning(
-                        "GC: executor %s in pool_available but missing return timestamp; fixing",
-                        id(executor))
-                    self._returned_at[id(executor)] = prev_returned_at
-                returned_at: float = self._returned_at.get(id(executor), prev_returned_at)
-                if now - returned_at > self.idle_timeout_seconds:
-                    to_collect.append(executor)
-                    keep_from += 1
-                    prev_returned_at = returned_at
-                else:
-                    break
-            if keep_from > 0:
-                for executor in self.pool_available[:keep_from]:
-                    self._returned_at.pop(id(executor), None)
-                del self.pool_available[:keep_from]
+            keep: int = self.min_idle
+            idle_timeout: float = self.idle_timeout_seconds
+            if self.idle_policy is not None:
+                policy_keep, idle_timeout = self.idle_policy.decide(now, self.idle_timeout_seconds)
+                keep = max(keep, policy_keep)
+            keep_from: int = self._count_stale_locked(now, idle_timeout, len(self.pool_available) - keep)
+            if self.idle_policy is not None:
+                # What the fixed idle timeout alone would have done
+                fixed: int = self._count_stale_locked(now, self.idle_timeout_seconds,
+                                                      len(self.pool_available) - self.min_idle)
+                self.idle_policy.record_collections(max(0, fixed - keep_from), max(0, keep_from - fixed))
+            for _ in range(keep_from):
+                executor = self.pool_available.popleft()
+                self._returned_at.pop(id(executor), None)
+                to_collect.append(executor)
         # Shutdown outside the lock to keep the critical section short.
         self._collect_executors(to_collect)
 
+    def _count_stale_locked(self, now: float, idle_timeout: float, collectable: int) -> int:
+        """
+        Must be called with the lock held.
+        :param now: The current time, as per time.monotonic()
+        :param idle_timeout: Idle time in seconds after which an executor is stale
+        :param collectable: Maximum number of executors to count
+        :return: The number of stale executors at the cold end of pool_available, up to collectable
+        """
+        count: int = 0
+        prev_returned_at: float = 0.0
+        for executor in self.pool_available:
+            if count >= collectable:
+                break
+            if id(executor) not in self._returned_at:
+                # This should never happen, but log this and record executor
+                # as returned at the same time as the previous one - to keep sequence invariant still valid.
+                self.logger.warning(
+                    "GC: executor %s in pool_available but missing return timestamp; fixing",
+                    id(executor))
+                self._returned_at[id(executor)] = prev_returned_at
+            returned_at: float = self._returned_at[id(executor)]
+            if now - returned_at <= idle_timeout:
+                break
+            count += 1
+            prev_returned_at = returned_at
+        return count
+
     def get_threads_metrics(self) -> Dict[str, Any]:
         """
         Get metrics related to threads in the pool of executors:
@@ -299,6 +783,13 @@ class AsyncioExecutorPool:
         the total number of work threads across all executors in this collection "work_threads",
         and the total number of currently running work threads
         across all executors in this collection "threads_running".
+
+        With a shared_thread_pool, the work threads of each executor are the
+        shared threads busy with its work, and a "shared" section reports the
+        totals of the shared pool: "max_workers", "work_threads" and
+        "threads_running", as well as the usage of each executor under
+        "per_executor", keyed by str(id(executor)), as per
+        ThreadPoolShare.get_usage_metrics().
         """
         with self.lock:
             available_copy = copy(self.pool_available)
@@ -327,34 +818,162 @@ class AsyncioExecutorPool:
                 "threads_running": available_running
             }
         }
+        if self.shared_thread_pool is not None:
+            shared: Dict[str, Any] = self.shared_thread_pool.get_usage_metrics()
+            shared["per_executor"] = shared.pop("per_share")
+            result_dict["shared"] = shared
         return result_dict
 
-    def dump_tasks_in_used_executors(self, per_loop_timeout_s: float = 2.0) -> Dict[str, Any]:
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """
+        Get lifetime metrics of the pool: the number of executors "created",
+        a summary of how long starting them took ("creation_time") as per
+        LatencyHistogram.get_metrics(), how many get_executor() calls reused
+        an executor ("reuse_hits") or had to create one ("reuse_misses"),
+        the "reuse_hit_rate" of the two, the number of "returns", of idle
+        executors "collected" by the GC, and of get_executor() calls which
+        timed out at max_size ("exhausted"), and the decisions of the
+        "idle_policy" as per AdaptiveIdlePolicy.get_metrics(), or None without one.
+        :return: A dictionary of pool metrics
+        """
+        with self.lock:
+            gets: int = self._reuse_hits + self._reuse_misses
+            return {
+                "created": self._created,
+                "creation_time": self._creation_time.get_metrics(),
+                "reuse_hits": self._reuse_hits,
+                "reuse_misses": self._reuse_misses,
+                "reuse_hit_rate": self._reuse_hits / gets if gets else 0.0,
+                "returns": self._returns,
+                "collected": self._collected,
+                "exhausted": self._exhausted,
+                "idle_policy": self.idle_policy.get_metrics() if self.idle_policy is not None else None,
+            }
+
+    def get_prometheus_metrics(self, prefix: str = "asyncio_executor_pool", labels: Dict[str, str] = None) -> str:
+        """
+        Get all the metrics of the pool in the Prometheus text exposition format,
+        for a web handler to serve as is, with PrometheusTextWriter.CONTENT_TYPE.
+        Counters and histograms cover the whole life of the pool, so rates
+        derived from them account for executors started and collected between scrapes.
+        :param prefix: Prefix of all the metric names
+        :param labels: Optional labels added to every sample, e.g. to tell pools apart
+        :return: The metrics as text
+        """
+        threads: Dict[str, Any] = self.get_threads_metrics()
+        writer = PrometheusTextWriter(prefix, labels)
+        for state in ("used", "available"):
+            writer.add_gauge("work_threads", "Worker threads of the pooled executors.",
+                             threads[state]["work_threads"], {"state": state})
+            writer.add_gauge("work_threads_running", "Worker threads of the pooled executors running work.",
+                             threads[state]["threads_running"], {"state": state})
+        if "shared" in threads:
+            shared: Dict[str, Any] = threads["shared"]
+            writer.add_gauge("shared_max_workers", "Maximum number of threads of the shared worker pool.",
+                             shared["max_workers"])
+            writer.add_gauge("shared_work_threads", "Threads of the shared worker pool.", shared["work_threads"])
+            writer.add_gauge("shared_work_threads_running", "Threads of the shared worker pool running work.",
+                             shared["threads_running"])
+            writer.add_gauge("shared_work_queued", "Functions waiting for a thread of the shared worker pool.",
+                             sum(usage["queued"] for usage in shared["per_executor"].values()))
+        with self.lock:
+            gets: int = self._reuse_hits + self._reuse_misses
+            executors: Dict[str, int] = {
+                "used": len(self.pool_used),
+                "available": len(self.pool_available),
+                "resetting": len(self._resetting) + self._reset_in_progress,
+                "starting": self._starting + self._warming,
+            }
+            for state, count in executors.items():
+                writer.add_gauge("executors", "Executors of the pool by state.", count, {"state": state})
+            writer.add_counter("executors_created", "Executors started by the pool.", self._created)
+            writer.add_histogram("executor_creation_seconds", "Time taken to start an executor.",
+                                 self._creation_time)
+            writer.add_counter("executor_gets", "Executors handed out by get_executor().",
+                               self._reuse_hits, {"result": "reuse"})
+            writer.add_counter("executor_gets", "Executors handed out by get_executor().",
+                               self._reuse_misses, {"result": "create"})
+            writer.add_gauge("reuse_hit_ratio", "Fraction of get_executor() calls which reused an executor.",
+                             self._reuse_hits / gets if gets else 0.0)
+            writer.add_counter("executor_returns", "Executors returned to the pool.", self._returns)
+            writer.add_counter("executors_collected", "Idle executors shut down by the GC.", self._collected)
+            writer.add_counter("exhausted", "get_executor() calls which timed out at max_size.", self._exhausted)
+            writer.add_counter("leases", "Leases taken with lease().", self._leases)
+            writer.add_counter("lease_timeouts", "Leases which timed out waiting for an executor.",
+                               self._lease_timeouts)
+            writer.add_gauge("leases_active", "Leases currently held.", len(self._leased_at))
+            writer.add_histogram("lease_wait_seconds", "Time leases waited for an executor.", self._lease_wait)
+            writer.add_histogram("lease_duration_seconds", "Time leases held their executor.",
+                                 self._lease_duration)
+            writer.add_counter("executor_resets", "Resets of returned executors.", self._resets)
+            writer.add_counter("executors_quarantined", "Executors which failed their reset.", self._quarantined)
+            writer.add_counter("executors_replaced", "Quarantined executors replaced by a new one.",
+                               self._replaced)
+            writer.add_histogram("executor_reset_seconds", "Time taken to reset a returned executor.",
+                                 self._reset_time)
+            if self.idle_policy is not None:
+                self._add_idle_policy_metrics_locked(writer)
+        return writer.get_text()
+
+    def _add_idle_policy_metrics_locked(self, writer: PrometheusTextWriter):
+        """
+        Add the metrics of the idle policy. Must be called with the lock held.
+        :param writer: The PrometheusTextWriter to add them to
+        """
+        policy: Dict[str, Any] = self.idle_policy.get_metrics()
+        writer.add_gauge("idle_policy_adaptive", "1 if the last GC sweep followed the predicted demand, 0 if "
+                         "it fell back to the fixed idle timeout.",
+                         1 if policy["mode"] == AdaptiveIdlePolicy.MODE_ADAPTIVE else 0)
+        writer.add_gauge("idle_policy_keep", "Available executors the last GC sweep kept regardless of idle time.",
+                         policy["keep"])
+        writer.add_gauge("idle_policy_predicted_peak", "Predicted peak number of executors in use per burst.",
+                         policy["predicted_peak"])
+        writer.add_gauge("idle_policy_gap_seconds", "Moving average of the gaps between bursts of demand.",
+                         policy["gap_ewma_seconds"] or 0.0)
+        writer.add_counter("idle_policy_bursts", "Bursts of demand seen by the idle policy.", policy["bursts"])
+        writer.add_counter("idle_policy_spared", "Executors kept which the fixed idle timeout would have collected.",
+                           policy["spared"])
+        writer.add_counter("idle_policy_collected_early", "Executors collected before the fixed idle timeout.",
+                           policy["collected_early"])
+
+    def dump_tasks_in_used_executors(self, per_loop_timeout_s: float = 2.0, *,
+                                     summary: bool = False) -> Dict[str, Any]:
         """
         Debug helper: snapshot the asyncio tasks currently living on every
         AsyncioExecutor in the pool's "used" list. For each executor, this
         schedules a one-shot coroutine on that executor's event loop that
         enumerates asyncio.all_tasks() and captures each task's name, coro
-        qualname, done/cancelled state, and suspended stack. Results are
-        collected across loops via run_coroutine_threadsafe.
+        qualname, done/cancelled state, and suspended stack. The probes of
+        all the loops are scheduled at once via run_coroutine_threadsafe,
+        then collected together.
 
-        If a loop is unresponsive within per_loop_timeout_s -- for example,
+        If a loop has not run its probe by the deadline -- for example,
         because it is CPU-bound on a synchronous hog and cannot service any
         new callback -- that executor's entry is marked as "unresponsive_timeout"
-        rather than blocking indefinitely. An unresponsive loop is itself a
-        strong diagnostic signal ("this loop cannot even run our probe").
+        rather than blocking indefinitely, along with the current Python stack
+        of its thread ("thread_stack"), which shows what the loop is stuck on.
+        Stacks captured earlier by a stall_watchdog are available from
+        LoopStallWatchdog.get_stalls().
 
         Intended for on-demand invocation from a debug endpoint or a signal
         handler while the server is wedged. Do NOT call from performance-
         sensitive paths: it walks every task frame on every used executor.
+        With summary=True, it only counts tasks by coroutine qualname,
+        without walking any frame or capturing any stack, which is cheap
+        enough for a periodic health check.
 
-        :param per_loop_timeout_s: How long to wait for a single loop's
-                    probe coroutine to run. Loops that don't respond by
-                    then are recorded as unresponsive.
+        :param per_loop_timeout_s: Despite the name, kept for compatibility,
+                    a total deadline in seconds: as all the loops are probed
+                    at once, this is how long the whole call waits for all
+                    the probes, and about how long it can take. Loops whose
+                    probe has not run by then are recorded as unresponsive.
+        :param summary: True to only get the number of tasks per coroutine
+                    qualname of each loop, under "task_counts" instead of "tasks".
+                    Default is False.
         :return: A dict keyed by str(id(executor)) with per-executor entries
                  describing loop status and (when responsive) the list of
-                 tasks with their suspended stacks. See format_task_dump()
-                 for a printable rendering.
+                 tasks with their suspended stacks, or their counts.
+                 See format_task_dump() for a printable rendering.
         """
         result: Dict[str, Any] = {}
 
@@ -363,29 +982,89 @@ class AsyncioExecutorPool:
         with self.lock:
             used_snapshot: List[AsyncioExecutor] = list(self.pool_used)
 
+        # Maps executor key -> (executor, probe future)
+        probes: Dict[str, Tuple[AsyncioExecutor, Future]] = {}
         for executor in used_snapshot:
             executor_key: str = str(id(executor))
             loop: AbstractEventLoop = executor.get_event_loop()
             if not loop.is_running():
-                result[executor_key] = {"loop_state": "not_running", "tasks": []}
+                result[executor_key] = self._new_dump_entry("not_running", summary)
                 continue
+            probe = self._count_tasks_on_current_loop() if summary else self._collect_tasks_on_current_loop()
+            probes[executor_key] = (executor, run_coroutine_threadsafe(probe, loop))
+            # Keep the snapshot order in the result
+            result[executor_key] = None
 
-            future: Future = run_coroutine_threadsafe(
-                self._collect_tasks_on_current_loop(), loop)
-            try:
-                tasks = future.result(timeout=per_loop_timeout_s)
-                result[executor_key] = {"loop_state": "responded", "tasks": tasks}
-            except ConcurrentFuturesTimeoutError:
-                future.cancel()
-                result[executor_key] = {"loop_state": "unresponsive_timeout", "tasks": []}
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                result[executor_key] = {
-                    "loop_state": "probe_error",
-                    "error": f"{type(exc).__name__}: {exc}",
-                    "tasks": [],
-                }
+        wait_for_futures([future for _, future in probes.values()], timeout=per_loop_timeout_s)
+        for executor_key, (executor, future) in probes.items():
+            result[executor_key] = self._get_probe_entry(executor, future, summary)
         return result
 
+    @staticmethod
+    def _new_dump_entry(loop_state: str, summary: bool) -> Dict[str, Any]:
+        """
+        :return: A dump entry with the loop state and no tasks
+        """
+        if summary:
+            return {"loop_state": loop_state, "task_counts": {}}
+        return {"loop_state": loop_state, "tasks": []}
+
+    def _get_probe_entry(self, executor: AsyncioExecutor, future: Future, summary: bool) -> Dict[str, Any]:
+        """
+        :param executor: The probed executor
+        :param future: The probe, done or not
+        :param summary: True for a summary dump
+        :return: The dump entry for the executor
+        """
+        if not future.done():
+            if future.cancel():
+                return self._new_unresponsive_entry(executor, summary)
+            # Too late to cancel: the probe already ran, and its result is on its way.
+            wait_for_futures([future], timeout=self.PROBE_RESULT_GRACE_SECONDS)
+            if not future.done():
+                return self._new_unresponsive_entry(executor, summary)
+        entry: Dict[str, Any]
+        if future.cancelled() or future.exception() is not None:
+            exc: Optional[BaseException] = None if future.cancelled() else future.exception()
+            entry = self._new_dump_entry("probe_error", summary)
+            entry["error"] = "CancelledError: probe cancelled" if exc is None else f"{type(exc).__name__}: {exc}"
+            return entry
+        entry = self._new_dump_entry("responded", summary)
+        entry["task_counts" if summary else "tasks"] = future.result()
+        return entry
+
+    def _new_unresponsive_entry(self, executor: AsyncioExecutor, summary: bool) -> Dict[str, Any]:
+        """
+        :param executor: The executor whose loop did not deliver its probe result in time
+        :param summary: True for a summary dump
+        :return: The dump entry for the executor, with the current stack of its thread
+                 unless this is a summary dump
+        """
+        entry: Dict[str, Any] = self._new_dump_entry("unresponsive_timeout", summary)
+        if not summary:
+            entry["thread_stack"] = LoopStallWatchdog.capture_thread_stack(executor.get_loop_thread_id())
+        return entry
+
+    @staticmethod
+    def _get_coro_name(task: Task) -> str:
+        """
+        :return: The qualname of the coroutine of the task
+        """
+        coro = task.get_coro()
+        return getattr(coro, "__qualname__", repr(coro))
+
+    @staticmethod
+    async def _count_tasks_on_current_loop() -> Dict[str, int]:
+        """
+        Summary probe coroutine scheduled onto each target loop:
+        counts the tasks on that loop by coroutine qualname, most frequent first,
+        leaving the probe itself out.
+        """
+        me: Optional[Task] = current_task()
+        counts: Counter = Counter(AsyncioExecutorPool._get_coro_name(task)
+                                  for task in all_tasks() if task is not me)
+        return dict(counts.most_common())
+
     @staticmethod
     async def _collect_tasks_on_current_loop() -> List[Dict[str, Any]]:
         """
@@ -398,7 +1077,6 @@ class AsyncioExecutorPool:
         for task in all_tasks():
             if me is not None and task is me:
                 continue
-            coro = task.get_coro()
             stack_frames: List[Dict[str, Any]] = []
             for frame in task.get_stack():
                 stack_frames.append({
@@ -408,7 +1086,7 @@ class AsyncioExecutorPool:
                 })
             tasks_info.append({
                 "name": task.get_name(),
-                "coro": getattr(coro, "__qualname__", repr(coro)),
+                "coro": AsyncioExecutorPool._get_coro_name(task),
                 "done": task.done(),
                 "cancelled": task.cancelled(),
                 "stack": stack_frames,
@@ -431,10 +1109,19 @@ class AsyncioExecutorPool:
         for executor_key, entry in dump.items():
             loop_state: str = entry.get("loop_state", "unknown")
             tasks: List[Dict[str, Any]] = entry.get("tasks", [])
+            task_counts: Dict[str, int] = entry.get("task_counts", {})
+            num_tasks: int = sum(task_counts.values()) if "task_counts" in entry else len(tasks)
             lines.append(f"== executor {executor_key}  loop_state={loop_state}  "
-                         f"tasks={len(tasks)} ==")
+                         f"tasks={num_tasks} ==")
             if loop_state == "probe_error":
                 lines.append(f"   probe_error: {entry.get('error')}")
+            if entry.get("thread_stack"):
+                lines.append("   loop thread stack:")
+                for frame in entry["thread_stack"]:
+                    lines.append(f"      File \"{frame['file']}\", "
+                                 f"line {frame['line']}, in {frame['func']}")
+            for coro, count in task_counts.items():
+                lines.append(f"  - {count:6d}  {coro}")
             for task in tasks:
                 lines.append(f"  - name={task['name']!r}  coro={task['coro']}  "
                              f"done={task['done']}  cancelled={task['cancelled']}")
@@ -0,0 +1,149 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import List
+from typing import Tuple
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from logging import getLogger
+from logging import Logger
+from multiprocessing import get_context
+from os import getpid
+from threading import Lock
+
+
+class AsyncioProcessPoolExecutor(ProcessPoolExecutor):
+    """
+    Class instrumenting a ProcessPoolExecutor with run-time metrics
+    matching those of AsyncioThreadPoolExecutor.
+
+    An AsyncioExecutor given one of these runs synchronous functions
+    marked with cpu_bound() in worker processes instead of worker threads,
+    so CPU-heavy work does not hold the GIL against the event loop thread.
+    Functions and their arguments must be picklable.
+
+    The AsyncioExecutor does not own this pool: one instance can be shared
+    by several executors, and whoever creates it is responsible for shutting it down.
+    """
+
+    CPU_BOUND_ATTRIBUTE: str = "leaf_common_cpu_bound"
+
+    DEFAULT_START_METHOD: str = "spawn"
+
+    def __init__(self, *args, warm_start: bool = False, **kwargs):
+        """
+        Constructor.
+        Arguments other than those below are passed on to ProcessPoolExecutor.
+
+        When no mp_context is given, worker processes are started with the
+        "spawn" start method instead of the platform default, since forking
+        a process which already runs AsyncioExecutor event loop threads
+        is not safe.
+
+        :param warm_start: True if all worker processes are to be started
+                    by the constructor, instead of on demand when the first
+                    functions are submitted. Default is False.
+        """
+        # mp_context is the second positional argument of ProcessPoolExecutor
+        if len(args) < 2 and kwargs.get("mp_context") is None:
+            kwargs["mp_context"] = get_context(self.DEFAULT_START_METHOD)
+        super().__init__(*args, **kwargs)
+        self.running: int = 0
+        self.lock = Lock()
+        self.logger: Logger = getLogger(self.__class__.__name__)
+        self.no_processes_warning_logged: bool = False
+        if warm_start:
+            self.warm_up()
+
+    @staticmethod
+    def cpu_bound(function):
+        """
+        Decorator/marker for synchronous functions which should be run
+        in a process pool when submitted to an AsyncioExecutor that has one.
+        The function is returned as-is, so it stays picklable.
+
+        :param function: The function to mark
+        :return: The same function
+        """
+        setattr(function, AsyncioProcessPoolExecutor.CPU_BOUND_ATTRIBUTE, True)
+        return function
+
+    @staticmethod
+    def is_cpu_bound(function) -> bool:
+        """
+        :param function: The function handle to check
+        :return: True if the function was marked with cpu_bound()
+        """
+        return getattr(function, AsyncioProcessPoolExecutor.CPU_BOUND_ATTRIBUTE, False) is True
+
+    def submit(self, fn, /, *args, **kwargs):
+        """
+        Override of submit method to count the number of submitted functions
+        which have not finished yet.
+        """
+        with self.lock:
+            self.running += 1
+        try:
+            future: Future = super().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._function_done()
+            raise
+        future.add_done_callback(self._function_done)
+        return future
+
+    def _function_done(self, _future: Future = None):
+        with self.lock:
+            self.running -= 1
+
+    def warm_up(self, timeout: float = None) -> int:
+        """
+        Start the worker processes ahead of need, so the first
+        CPU-bound submissions do not pay process startup costs.
+
+        :param timeout: Maximum number of seconds to wait for the processes to start.
+                    Default of None implies waiting until they are up.
+        :return: The number of distinct worker processes which responded
+        """
+        max_workers: int = getattr(self, "_max_workers", 1)
+        warm_futures: List[Future] = [self.submit(getpid) for _ in range(max_workers)]
+        done, _ = wait(warm_futures, timeout=timeout)
+        return len({future.result() for future in done if future.exception() is None})
+
+    def get_processes_metrics(self) -> Tuple[int, int]:
+        """
+        Get number of processes in the pool and number of submitted functions
+        which have not finished yet.
+         :return: Tuple of (number of processes in the pool, number of unfinished functions)
+         Note: unlike the threads case, functions waiting for a free worker process
+               are counted as unfinished too, since worker processes cannot be observed
+               from here. Number of processes in the pool is read from the protected
+               member _processes, which may not be available in all implementations
+               of ProcessPoolExecutor.
+        """
+        num_processes: int = 0
+        if hasattr(self, "_processes"):
+            num_processes = len(self._processes or {})
+        elif not self.no_processes_warning_logged:
+            self.logger.warning("ProcessPoolExecutor does not have _processes attribute, "
+                                "number of processes in the pool will be reported as 0")
+            self.no_processes_warning_logged = True
+        with self.lock:
+            return num_processes, self.running
@@ -19,11 +19,15 @@ See class comment for details.
 """
 from typing import Callable
 from typing import Optional
+from typing import Tuple
 
 import asyncio
 import sys
 
 from asyncio import AbstractEventLoop
+from importlib import import_module
+from logging import getLogger
+from os import environ
 
 
 class EventLoopFactory:
@@ -36,6 +40,15 @@ class EventLoopFactory:
     asyncio.set_event_loop_policy() pattern (using asyncio.WindowsSelectorEventLoopPolicy
     on Windows), which is deprecated in Python 3.14 and slated for removal.
 
+    The event loop implementation can also be chosen, either per call
+    or process-wide with the LEAF_EVENT_LOOP environment variable:
+      - "auto" (the default): use uvloop if it is installed, otherwise as above.
+      - "uvloop": use uvloop. Falls back to the above with a warning
+            if uvloop is not installed.
+      - "asyncio": always use asyncio's own loop as above.
+    uvloop is an optional dependency which is not installed along with leaf-common,
+    and it is never used on Windows, where it is not supported.
+
     Two entry points are provided so callers can pick what matches their
     existing call site:
       - loop_factory(): returns a callable suitable for the loop_factory=
@@ -50,9 +63,19 @@ class EventLoopFactory:
             thread before frameworks (e.g. Tornado) wrap it.
     """
 
+    ENV_VAR: str = "LEAF_EVENT_LOOP"
+
+    IMPLEMENTATION_AUTO: str = "auto"
+    IMPLEMENTATION_UVLOOP: str = "uvloop"
+    IMPLEMENTATION_ASYNCIO: str = "asyncio"
+    IMPLEMENTATIONS: Tuple[str, ...] = (IMPLEMENTATION_AUTO, IMPLEMENTATION_UVLOOP, IMPLEMENTATION_ASYNCIO)
+
     @staticmethod
-    def loop_factory() -> Optional[Callable[[], AbstractEventLoop]]:
+    def loop_factory(implementation: str = None) -> Optional[Callable[[], AbstractEventLoop]]:
         """
+        :param implementation: One of the IMPLEMENTATION_* constants above.
+                 Default of None uses the LEAF_EVENT_LOOP environment variable,
+                 or IMPLEMENTATION_AUTO if that is not set.
         :return: A callable that constructs a platform-appropriate event
                  loop, or None if asyncio's default is appropriate. None is
                  the documented value asyncio.run() and asyncio.Runner()
@@ -60,19 +83,51 @@ class EventLoopFactory:
                  value of this method can be forwarded unchanged on any
                  platform.
         """
+        # Validated first, so a bad name is an error on every platform
+        implementation = EventLoopFactory.get_implementation(implementation)
         if sys.platform == "win32":
             return asyncio.SelectorEventLoop
-        return None
+
+        if implementation == EventLoopFactory.IMPLEMENTATION_ASYNCIO:
+            return None
+
+        try:
+            uvloop = import_module("uvloop")
+        except ImportError:
+            if implementation == EventLoopFactory.IMPLEMENTATION_UVLOOP:
+                getLogger(EventLoopFactory.__name__).warning(
+                    "uvloop event loop requested but uvloop is not installed. Using asyncio event loop.")
+            return None
+        return uvloop.new_event_loop
 
     @staticmethod
-    def new_event_loop() -> AbstractEventLoop:
+    def new_event_loop(implementation: str = None) -> AbstractEventLoop:
         """
+        :param implementation: One of the IMPLEMENTATION_* constants above.
+                 Default of None uses the LEAF_EVENT_LOOP environment variable,
+                 or IMPLEMENTATION_AUTO if that is not set.
         :return: A newly-constructed event loop appropriate for the current
                  platform. On Windows this is a SelectorEventLoop; on other
-                 platforms it is the loop type returned by
-                 asyncio.new_event_loop().
+                 platforms it is a uvloop loop when selected and available,
+                 otherwise the loop type returned by asyncio.new_event_loop().
         """
-        factory: Optional[Callable[[], AbstractEventLoop]] = EventLoopFactory.loop_factory()
+        factory: Optional[Callable[[], AbstractEventLoop]] = EventLoopFactory.loop_factory(implementation)
         if factory is not None:
             return factory()
         return asyncio.new_event_loop()
+
+    @staticmethod
+    def get_implementation(implementation: str = None) -> str:
+        """
+        :param implementation: One of the IMPLEMENTATION_* constants above, or None
+        :return: The event loop implementation to use: the given one if not None,
+                 else the one from the LEAF_EVENT_LOOP environment variable,
+                 else IMPLEMENTATION_AUTO.
+        """
+        if implementation is None:
+            implementation = environ.get(EventLoopFactory.ENV_VAR, EventLoopFactory.IMPLEMENTATION_AUTO)
+        implementation = implementation.strip().lower()
+        if implementation not in EventLoopFactory.IMPLEMENTATIONS:
+            raise ValueError(f"Event loop implementation must be one of {EventLoopFactory.IMPLEMENTATIONS},"
+                             f" not {implementation}")
+        return implementation
@@ -0,0 +1,104 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Callable
+from typing import Optional
+
+from asyncio import CancelledError
+from asyncio import Future
+from asyncio import ensure_future
+from asyncio import shield
+from asyncio import to_thread
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+
+
+class ExecutorLease:
+    """
+    Context manager holding an AsyncioExecutor from a pool for the duration
+    of a with or async with block, as returned by AsyncioExecutorPool.lease().
+    The executor is always returned on exit, exceptions or not,
+    so it cannot leak from the pool.
+
+        with pool.lease(timeout=2.0) as executor:
+            executor.submit(...)
+
+        async with pool.lease(timeout=2.0) as executor:
+            executor.submit(...)
+
+    With async with, getting and returning the executor, which can both block,
+    happen in a worker thread, so the caller's event loop is not held up.
+    Neither is undone by the caller being cancelled: an executor acquired
+    for a cancelled caller is returned, and a return under way is completed.
+
+    A lease can only be entered once at a time.
+    """
+
+    def __init__(self, acquire: Callable[[], AsyncioExecutor], release: Callable[[AsyncioExecutor], None]):
+        """
+        Constructor
+        :param acquire: Function getting an executor from the pool
+        :param release: Function returning the executor to the pool
+        """
+        self._acquire: Callable[[], AsyncioExecutor] = acquire
+        self._release: Callable[[AsyncioExecutor], None] = release
+        self.executor: Optional[AsyncioExecutor] = None
+
+    def __enter__(self) -> AsyncioExecutor:
+        self._check_not_entered()
+        self.executor = self._acquire()
+        return self.executor
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        executor: AsyncioExecutor = self.executor
+        self.executor = None
+        self._release(executor)
+
+    async def __aenter__(self) -> AsyncioExecutor:
+        self._check_not_entered()
+        acquiring: Future = ensure_future(to_thread(self._acquire))
+        try:
+            self.executor = await shield(acquiring)
+        except CancelledError:
+            # Still return the executor, should it be acquired after all.
+            acquiring.add_done_callback(self._release_abandoned)
+            raise
+        return self.executor
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        executor: AsyncioExecutor = self.executor
+        self.executor = None
+        releasing: Future = ensure_future(to_thread(self._release, executor))
+        # The executor goes back to the pool even if we are cancelled meanwhile.
+        await shield(releasing)
+
+    def _release_abandoned(self, acquiring: Future):
+        """
+        Intended as a "done_callback": return an executor acquired for a caller who gave up.
+        :param acquiring: The Future of the acquisition
+        """
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self._release(acquiring.result())
+
+    def _check_not_entered(self):
+        """
+        Refuse to hold two executors with the same lease.
+        """
+        if self.executor is not None:
+            raise RuntimeError("Executor lease is already in use")
@@ -0,0 +1,37 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+
+
+class ExecutorPoolExhaustedException(Exception):
+    """
+    Exception raised when an AsyncioExecutorPool already has as many
+    executors as its max_size allows, and none is returned to it in time.
+    """
+
+    def __init__(self, max_size: int, timeout: float):
+        """
+        Constructor.
+
+        :param max_size: The maximum number of executors of the pool
+        :param timeout: The number of seconds waited for an executor to be returned
+        """
+        Exception.__init__(self, f"All {max_size} executors of the pool are in use after waiting {timeout} sec")
+        self.max_size: int = max_size
+        self.timeout: float = timeout
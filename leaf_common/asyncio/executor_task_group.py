@@ -0,0 +1,197 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from asyncio import wait as async_wait
+from asyncio import wrap_future
+from concurrent import futures
+from threading import Lock
+from threading import get_ident
+
+if TYPE_CHECKING:
+    # Only for annotations: AsyncioExecutor itself imports this module.
+    from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+
+
+class ExecutorTaskGroup:
+    """
+    Handle on a group of tasks submitted to an AsyncioExecutor together,
+    typically the fan-out of one request, as returned by AsyncioExecutor.submit_group().
+
+    The group can be waited on until all or the first of its tasks are done,
+    and cancelled without affecting any other tasks on the executor,
+    unlike AsyncioExecutor.cancel_current_tasks().
+    The group only holds the result Futures of its own tasks,
+    so none of this needs to look through the executor's background tasks table.
+
+    Used as a context manager, any tasks of the group still unfinished
+    on exit are cancelled, so the fan-out never outlives its block:
+
+        with executor.submit_group("request-1") as group:
+            group.submit(fetch, "a")
+            group.submit(fetch, "b")
+            done, _ = group.wait(timeout=2.0)
+
+    Methods are safe to call from any thread, but the synchronous wait()
+    must not be called from the executor's own event loop thread: use wait_async() there.
+    """
+
+    # Values for the return_when argument of wait() and wait_async()
+    ALL_COMPLETED: str = futures.ALL_COMPLETED
+    FIRST_COMPLETED: str = futures.FIRST_COMPLETED
+    FIRST_EXCEPTION: str = futures.FIRST_EXCEPTION
+
+    def __init__(self, executor: "AsyncioExecutor", submitter_id: str):
+        """
+        Constructor
+        :param executor: The AsyncioExecutor to submit the group's tasks to
+        :param submitter_id: A string id denoting who is doing the submitting,
+                    used for all the tasks of the group.
+        """
+        self.executor: "AsyncioExecutor" = executor
+        self.submitter_id: str = submitter_id
+        self._futures: List[futures.Future] = []
+        self._cancelled: bool = False
+        self._lock = Lock()
+
+    def submit(self, function, /, *args, priority: int = None, timeout: float = None,
+               **kwargs) -> futures.Future:
+        """
+        Submit a function to be run in the executor as part of this group.
+        See AsyncioExecutor.submit_nowait().
+
+        :param function: The function handle to run
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param priority: The TaskPriority of the task. Default of None implies NORMAL.
+                    Note this is keyword-only and is not passed on to the function.
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout.
+                    Note this is keyword-only and is not passed on to the function.
+        :param kwargs: keyword args for the function
+        :return: A concurrent.futures.Future which will hold the result
+                 (or exception) of the submitted function
+        """
+        self._check_not_cancelled()
+        result_future: futures.Future = self.executor.submit_nowait(self.submitter_id, function, *args,
+                                                                    priority=priority, timeout=timeout, **kwargs)
+        self._add([result_future])
+        return result_future
+
+    def submit_many(self, submissions: Sequence[Tuple[Any, Sequence[Any], Dict[str, Any]]],
+                    priority: int = None, timeout: float = None) -> List[futures.Future]:
+        """
+        Submit a batch of functions to be run in the executor as part of this group.
+        See AsyncioExecutor.submit_many() with result_futures=True.
+
+        :param submissions: A sequence of (function, args, kwargs) tuples,
+                    one per task to submit. args and kwargs may be None.
+        :param priority: The TaskPriority of all the tasks. Default of None implies NORMAL.
+        :param timeout: Seconds after submission at which to cancel each task.
+                    Default of None implies no timeout.
+        :return: A list of result Futures, in the order of submissions
+        """
+        self._check_not_cancelled()
+        result_futures: List[futures.Future] = self.executor.submit_many(self.submitter_id, submissions,
+                                                                         result_futures=True, priority=priority,
+                                                                         timeout=timeout)
+        self._add(result_futures)
+        return result_futures
+
+    def get_futures(self) -> List[futures.Future]:
+        """
+        :return: The result Futures of all the tasks submitted to the group so far,
+                 in order of submission
+        """
+        with self._lock:
+            return list(self._futures)
+
+    def wait(self, timeout: float = None,
+             return_when: str = ALL_COMPLETED) -> Tuple[Set[futures.Future], Set[futures.Future]]:
+        """
+        Wait for the tasks of the group submitted so far, as per concurrent.futures.wait().
+        Must not be called from the executor's event loop thread.
+        :param timeout: Maximum number of seconds to wait. Default of None implies waiting forever.
+        :param return_when: One of ALL_COMPLETED (the default), FIRST_COMPLETED or FIRST_EXCEPTION
+        :return: A tuple of (set of done result Futures, set of not done result Futures).
+                 Tasks not done are left running: see cancel().
+        """
+        if get_ident() == self.executor.get_loop_thread_id():
+            raise RuntimeError("wait() would deadlock when called from the event loop thread, use wait_async()")
+        return futures.wait(self.get_futures(), timeout=timeout, return_when=return_when)
+
+    async def wait_async(self, timeout: float = None,
+                         return_when: str = ALL_COMPLETED) -> Tuple[Set[futures.Future], Set[futures.Future]]:
+        """
+        Same as wait(), but from a coroutine on any event loop, including the executor's own.
+        :param timeout: Maximum number of seconds to wait. Default of None implies waiting forever.
+        :param return_when: One of ALL_COMPLETED (the default), FIRST_COMPLETED or FIRST_EXCEPTION
+        :return: A tuple of (set of done result Futures, set of not done result Futures).
+        """
+        result_futures: List[futures.Future] = self.get_futures()
+        if not result_futures:
+            return set(), set()
+        wrapped: Dict[Any, futures.Future] = {wrap_future(result_future): result_future
+                                              for result_future in result_futures}
+        done, not_done = await async_wait(wrapped.keys(), timeout=timeout, return_when=return_when)
+        return {wrapped[future] for future in done}, {wrapped[future] for future in not_done}
+
+    def cancel(self) -> int:
+        """
+        Cancel all the unfinished tasks of this group, and no others.
+        Further submissions to the group are refused.
+        :return: The number of tasks cancelled
+        """
+        with self._lock:
+            self._cancelled = True
+            result_futures: List[futures.Future] = list(self._futures)
+        return sum(1 for result_future in result_futures if result_future.cancel())
+
+    def __enter__(self) -> "ExecutorTaskGroup":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cancel()
+
+    def _add(self, result_futures: List[futures.Future]):
+        """
+        :param result_futures: Result Futures of newly submitted tasks of the group
+        """
+        with self._lock:
+            self._futures.extend(result_futures)
+            cancelled: bool = self._cancelled
+        if cancelled:
+            # cancel() was called while these were being submitted
+            for result_future in result_futures:
+                result_future.cancel()
+
+    def _check_not_cancelled(self):
+        """
+        Refuse submissions to a cancelled group.
+        """
+        if self._cancelled:
+            raise RuntimeError(f"Task group of {self.submitter_id} is already cancelled")
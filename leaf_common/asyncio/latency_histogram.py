@@ -0,0 +1,126 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from bisect import bisect_left
+from itertools import accumulate
+from itertools import repeat
+from operator import mul
+
+
+class LatencyHistogram:
+    """
+    Streaming histogram of durations in seconds, with logarithmically
+    spaced buckets. Recording a sample is O(log buckets) and memory use
+    is fixed no matter how many samples are recorded, so instances can be
+    kept per submitter and read often.
+
+    Percentiles are estimated from bucket upper bounds, so they are
+    accurate to within one bucket: about 19% relative error with the
+    default of 4 buckets per doubling.
+
+    Not thread-safe: callers are expected to provide their own locking.
+    """
+
+    # Smallest bucket upper bound, in seconds
+    MIN_SECONDS: float = 1e-6
+
+    BUCKETS_PER_DOUBLING: int = 4
+
+    # 30 doublings from 1 microsecond covers up to about 15 minutes.
+    # Anything longer lands in a final overflow bucket.
+    NUM_BUCKETS: int = 30 * BUCKETS_PER_DOUBLING
+
+    # Geometric series of bucket upper bounds starting at MIN_SECONDS
+    BUCKET_BOUNDS: List[float] = list(accumulate(repeat(2.0 ** (1.0 / BUCKETS_PER_DOUBLING), NUM_BUCKETS - 1),
+                                                 mul, initial=MIN_SECONDS))
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        # One more count than there are bounds, for the overflow bucket
+        self.counts: List[int] = [0] * (self.NUM_BUCKETS + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, seconds: float):
+        """
+        :param seconds: The duration to record. Negative values are clamped to 0.
+        """
+        seconds = max(0.0, seconds)
+        self.counts[bisect_left(self.BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def get_percentile(self, fraction: float) -> float:
+        """
+        :param fraction: The percentile to estimate as a fraction, e.g. 0.95 for p95
+        :return: The estimated percentile in seconds. 0.0 if nothing was recorded.
+        """
+        if self.count == 0:
+            return 0.0
+        # Rank of the sample we are after, counting from 1
+        rank: int = max(1, min(self.count, int(fraction * self.count + 0.5)))
+        cumulative: int = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                if index >= self.NUM_BUCKETS:
+                    return self.max
+                return min(self.BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    def get_cumulative_buckets(self, step: int = BUCKETS_PER_DOUBLING) -> List[Tuple[float, int]]:
+        """
+        :param step: Only report every step-th bucket bound, to keep the result short.
+                    Default of BUCKETS_PER_DOUBLING reports one bound per doubling.
+        :return: A list of (upper bound in seconds, number of samples <= that bound) pairs,
+                 ending with (infinity, count), as Prometheus histogram buckets are.
+        """
+        result: List[Tuple[float, int]] = []
+        cumulative: int = 0
+        for index in range(self.NUM_BUCKETS):
+            cumulative += self.counts[index]
+            if index % step == 0:
+                result.append((self.BUCKET_BOUNDS[index], cumulative))
+        result.append((float("inf"), self.count))
+        return result
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary summary of the recorded durations in milliseconds,
+                 with the same key names as EventLoopLagMonitor uses:
+                 "count", "mean_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms"
+        """
+        mean: float = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": mean * 1000,
+            "max_ms": self.max * 1000,
+            "p50_ms": self.get_percentile(0.50) * 1000,
+            "p95_ms": self.get_percentile(0.95) * 1000,
+            "p99_ms": self.get_percentile(0.99) * 1000,
+        }
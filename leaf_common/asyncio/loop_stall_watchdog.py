@@ -0,0 +1,264 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import sys
+
+from asyncio import AbstractEventLoop
+from collections import deque
+from logging import getLogger
+from logging import Logger
+from threading import Event
+from threading import Lock
+from threading import Thread
+from time import monotonic
+from time import time
+from traceback import extract_stack
+
+
+class LoopStallWatchdog:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Watchdog thread noticing event loops which stop responding,
+    and capturing what their threads are doing at the time.
+
+    Every interval_seconds the watchdog posts a ping to each watched loop
+    with call_soon_threadsafe(). A loop which has not run its ping within
+    stall_threshold_seconds is stalled, most likely wedged in synchronous code,
+    and the watchdog captures the Python stack of the loop's thread
+    with sys._current_frames(). There is at most one capture per stall,
+    and at most one every min_capture_interval_seconds per loop.
+    The most recent captures are kept in a bounded ring buffer,
+    which get_stalls() returns for a debug endpoint or a log.
+
+    One watchdog can watch any number of loops, for instance all
+    the executors of an AsyncioExecutorPool. Its thread is a daemon
+    started on the first watch(); call stop() when done with it.
+    """
+
+    DEFAULT_INTERVAL_SECONDS: float = 0.5
+    DEFAULT_STALL_THRESHOLD_SECONDS: float = 1.0
+    DEFAULT_MIN_CAPTURE_INTERVAL_SECONDS: float = 10.0
+    DEFAULT_MAX_CAPTURES: int = 32
+
+    def __init__(self, interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+                 stall_threshold_seconds: float = DEFAULT_STALL_THRESHOLD_SECONDS,
+                 min_capture_interval_seconds: float = DEFAULT_MIN_CAPTURE_INTERVAL_SECONDS,
+                 max_captures: int = DEFAULT_MAX_CAPTURES):
+        """
+        Constructor
+        :param interval_seconds: Time between pings of each loop
+        :param stall_threshold_seconds: How late a ping has to be for its loop to count as stalled
+        :param min_capture_interval_seconds: Minimum time between stack captures for the same loop
+        :param max_captures: Number of most recent stack captures to keep
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        if stall_threshold_seconds <= 0:
+            raise ValueError("stall_threshold_seconds must be > 0")
+        if max_captures < 1:
+            raise ValueError("max_captures must be >= 1")
+        self.interval_seconds: float = interval_seconds
+        self.stall_threshold_seconds: float = stall_threshold_seconds
+        self.min_capture_interval_seconds: float = min_capture_interval_seconds
+        # Watched loops keyed by name. Accessed from the watchdog thread
+        # and from the watched loops' threads, so protected by _lock.
+        self._loops: Dict[str, Dict[str, Any]] = {}
+        self._captures: Deque[Dict[str, Any]] = deque(maxlen=max_captures)
+        self._stalls: int = 0
+        self._suppressed: int = 0
+        self._lock = Lock()
+        self._stop_event: Event = Event()
+        self._thread: Optional[Thread] = None
+        self.logger: Logger = getLogger(self.__class__.__name__)
+
+    def watch(self, name: str, loop: AbstractEventLoop, thread_id: int):
+        """
+        Start watching an event loop, starting the watchdog thread if need be.
+        :param name: A name for the loop, unique within this watchdog
+        :param loop: The running event loop to watch
+        :param thread_id: The ident of the thread running the loop
+        """
+        with self._lock:
+            self._loops[name] = {
+                "loop": loop,
+                "thread_id": thread_id,
+                "ping_sent": None,
+                "capture": None,
+                "stalled": False,
+                "last_capture": None,
+            }
+            if self._thread is None and not self._stop_event.is_set():
+                self._thread = Thread(target=self._run, name=f"LoopStallWatchdog-{id(self)}", daemon=True)
+                self._thread.start()
+
+    def unwatch(self, name: str):
+        """
+        Stop watching an event loop. Unknown names are ignored.
+        :param name: The name the loop was watched under
+        """
+        with self._lock:
+            self._loops.pop(name, None)
+
+    def stop(self, wait: bool = True):
+        """
+        Stop the watchdog thread. Idempotent.
+        :param wait: True if we should wait for the watchdog thread to finish
+        """
+        with self._lock:
+            thread: Optional[Thread] = self._thread
+            self._thread = None
+        self._stop_event.set()
+        if wait and thread is not None:
+            thread.join()
+
+    def get_stalls(self) -> List[Dict[str, Any]]:
+        """
+        :return: A list of the most recent stack captures, oldest first.
+                Each is a dictionary with:
+                "loop": the name of the stalled loop,
+                "captured_at": wall clock time.time() of the capture,
+                "stalled_seconds": how long the loop had been unresponsive at the time,
+                "stall_seconds": how long the stall lasted in all, or None if it is ongoing,
+                "stack": list of {"file", "line", "func"} frames of the loop thread, outermost first.
+        """
+        with self._lock:
+            return [dict(capture) for capture in self._captures]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary with the number of "loops" watched,
+                and the total number of "stalls" seen, "captures" taken
+                and captures "suppressed" by rate limiting.
+        """
+        with self._lock:
+            return {
+                "loops": len(self._loops),
+                "stalls": self._stalls,
+                "captures": self._stalls - self._suppressed,
+                "suppressed": self._suppressed,
+            }
+
+    @staticmethod
+    def capture_thread_stack(thread_id: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        :param thread_id: The ident of a thread of this process
+        :return: The current Python stack of the thread as a list of
+                {"file", "line", "func"} frames, outermost first.
+                Empty if there is no such thread.
+        """
+        # pylint: disable=protected-access
+        frame = sys._current_frames().get(thread_id) if thread_id is not None else None
+        if frame is None:
+            return []
+        return [{"file": summary.filename, "line": summary.lineno, "func": summary.name}
+                for summary in extract_stack(frame)]
+
+    @staticmethod
+    def format_stalls(stalls: List[Dict[str, Any]]) -> str:
+        """
+        Render the output of get_stalls() as a printable multi-line string.
+        :param stalls: A list returned by get_stalls()
+        :return: A human-readable multi-line string
+        """
+        if not stalls:
+            return "(no stalls captured)"
+        lines: List[str] = []
+        for capture in stalls:
+            lasted: str = "ongoing" if capture["stall_seconds"] is None else f"{capture['stall_seconds']:.3f}s"
+            lines.append(f"== loop {capture['loop']}  stalled={capture['stalled_seconds']:.3f}s  "
+                         f"lasted={lasted} ==")
+            for frame in capture["stack"]:
+                lines.append(f"      File \"{frame['file']}\", line {frame['line']}, in {frame['func']}")
+        return "\n".join(lines)
+
+    def _run(self):
+        """
+        Watchdog thread loop: check all loops every interval until stopped.
+        """
+        while not self._stop_event.wait(self.interval_seconds):
+            self._check_once(monotonic())
+
+    def _check_once(self, now: float):
+        """
+        Ping every watched loop which has answered its last ping,
+        and capture the stacks of those which have not answered in time.
+        :param now: The current time.monotonic()
+        """
+        with self._lock:
+            for name, entry in list(self._loops.items()):
+                if entry["ping_sent"] is None:
+                    try:
+                        entry["loop"].call_soon_threadsafe(self._pong, name, now)
+                    except RuntimeError:
+                        # Loop is closed: nothing left to watch.
+                        del self._loops[name]
+                        continue
+                    entry["ping_sent"] = now
+                elif not entry["stalled"] and now - entry["ping_sent"] >= self.stall_threshold_seconds:
+                    self._stall_detected(name, entry, now)
+
+    def _stall_detected(self, name: str, entry: Dict[str, Any], now: float):
+        """
+        Count a new stall and capture the loop thread's stack, unless rate limited.
+        Must be called with the lock held.
+        :param name: The name of the stalled loop
+        :param entry: The watched loop's entry
+        :param now: The current time.monotonic()
+        """
+        entry["stalled"] = True
+        self._stalls += 1
+        if entry["last_capture"] is not None and now - entry["last_capture"] < self.min_capture_interval_seconds:
+            self._suppressed += 1
+            return
+        entry["last_capture"] = now
+        entry["capture"] = {
+            "loop": name,
+            "captured_at": time(),
+            "stalled_seconds": now - entry["ping_sent"],
+            "stall_seconds": None,
+            "stack": self.capture_thread_stack(entry["thread_id"]),
+        }
+        self._captures.append(entry["capture"])
+        self.logger.warning("Event loop %s unresponsive for %.3f sec, stack captured",
+                            name, now - entry["ping_sent"])
+
+    def _pong(self, name: str, ping_sent: float):
+        """
+        Runs on the watched loop: the ping got through.
+        :param name: The name of the loop
+        :param ping_sent: The time.monotonic() the ping was sent at
+        """
+        with self._lock:
+            entry: Optional[Dict[str, Any]] = self._loops.get(name)
+            if entry is None or entry["ping_sent"] != ping_sent:
+                return
+            entry["ping_sent"] = None
+            if entry["stalled"]:
+                entry["stalled"] = False
+                stall_seconds: float = monotonic() - ping_sent
+                if entry["capture"] is not None:
+                    entry["capture"]["stall_seconds"] = stall_seconds
+                    entry["capture"] = None
+                self.logger.info("Event loop %s responsive again after %.3f sec", name, stall_seconds)
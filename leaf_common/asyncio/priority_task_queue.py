@@ -0,0 +1,153 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from heapq import heappop
+from heapq import heappush
+from logging import getLogger
+from logging import Logger
+from threading import Lock
+from time import monotonic
+
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+from leaf_common.asyncio.task_priority import TaskPriority
+
+
+class PriorityTaskQueue:
+    """
+    Thread-safe queue of callbacks to be run in an event loop thread
+    in order of TaskPriority, and first-come first-served within a priority.
+
+    The event loop's own ready queue is strictly first-in first-out,
+    so work scheduled with call_soon_threadsafe() one item at a time
+    cannot be reordered. Instead, producers put() callbacks here and only
+    schedule a run() of the queue when it was idle, so a burst of submissions
+    costs a single event loop wakeup and the most urgent ones run first.
+
+    Also keeps starvation metrics: how long callbacks of each priority
+    waited in the queue, how many waited longer than starvation_seconds,
+    and how long running tasks of each priority yielded to more urgent ones.
+    """
+
+    DEFAULT_STARVATION_SECONDS: float = 1.0
+
+    # Maximum number of callbacks to run per run() before letting
+    # other ready event loop callbacks (such as I/O) have a turn
+    MAX_BATCH: int = 256
+
+    def __init__(self, starvation_seconds: float = DEFAULT_STARVATION_SECONDS):
+        """
+        Constructor
+        :param starvation_seconds: Time waited in the queue beyond which
+                    a callback is counted as starved
+        """
+        self.starvation_seconds: float = starvation_seconds
+        self._lock = Lock()
+        # Heap of (priority, sequence, queued_at, callback)
+        self._heap: List[Tuple[int, int, float, Callable[[], None]]] = []
+        self._sequence: int = 0
+        self._run_scheduled: bool = False
+        self._stats: Dict[int, Dict[str, Any]] = {
+            priority: {
+                "queued": 0,
+                "dequeued": 0,
+                "starved": 0,
+                "queue_wait": LatencyHistogram(),
+                "yield_wait": LatencyHistogram(),
+            }
+            for priority in TaskPriority.PRIORITIES
+        }
+        self.logger: Logger = getLogger(self.__class__.__name__)
+
+    def put(self, priority: int, callback: Callable[[], None]) -> bool:
+        """
+        Can be called from any thread.
+        :param priority: One of the TaskPriority constants
+        :param callback: The no-argument callable to run in the event loop thread
+        :return: True if the caller is responsible for scheduling a run()
+                 in the event loop thread, because none is pending yet.
+        """
+        with self._lock:
+            self._sequence += 1
+            heappush(self._heap, (priority, self._sequence, monotonic(), callback))
+            self._stats[priority]["queued"] += 1
+            if self._run_scheduled:
+                return False
+            self._run_scheduled = True
+            return True
+
+    def run(self) -> bool:
+        """
+        Run queued callbacks, most urgent first. Called in the event loop thread.
+        Callbacks put() by other threads while this is running are picked up
+        in priority order too.
+        :return: True if callbacks remain after running a batch of MAX_BATCH,
+                 in which case the caller is responsible for scheduling another run().
+        """
+        for _ in range(self.MAX_BATCH):
+            with self._lock:
+                if not self._heap:
+                    self._run_scheduled = False
+                    return False
+                priority, _, queued_at, callback = heappop(self._heap)
+                waited: float = monotonic() - queued_at
+                stats: Dict[str, Any] = self._stats[priority]
+                stats["dequeued"] += 1
+                stats["queue_wait"].record(waited)
+                if waited > self.starvation_seconds:
+                    stats["starved"] += 1
+            try:
+                callback()
+            except Exception:  # pylint: disable=broad-except
+                # Keep going: the callbacks still queued would otherwise never run.
+                self.logger.exception("Queued callback raised")
+        return True
+
+    def record_yield(self, priority: int, waited: float):
+        """
+        Record a task yielding to more urgent ones.
+        :param priority: The TaskPriority of the yielding task
+        :param waited: The time in seconds the task yielded for
+        """
+        with self._lock:
+            self._stats[priority]["yield_wait"].record(waited)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: A dictionary keyed by priority name. Each value is a dictionary with
+                "waiting" (callbacks currently queued), "dequeued" (callbacks run so far),
+                "starved" (callbacks which waited longer than starvation_seconds),
+                and "queue_wait" and "yield_wait" summaries as per LatencyHistogram.get_metrics().
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for priority, stats in self._stats.items():
+                result[TaskPriority.NAMES[priority]] = {
+                    "waiting": stats["queued"] - stats["dequeued"],
+                    "dequeued": stats["dequeued"],
+                    "starved": stats["starved"],
+                    "queue_wait": stats["queue_wait"].get_metrics(),
+                    "yield_wait": stats["yield_wait"].get_metrics(),
+                }
+        return result
@@ -0,0 +1,159 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from math import isinf
+from math import isnan
+
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+
+
+class PrometheusTextWriter:
+    """
+    Builds metrics in the Prometheus text exposition format, version 0.0.4,
+    which a web handler can serve as is with CONTENT_TYPE:
+
+        writer = PrometheusTextWriter("myservice", {"pool": "default"})
+        writer.add_counter("requests", "Requests handled.", 42)
+        writer.add_histogram("request_seconds", "Request latency.", histogram)
+        text = writer.get_text()
+
+    Samples of the same metric can be added with different labels in any order:
+    they are grouped under one HELP and TYPE header on output.
+
+    Not thread-safe: meant to be used by one caller for one scrape.
+    """
+
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+    COUNTER: str = "counter"
+    GAUGE: str = "gauge"
+    HISTOGRAM: str = "histogram"
+
+    def __init__(self, prefix: str = None, labels: Dict[str, str] = None):
+        """
+        Constructor
+        :param prefix: Optional prefix for all metric names, joined to them with an underscore
+        :param labels: Optional labels added to every sample, e.g. to tell pools apart
+        """
+        self.prefix: str = f"{prefix}_" if prefix else ""
+        self.labels: Dict[str, str] = labels or {}
+        # Maps metric name -> (type, help text, sample lines), in order of first use
+        self._families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def add_counter(self, name: str, help_text: str, value: float, labels: Dict[str, str] = None):
+        """
+        :param name: Metric name, to which "_total" is appended as per convention
+        :param help_text: One line description of the metric
+        :param value: The ever increasing count
+        :param labels: Optional labels of this sample
+        """
+        name = f"{self.prefix}{name}_total"
+        self._get_lines(name, self.COUNTER, help_text).append(self._format_sample(name, labels, value))
+
+    def add_gauge(self, name: str, help_text: str, value: float, labels: Dict[str, str] = None):
+        """
+        :param name: Metric name
+        :param help_text: One line description of the metric
+        :param value: The current value
+        :param labels: Optional labels of this sample
+        """
+        name = f"{self.prefix}{name}"
+        self._get_lines(name, self.GAUGE, help_text).append(self._format_sample(name, labels, value))
+
+    def add_histogram(self, name: str, help_text: str, histogram: LatencyHistogram,
+                      labels: Dict[str, str] = None):
+        """
+        :param name: Metric name, which should end with "_seconds" as per convention
+        :param help_text: One line description of the metric
+        :param histogram: The LatencyHistogram to report.
+                    Callers are expected to hold whatever lock protects it.
+        :param labels: Optional labels of this sample
+        """
+        name = f"{self.prefix}{name}"
+        lines: List[str] = self._get_lines(name, self.HISTOGRAM, help_text)
+        labels = labels or {}
+        for bound, count in histogram.get_cumulative_buckets():
+            # Bucket bounds are products of floats: keep their labels short and stable
+            upper: str = "+Inf" if isinf(bound) else f"{bound:.6g}"
+            bucket_labels: Dict[str, str] = dict(labels, le=upper)
+            lines.append(self._format_sample(f"{name}_bucket", bucket_labels, count))
+        lines.append(self._format_sample(f"{name}_sum", labels, histogram.total))
+        lines.append(self._format_sample(f"{name}_count", labels, histogram.count))
+
+    def get_text(self) -> str:
+        """
+        :return: All the metrics added so far, in the Prometheus text format
+        """
+        text: List[str] = []
+        for name, (metric_type, help_text, lines) in self._families.items():
+            text.append(f"# HELP {name} {self._escape(help_text, quotes=False)}")
+            text.append(f"# TYPE {name} {metric_type}")
+            text.extend(lines)
+        if not text:
+            return ""
+        return "\n".join(text) + "\n"
+
+    def _get_lines(self, name: str, metric_type: str, help_text: str) -> List[str]:
+        """
+        :return: The list of sample lines of a metric, created as needed
+        """
+        family: Tuple[str, str, List[str]] = self._families.get(name)
+        if family is None:
+            family = (metric_type, help_text, [])
+            self._families[name] = family
+        elif family[0] != metric_type:
+            raise ValueError(f"Metric {name} already added as a {family[0]}")
+        return family[2]
+
+    def _format_sample(self, name: str, labels: Dict[str, str], value: float) -> str:
+        """
+        :return: One sample line, with our own labels first
+        """
+        all_labels: Dict[str, str] = dict(self.labels, **(labels or {}))
+        if not all_labels:
+            return f"{name} {self._format_value(value)}"
+        pairs: str = ",".join(f'{key}="{self._escape(str(label))}"' for key, label in all_labels.items())
+        return f"{name}{{{pairs}}} {self._format_value(value)}"
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        """
+        :return: The value as the text format expects it
+        """
+        if isinstance(value, int):
+            return str(value)
+        if isnan(value):
+            return "NaN"
+        if isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+
+    @staticmethod
+    def _escape(text: str, quotes: bool = True) -> str:
+        """
+        :return: The text with backslashes, line feeds and, for label values, double quotes escaped
+        """
+        text = text.replace("\\", "\\\\").replace("\n", "\\n")
+        if quotes:
+            text = text.replace('"', '\\"')
+        return text
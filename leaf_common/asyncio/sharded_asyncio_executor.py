@@ -0,0 +1,245 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from asyncio import Task
+from os import cpu_count
+from threading import get_ident
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.executor_task_group import ExecutorTaskGroup
+from leaf_common.asyncio.event_loop_lag_monitor import EventLoopLagMonitor
+from leaf_common.asyncio.task_executor import TaskExecutor
+from leaf_common.utils.consistent_hash_ring import ConsistentHashRing
+
+
+class ShardedAsyncioExecutor(TaskExecutor):
+    """
+    TaskExecutor spreading its tasks over several AsyncioExecutor shards,
+    each with its own event loop on its own thread, so that event loop work
+    is not capped at what a single thread can do.
+
+    Each submission is routed by consistent hash of a routing key:
+    the submitter_id for submit() and create_task(), or any other key
+    (such as a session id) via get_shard(). Tasks with the same key
+    always land on the same shard, so related tasks share an event loop
+    and do not need cross-loop locking between them.
+    """
+
+    def __init__(self, num_shards: int = None, max_workers: int = None,
+                 monitor_lag: bool = False, **executor_kwargs):
+        """
+        Constructor
+
+        :param num_shards: Number of AsyncioExecutor shards (event loop threads).
+                    Default of None uses the number of CPUs.
+        :param max_workers: maximum number of threads to use for each shard
+                    for running synchronous functions
+        :param monitor_lag: True if an EventLoopLagMonitor is to be run on each
+                    shard, for get_lag_metrics(). Default is False.
+        :param executor_kwargs: Other keyword arguments passed on to each AsyncioExecutor
+        """
+        super().__init__()
+        if num_shards is None:
+            num_shards = cpu_count() or 1
+        self._shards: List[AsyncioExecutor] = [
+            AsyncioExecutor(max_workers=max_workers, **executor_kwargs)
+            for _ in range(num_shards)
+        ]
+        self._ring = ConsistentHashRing(num_shards)
+        self._lag_monitors: List[EventLoopLagMonitor] = []
+        if monitor_lag:
+            self._lag_monitors = [EventLoopLagMonitor() for _ in range(num_shards)]
+
+    def get_num_shards(self) -> int:
+        """
+        :return: The number of shards
+        """
+        return len(self._shards)
+
+    def get_shard(self, routing_key: Any) -> AsyncioExecutor:
+        """
+        :param routing_key: The key to route by, for instance a submitter_id or a session id.
+        :return: The AsyncioExecutor shard owning the routing key.
+                 Any of its methods can be used to submit work directly.
+        """
+        return self._shards[self._ring.get_slot(routing_key)]
+
+    def get_shards(self) -> List[AsyncioExecutor]:
+        """
+        :return: A copy of the list of all shards
+        """
+        return list(self._shards)
+
+    def get_event_loop(self) -> AbstractEventLoop:
+        """
+        :return: The event loop of the shard whose thread we are currently
+                 executing in, or None when called from any other thread,
+                 as there is no single event loop for this executor.
+        """
+        current: int = get_ident()
+        for shard in self._shards:
+            if shard.get_loop_thread_id() == current:
+                return shard.get_event_loop()
+        return None
+
+    def start(self):
+        """
+        Starts all the shards.
+        """
+        for shard in self._shards:
+            shard.start()
+        for shard, monitor in zip(self._shards, self._lag_monitors):
+            shard.initialize(monitor.start)
+
+    def initialize(self, init_function: Callable):
+        """
+        Call initializing function on the event loop of every shard
+        and wait for each to finish.
+        :param init_function: function to call.
+        """
+        for shard in self._shards:
+            shard.initialize(init_function)
+
+    def submit(self, submitter_id: str, function, /, *args, **kwargs) -> Task:
+        """
+        Submit a function to be run on the shard owning the submitter_id.
+
+        :param submitter_id: A string id denoting who is doing the submitting.
+                    Also used as the routing key.
+        :param function: The function handle to run
+        :param /: Positional or keyword arguments.
+            See https://realpython.com/python-asterisk-and-slash-special-parameters/
+        :param args: args for the function
+        :param kwargs: keyword args for the function
+        :return: An asyncio.Task bound to the shard's event loop
+        """
+        return self.get_shard(submitter_id).submit(submitter_id, function, *args, **kwargs)
+
+    def set_rate_limit(self, submitter_id: str, rate: float, burst: float = None):
+        """
+        Limit the rate at which tasks from a submitter start, on the shard owning the submitter_id.
+        See AsyncioExecutor.set_rate_limit().
+        :param submitter_id: A string id denoting who is doing the submitting.
+                    Also used as the routing key.
+        :param rate: Maximum average number of task starts per second
+        :param burst: Maximum number of task starts at once.
+                    Default of None implies max(1, rate).
+        """
+        self.get_shard(submitter_id).set_rate_limit(submitter_id, rate, burst)
+
+    def remove_rate_limit(self, submitter_id: str):
+        """
+        Stop limiting the rate at which tasks from a submitter start.
+        :param submitter_id: A string id denoting who is doing the submitting.
+                    Also used as the routing key.
+        """
+        self.get_shard(submitter_id).remove_rate_limit(submitter_id)
+
+    def get_rate_limit_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: The rate limit metrics of all shards, keyed by submitter_id.
+                 See AsyncioExecutor.get_rate_limit_metrics().
+        """
+        metrics: Dict[str, Dict[str, Any]] = {}
+        for shard in self._shards:
+            metrics.update(shard.get_rate_limit_metrics())
+        return metrics
+
+    def submit_group(self, submitter_id: str) -> ExecutorTaskGroup:
+        """
+        Start a group of tasks on the shard owning the submitter_id,
+        which can be waited on and cancelled together.
+        :param submitter_id: A string id denoting who is doing the submitting.
+                    Also used as the routing key.
+        :return: An ExecutorTaskGroup to submit the tasks of the group through
+        """
+        return self.get_shard(submitter_id).submit_group(submitter_id)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def create_task(self, awaitable: Awaitable, submitter_id: str, raise_exception: bool = False,
+                    priority: int = None, timeout: float = None) -> Future:
+        """
+        Creates a task on the shard owning the submitter_id given an Awaitable
+        :param awaitable: The Awaitable to create and schedule a task for
+        :param submitter_id: A string id denoting who is doing the submitting.
+                    Also used as the routing key.
+        :param raise_exception: True if exceptions are to be raised in the executor.
+                    Default is False.
+        :param priority: The TaskPriority of the task. Default of None implies NORMAL.
+        :param timeout: Seconds after submission at which to cancel the task.
+                    Default of None implies no timeout.
+        :return: The Task object bound to the shard's event loop
+        """
+        return self.get_shard(submitter_id).create_task(awaitable, submitter_id,
+                                                        raise_exception=raise_exception, priority=priority,
+                                                        timeout=timeout)
+
+    def cancel_current_tasks(self, timeout: float = 5.0):
+        """
+        Cancel the currently submitted tasks on all shards.
+        :param timeout: The maximum time in seconds to cancel the current tasks of each shard
+        """
+        for shard in self._shards:
+            shard.cancel_current_tasks(timeout=timeout)
+
+    def get_threads_metrics(self) -> Tuple[int, int]:
+        """
+        Get number of created worker threads and number of currently running
+        worker threads, summed over all shards.
+         :return: Tuple of (number of threads in the pools, number of currently running threads)
+        """
+        total_threads: int = 0
+        total_running: int = 0
+        for shard in self._shards:
+            threads, running = shard.get_threads_metrics()
+            total_threads += threads
+            total_running += running
+        return total_threads, total_running
+
+    def get_lag_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Get event loop lag metrics for each shard, as per EventLoopLagMonitor.get_metrics().
+        Lag monitors report after a batch of samples has been collected,
+        so entries are empty for a few seconds after start().
+        :return: A list with one dictionary per shard, in shard order.
+                 Empty if the executor was not constructed with monitor_lag=True.
+        """
+        return [monitor.get_metrics() for monitor in self._lag_monitors]
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Shuts down all the shards.
+        :param wait: True if we should wait for the background threads to join up.
+                     False otherwise.  Default is True.
+        :param cancel_futures: Ignored? Default is False.
+        """
+        for shard, monitor in zip(self._shards, self._lag_monitors):
+            if shard.get_event_loop().is_running():
+                shard.get_event_loop().call_soon_threadsafe(monitor.stop)
+        for shard in self._shards:
+            shard.shutdown(wait=wait, cancel_futures=cancel_futures)
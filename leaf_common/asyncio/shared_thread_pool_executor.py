@@ -0,0 +1,94 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+from leaf_common.asyncio.asyncio_threadpool_executor import AsyncioThreadPoolExecutor
+from leaf_common.asyncio.thread_pool_share import ThreadPoolShare
+
+
+class SharedThreadPoolExecutor(AsyncioThreadPoolExecutor):
+    """
+    One bounded pool of worker threads shared by several AsyncioExecutors,
+    typically all the executors of an AsyncioExecutorPool, so that the process
+    never has more than max_workers threads running synchronous functions
+    however many executors there are.
+
+    Each executor gets its own ThreadPoolShare from new_share(), which it
+    uses as its default executor, and which accounts for the work it submits.
+    """
+
+    def __init__(self, max_workers: int = None, thread_name_prefix: str = "SharedThreadPool"):
+        """
+        Constructor
+        :param max_workers: Maximum number of worker threads, shared by all the shares.
+                    Default of None uses the ThreadPoolExecutor default.
+        :param thread_name_prefix: Prefix of the names of the worker threads
+        """
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        # Maps account -> ThreadPoolShare, protected by the lock
+        self._shares: Dict[str, ThreadPoolShare] = {}
+
+    def new_share(self, account: str) -> ThreadPoolShare:
+        """
+        :param account: Name under which the work submitted through the share is accounted for,
+                    e.g. str(id(executor))
+        :return: A new ThreadPoolShare submitting its work to this pool
+        """
+        share = ThreadPoolShare(self, account)
+        with self.lock:
+            self._prune_retired_locked()
+            self._shares[account] = share
+        return share
+
+    def get_max_workers(self) -> int:
+        """
+        :return: The maximum number of worker threads of this pool
+        """
+        return self._max_workers
+
+    def get_usage_metrics(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary with the shared totals: "max_workers", number of threads
+                 created so far ("work_threads") and of threads running work ("threads_running"),
+                 and the usage of each share under "per_share", keyed by account,
+                 as per ThreadPoolShare.get_usage_metrics(). Shares which are shut down
+                 are reported until their last work is done, then forgotten.
+        """
+        threads: Tuple[int, int] = self.get_threads_metrics()
+        with self.lock:
+            self._prune_retired_locked()
+            shares = list(self._shares.values())
+        return {
+            "max_workers": self.get_max_workers(),
+            "work_threads": threads[0],
+            "threads_running": threads[1],
+            "per_share": {share.account: share.get_usage_metrics() for share in shares},
+        }
+
+    def _prune_retired_locked(self):
+        """
+        Forget the shares which are shut down and have no work left.
+        Must be called with the lock held.
+        """
+        for account, share in list(self._shares.items()):
+            if share.is_retired():
+                del self._shares[account]
@@ -0,0 +1,180 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from collections.abc import Hashable
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+from concurrent import futures
+from functools import partial
+from threading import Lock
+from time import monotonic
+
+
+class SingleFlight:
+    """
+    Coalesces identical work by key: while work for a key is in flight,
+    further requests for the same key share its outcome instead of starting
+    new work. Optionally, a successful outcome is also reused for a short
+    time-to-live after it is done. Failures and cancellations are never reused.
+
+    Every caller gets its own Future for the shared outcome,
+    so one caller giving up on it does not cancel the work for the others.
+
+    Thread-safe.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 10000
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Constructor
+        :param max_entries: Number of keys above which expired results are purged
+                    whenever new work is started
+        """
+        self.max_entries: int = max_entries
+        # Maps key -> [shared Future, time.monotonic() the result expires at or None while in flight]
+        self._entries: Dict[Hashable, list] = {}
+        self._hits: int = 0
+        self._cached_hits: int = 0
+        self._misses: int = 0
+        self._lock = Lock()
+
+    def do(self, key: Hashable, start: Callable[[], futures.Future],
+           ttl: float = None) -> Tuple[futures.Future, bool]:
+        """
+        :param key: The key identifying the work
+        :param start: Function starting the work and returning a Future for its outcome.
+                    Only called when there is no work in flight nor reusable result for the key.
+        :param ttl: Seconds for which a successful outcome is reused after it is done.
+                    Default of None only shares work while it is in flight.
+        :return: A tuple of (a new Future for the outcome of the work,
+                 True if start was called, False if the work was shared)
+        """
+        now: float = monotonic()
+        with self._lock:
+            entry: list = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                if entry[1] is None:
+                    self._hits += 1
+                else:
+                    self._cached_hits += 1
+                return self._follow(entry[0]), False
+            self._misses += 1
+            if len(self._entries) >= self.max_entries:
+                self._purge_expired(now)
+            shared: futures.Future = futures.Future()
+            self._entries[key] = [shared, None]
+
+        shared.add_done_callback(partial(self._work_done, key, ttl))
+        try:
+            started: futures.Future = start()
+        except BaseException as exc:
+            shared.set_exception(exc)
+            raise
+        started.add_done_callback(partial(SingleFlight._copy_outcome, shared))
+        return self._follow(shared), True
+
+    def forget(self, key: Hashable):
+        """
+        Stop sharing the work or result for a key: the next request starts new work.
+        Work already in flight is not affected.
+        :param key: The key identifying the work
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary with the number of requests which joined work in flight ("hits"),
+                reused a result within its time-to-live ("cached_hits"), or started
+                new work ("misses"), and the number of keys "in_flight" and "cached" right now.
+        """
+        now: float = monotonic()
+        with self._lock:
+            in_flight: int = sum(1 for entry in self._entries.values() if entry[1] is None)
+            cached: int = sum(1 for entry in self._entries.values() if entry[1] is not None and entry[1] > now)
+            return {
+                "hits": self._hits,
+                "cached_hits": self._cached_hits,
+                "misses": self._misses,
+                "in_flight": in_flight,
+                "cached": cached,
+            }
+
+    def _work_done(self, key: Hashable, ttl: float, shared: futures.Future):
+        """
+        Intended as a "done_callback" on the shared Future:
+        keep a successful result for its time-to-live, or drop the entry.
+        :param key: The key identifying the work
+        :param ttl: Seconds for which a successful outcome is reused
+        :param shared: The shared Future which is done
+        """
+        with self._lock:
+            entry: list = self._entries.get(key)
+            if entry is None or entry[0] is not shared:
+                return
+            if ttl and not shared.cancelled() and shared.exception() is None:
+                entry[1] = monotonic() + ttl
+            else:
+                del self._entries[key]
+
+    def _purge_expired(self, now: float):
+        """
+        Drop expired results. Must be called with the lock held.
+        :param now: The current time.monotonic()
+        """
+        expired = [key for key, entry in self._entries.items() if entry[1] is not None and entry[1] <= now]
+        for key in expired:
+            del self._entries[key]
+
+    @staticmethod
+    def _follow(shared: futures.Future) -> futures.Future:
+        """
+        :param shared: The shared Future for the outcome of some work
+        :return: A new Future which gets the same outcome
+        """
+        follower: futures.Future = futures.Future()
+        shared.add_done_callback(partial(SingleFlight._copy_outcome, follower))
+        return follower
+
+    @staticmethod
+    def _copy_outcome(destination: futures.Future, source: futures.Future):
+        """
+        Intended as a "done_callback": copy the outcome of one Future to another.
+        :param destination: The Future to set the outcome on
+        :param source: The Future which is done
+        """
+        if destination.done():
+            return
+        try:
+            if source.cancelled():
+                destination.cancel()
+            elif source.exception() is not None:
+                destination.set_exception(source.exception())
+            else:
+                destination.set_result(source.result())
+        except futures.InvalidStateError:
+            # Destination was cancelled by its owner from another thread in the meantime.
+            pass
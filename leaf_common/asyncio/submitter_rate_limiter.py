@@ -0,0 +1,128 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from threading import Lock
+from time import monotonic
+
+from leaf_common.asyncio.token_bucket import TokenBucket
+
+
+class SubmitterRateLimiter:
+    """
+    Per-submitter_id rate policies for the starts of tasks on an executor,
+    each enforced by its own TokenBucket, so one throttled submitter
+    does not hold back any other.
+
+    reserve() tells the caller how long a task has to wait before starting,
+    so the waiting can be done by the task itself inside the event loop.
+    A task cancelled before its start gives its reservation back with refund().
+    Submitters without a policy are not limited.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        # Policies can be changed from any thread
+        self._lock = Lock()
+
+    def set_policy(self, submitter_id: str, rate: float, burst: float = None):
+        """
+        Limit the start rate of tasks from a submitter, replacing any previous policy.
+        :param submitter_id: A string id denoting who is doing the submitting.
+        :param rate: Maximum average number of task starts per second
+        :param burst: Maximum number of task starts at once.
+                    Default of None implies max(1, rate).
+        """
+        if burst is None:
+            burst = max(1.0, rate)
+        bucket = TokenBucket(rate, burst, monotonic())
+        with self._lock:
+            self._buckets[submitter_id] = bucket
+            self._stats.setdefault(submitter_id, {
+                "started": 0,
+                "throttled": 0,
+                "throttled_seconds": 0.0,
+                "max_throttled_seconds": 0.0,
+                "refunded": 0,
+            })
+
+    def remove_policy(self, submitter_id: str):
+        """
+        Stop limiting the start rate of tasks from a submitter.
+        :param submitter_id: A string id denoting who is doing the submitting.
+        """
+        with self._lock:
+            self._buckets.pop(submitter_id, None)
+            self._stats.pop(submitter_id, None)
+
+    def reserve(self, submitter_id: str) -> float:
+        """
+        Reserve the start of a task.
+        :param submitter_id: A string id denoting who did the submitting.
+        :return: The number of seconds the task has to wait before it starts,
+                 0.0 if it can start right away or if the submitter is not limited.
+        """
+        with self._lock:
+            bucket: Optional[TokenBucket] = self._buckets.get(submitter_id)
+            if bucket is None:
+                return 0.0
+            delay: float = bucket.reserve(monotonic())
+            stats: Dict[str, Any] = self._stats[submitter_id]
+            stats["started"] += 1
+            if delay > 0.0:
+                stats["throttled"] += 1
+                stats["throttled_seconds"] += delay
+                stats["max_throttled_seconds"] = max(stats["max_throttled_seconds"], delay)
+            return delay
+
+    def refund(self, submitter_id: str):
+        """
+        Give back the reservation of a throttled task cancelled before it started.
+        :param submitter_id: A string id denoting who did the submitting.
+        """
+        with self._lock:
+            bucket: Optional[TokenBucket] = self._buckets.get(submitter_id)
+            if bucket is None:
+                return
+            bucket.refund(monotonic())
+            stats: Dict[str, Any] = self._stats[submitter_id]
+            stats["started"] -= 1
+            stats["throttled"] -= 1
+            stats["refunded"] += 1
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: A dictionary keyed by the submitter ids with a policy. Each value is a dictionary
+                with the "rate" and "burst" of the policy, the number of tasks "started",
+                how many of those were "throttled", and the total and maximum time
+                tasks were held back ("throttled_seconds", "max_throttled_seconds").
+                Tasks cancelled before they started are not counted as started or throttled,
+                but as "refunded".
+        """
+        with self._lock:
+            return {submitter_id: dict(stats, rate=self._buckets[submitter_id].rate,
+                                       burst=self._buckets[submitter_id].burst)
+                    for submitter_id, stats in self._stats.items()}
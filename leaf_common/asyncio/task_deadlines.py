@@ -0,0 +1,125 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from asyncio import AbstractEventLoop
+from asyncio import TimerHandle
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from time import monotonic
+
+from leaf_common.asyncio.task_record import TaskRecord
+
+
+class TaskDeadlines:
+    """
+    Deadlines of the tasks in one event loop, kept in a min-heap
+    and expired by a single timer handle for the earliest deadline,
+    instead of one call_later() handle (or one asyncio.wait_for() task)
+    per task.
+
+    Tasks which finish before their deadline are not removed from the heap
+    right away: they are skipped when they come up, and the heap is compacted
+    whenever such entries make up more than half of it.
+
+    Not thread-safe: all methods must be called from the event loop thread.
+    """
+
+    # Do not bother compacting heaps smaller than this
+    MIN_COMPACT_SIZE: int = 64
+
+    def __init__(self, loop: AbstractEventLoop, on_expired: Callable[[TaskRecord], None]):
+        """
+        Constructor
+        :param loop: The event loop the tasks run in
+        :param on_expired: Function called with the TaskRecord of each unfinished task
+                    whose deadline has passed
+        """
+        self._loop: AbstractEventLoop = loop
+        self._on_expired: Callable[[TaskRecord], None] = on_expired
+        # Heap of (deadline, sequence, record). Deadlines are time.monotonic() values.
+        self._heap: List[Tuple[float, int, TaskRecord]] = []
+        self._sequence: int = 0
+        self._finished: int = 0
+        self._timer: Optional[TimerHandle] = None
+        self._timer_deadline: float = 0.0
+
+    def add(self, record: TaskRecord):
+        """
+        :param record: The TaskRecord of a newly created task with a deadline set
+        """
+        self._sequence += 1
+        heappush(self._heap, (record.deadline, self._sequence, record))
+        if self._timer is None or record.deadline < self._timer_deadline:
+            self._arm()
+
+    def finished(self, record: TaskRecord):
+        """
+        Note that a task with a deadline is done.
+        :param record: The TaskRecord of the finished task
+        """
+        if record.timed_out:
+            # Already popped off the heap
+            return
+        self._finished += 1
+        if len(self._heap) >= self.MIN_COMPACT_SIZE and self._finished * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].task.done()]
+            heapify(self._heap)
+            self._finished = 0
+            if not self._heap and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def __len__(self) -> int:
+        """
+        :return: The number of deadlines in the heap, including those of finished tasks not compacted yet
+        """
+        return len(self._heap)
+
+    def _arm(self):
+        """
+        (Re)schedule the timer for the earliest deadline.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._heap:
+            return
+        self._timer_deadline = self._heap[0][0]
+        self._timer = self._loop.call_later(max(0.0, self._timer_deadline - monotonic()), self._expire)
+
+    def _expire(self):
+        """
+        Timer callback: expire all the tasks whose deadline has passed.
+        """
+        self._timer = None
+        now: float = monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, record = heappop(self._heap)
+            if record.task.done():
+                self._finished = max(0, self._finished - 1)
+                continue
+            record.timed_out = True
+            self._on_expired(record)
+        self._arm()
@@ -0,0 +1,122 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+
+from threading import Lock
+
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+
+
+class TaskMetrics:
+    """
+    Per-submitter aggregates of task outcomes and timings for an executor:
+    how many tasks finished, how many of those raised, were cancelled or timed out,
+    and streaming percentiles of queue delay (submit to start)
+    and run time (start to finish).
+
+    Memory use is bounded: once max_submitters distinct submitter ids
+    have been seen, any further ones are aggregated under OTHER_SUBMITTER.
+    """
+
+    DEFAULT_MAX_SUBMITTERS: int = 1000
+
+    OTHER_SUBMITTER: str = "(other)"
+
+    OUTCOME_OK: str = "ok"
+    OUTCOME_ERROR: str = "error"
+    OUTCOME_CANCELLED: str = "cancelled"
+    OUTCOME_TIMEOUT: str = "timeout"
+
+    def __init__(self, max_submitters: int = DEFAULT_MAX_SUBMITTERS):
+        """
+        Constructor
+        :param max_submitters: Maximum number of distinct submitter ids to keep separate aggregates for
+        """
+        self.max_submitters: int = max_submitters
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        # Recording happens on the event loop thread; reading happens on any thread.
+        self._lock = Lock()
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def record(self, submitter_id: str, outcome: str,
+               submitted_at: float, started_at: float, finished_at: float):
+        """
+        Record a finished task.
+        :param submitter_id: A string id denoting who did the submitting.
+        :param outcome: One of the OUTCOME_* constants above
+        :param submitted_at: time.monotonic() when the task was submitted
+        :param started_at: time.monotonic() when the task started in the event loop
+        :param finished_at: time.monotonic() when the task finished
+        """
+        with self._lock:
+            stats: Dict[str, Any] = self._get_stats(str(submitter_id))
+            stats["count"] += 1
+            if outcome == self.OUTCOME_ERROR:
+                stats["errors"] += 1
+            elif outcome == self.OUTCOME_CANCELLED:
+                stats["cancelled"] += 1
+            elif outcome == self.OUTCOME_TIMEOUT:
+                stats["timeouts"] += 1
+            stats["queue_delay"].record(started_at - submitted_at)
+            stats["run_time"].record(finished_at - started_at)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: A dictionary keyed by submitter id. Each value is a dictionary with
+                "count", "errors", "cancelled", "timeouts", and "queue_delay" and "run_time"
+                summaries as per LatencyHistogram.get_metrics().
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for submitter_id, stats in self._stats.items():
+                result[submitter_id] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "cancelled": stats["cancelled"],
+                    "timeouts": stats["timeouts"],
+                    "queue_delay": stats["queue_delay"].get_metrics(),
+                    "run_time": stats["run_time"].get_metrics(),
+                }
+        return result
+
+    def _get_stats(self, submitter_id: str) -> Dict[str, Any]:
+        """
+        Must be called with the lock held.
+        :return: The aggregates dictionary for the submitter id, created as needed
+        """
+        stats: Dict[str, Any] = self._stats.get(submitter_id)
+        if stats is not None:
+            return stats
+        if len(self._stats) >= self.max_submitters:
+            submitter_id = self.OTHER_SUBMITTER
+            stats = self._stats.get(submitter_id)
+            if stats is not None:
+                return stats
+        stats = {
+            "count": 0,
+            "errors": 0,
+            "cancelled": 0,
+            "timeouts": 0,
+            "queue_delay": LatencyHistogram(),
+            "run_time": LatencyHistogram(),
+        }
+        self._stats[submitter_id] = stats
+        return stats
@@ -0,0 +1,54 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Dict
+from typing import Tuple
+
+
+class TaskPriority:
+    """
+    Priority classes for tasks submitted to an AsyncioExecutor.
+    Lower values are more urgent. Suggested use:
+      - HIGH:   health checks, cancellations, and other control traffic
+      - NORMAL: user-facing requests. This is the default.
+      - LOW:    bulk background jobs
+    """
+
+    HIGH: int = 0
+    NORMAL: int = 1
+    LOW: int = 2
+    PRIORITIES: Tuple[int, ...] = (HIGH, NORMAL, LOW)
+
+    NAMES: Dict[int, str] = {
+        HIGH: "high",
+        NORMAL: "normal",
+        LOW: "low",
+    }
+
+    @staticmethod
+    def resolve(priority: int = None) -> int:
+        """
+        :param priority: One of the priority constants above, or None
+        :return: The given priority, or NORMAL if None
+        """
+        if priority is None:
+            return TaskPriority.NORMAL
+        if priority not in TaskPriority.PRIORITIES:
+            raise ValueError(f"priority must be one of {TaskPriority.PRIORITIES}, not {priority}")
+        return priority
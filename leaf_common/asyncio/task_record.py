@@ -0,0 +1,68 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from asyncio import Task
+
+from leaf_common.asyncio.admission_ticket import AdmissionTicket
+from leaf_common.asyncio.task_priority import TaskPriority
+
+
+class TaskRecord:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Bookkeeping for one task submitted to an AsyncioExecutor, from submission
+    until the task is done: the task itself, how it is to be handled,
+    when it was submitted and started, and its deadline, if any.
+
+    An executor can go through millions of short tasks an hour,
+    so this is kept as small as possible with __slots__:
+    no per-instance dictionary, and one record per task, shared by
+    every table which needs to know about the task.
+    """
+
+    __slots__ = ("task", "submitter_id", "priority", "raise_exception",
+                 "admission_ticket", "submitted_at", "started_at", "deadline", "timed_out")
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, submitter_id: str = None, priority: int = TaskPriority.NORMAL,
+                 admission_ticket: AdmissionTicket = None, submitted_at: float = 0.0,
+                 task: Task = None):
+        """
+        Constructor.
+
+        :param submitter_id: A string id denoting who did the submitting.
+        :param priority: The TaskPriority of the task
+        :param admission_ticket: The AdmissionTicket held for the task, if any
+        :param submitted_at: time.monotonic() when the task was submitted
+        :param task: The task, if it already exists.
+                    Otherwise it is set once the task is created in the event loop.
+        """
+        self.task: Task = task
+        self.submitter_id: str = submitter_id
+        self.priority: int = priority
+        self.raise_exception: bool = False
+        self.admission_ticket: AdmissionTicket = admission_ticket
+        self.submitted_at: float = submitted_at
+        # Set once the task is created in the event loop
+        self.started_at: float = submitted_at
+        # time.monotonic() by which the task is to be cancelled, or None for no deadline
+        self.deadline: float = None
+        # True once the task is cancelled for passing its deadline.
+        # The task only timed out if it ends up cancelled.
+        self.timed_out: bool = False
@@ -0,0 +1,38 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+
+
+class TaskRejectedException(Exception):
+    """
+    Exception raised when a task submitted to an executor
+    is refused admission, for instance because the executor
+    is already running as many tasks as it is configured to allow.
+    """
+
+    def __init__(self, submitter_id: str, reason: str):
+        """
+        Constructor.
+
+        :param submitter_id: A string id denoting who did the submitting.
+        :param reason: A human-readable reason for the rejection.
+        """
+        Exception.__init__(self, f"Task from {submitter_id} rejected: {reason}")
+        self.submitter_id: str = submitter_id
+        self.reason: str = reason
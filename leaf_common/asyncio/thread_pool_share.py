@@ -0,0 +1,136 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+from typing import Any
+from typing import Dict
+from typing import Set
+from typing import Tuple
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+
+class ThreadPoolShare(ThreadPoolExecutor):
+    # pylint: disable=too-many-instance-attributes
+    """
+    One executor's share of a SharedThreadPoolExecutor, as given by its new_share().
+
+    It is a ThreadPoolExecutor so that it can be set as the default executor
+    of an event loop, but it never starts threads of its own: all its work
+    runs on the shared pool, while it accounts for how much of that work
+    was submitted through it, and how much of it is running or queued.
+
+    Shutting a share down does not shut the shared pool down;
+    with cancel_futures=True it cancels its own work not started yet.
+    """
+
+    def __init__(self, shared_pool: ThreadPoolExecutor, account: str):
+        """
+        Constructor
+        :param shared_pool: The SharedThreadPoolExecutor actually running the work
+        :param account: Name under which the work submitted through this share is accounted for
+        """
+        # No threads are started until submit() is called on the base class, which never happens.
+        super().__init__(max_workers=1)
+        self.shared_pool: ThreadPoolExecutor = shared_pool
+        self.account: str = account
+        self._share_lock = Lock()
+        self._closed: bool = False
+        self._submitted: int = 0
+        self._running: int = 0
+        self._completed: int = 0
+        # Futures of the work submitted through this share and not done yet
+        self._pending: Set[Future] = set()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """
+        Submit a function to the shared pool, accounting for it in this share.
+        """
+        def wrapped(*a, **kw):
+            with self._share_lock:
+                self._running += 1
+            try:
+                return fn(*a, **kw)
+            finally:
+                with self._share_lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._share_lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._submitted += 1
+        future: Future = self.shared_pool.submit(wrapped, *args, **kwargs)
+        with self._share_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._work_done)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Refuse any further work. The shared pool keeps running.
+        :param wait: Ignored: the threads belong to the shared pool
+        :param cancel_futures: True to cancel the work submitted through this share
+                    which has not started yet
+        """
+        with self._share_lock:
+            self._closed = True
+            pending = list(self._pending)
+        if cancel_futures:
+            for future in pending:
+                future.cancel()
+
+    def get_threads_metrics(self) -> Tuple[int, int]:
+        """
+        :return: Tuple of (number of shared threads busy with work of this share,
+                 number of currently running functions of this share), which are the same,
+                 so that summing them over all shares never exceeds the shared thread count.
+        """
+        with self._share_lock:
+            return self._running, self._running
+
+    def get_usage_metrics(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary of the number of functions "submitted" through this share,
+                 how many of those are "running", "queued" waiting for a shared thread,
+                 and "completed".
+        """
+        with self._share_lock:
+            return {
+                "submitted": self._submitted,
+                "running": self._running,
+                # A finished function can still be pending for an instant
+                "queued": max(0, len(self._pending) - self._running),
+                "completed": self._completed,
+            }
+
+    def is_retired(self) -> bool:
+        """
+        :return: True if this share is shut down and none of its work is left
+        """
+        with self._share_lock:
+            return self._closed and len(self._pending) == 0
+
+    def _work_done(self, future: Future):
+        """
+        Intended as a "done_callback": forget the future of finished or cancelled work.
+        """
+        with self._share_lock:
+            self._pending.discard(future)
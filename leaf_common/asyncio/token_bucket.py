@@ -0,0 +1,73 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details.
+"""
+
+
+class TokenBucket:
+    """
+    Token bucket allowing up to rate starts per second on average,
+    with bursts of up to burst starts at once.
+
+    Starts reserve their token right away and are told how long to wait
+    for it, so a bucket never needs a timer of its own: tokens can go
+    negative, which orders later starts after earlier ones.
+
+    Not thread-safe.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        """
+        Constructor
+        :param rate: Tokens added per second
+        :param burst: Maximum number of tokens the bucket holds
+        :param now: The current time.monotonic(). The bucket starts full.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+        self.rate: float = rate
+        self.burst: float = burst
+        self.tokens: float = burst
+        self.updated_at: float = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token.
+        :param now: The current time.monotonic()
+        :return: The number of seconds to wait before the token is actually available.
+                 0.0 if it is available right away.
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1.0
+        if self.tokens >= 0.0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def refund(self, now: float):
+        """
+        Give back one token taken by a start which is not going to happen,
+        so it does not push later reservations back.
+        :param now: The current time.monotonic()
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate + 1.0)
+        self.updated_at = now
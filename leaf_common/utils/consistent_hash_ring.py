@@ -0,0 +1,81 @@
+
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comments for description.
+"""
+from typing import List
+from typing import Tuple
+
+from bisect import bisect_right
+from hashlib import blake2b
+
+
+class ConsistentHashRing:
+    """
+    Maps arbitrary keys onto a fixed number of slots by consistent hashing.
+    Each slot owns a number of virtual nodes spread around a hash ring,
+    and a key belongs to the slot owning the first virtual node at or
+    after the key's own hash.
+
+    The mapping only depends on the key and the ring's configuration,
+    so it is stable across processes (unlike the built-in hash() for strings),
+    and growing the ring by one slot only moves about 1/num_slots of the keys.
+    """
+
+    DEFAULT_VIRTUAL_NODES: int = 64
+
+    def __init__(self, num_slots: int, virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        """
+        Constructor
+
+        :param num_slots: The number of slots to map keys onto. Must be > 0.
+        :param virtual_nodes: The number of points each slot owns on the ring.
+                    More points give a more even spread of keys at the cost
+                    of a slightly bigger ring.
+        """
+        if num_slots <= 0:
+            raise ValueError("num_slots must be > 0")
+        if virtual_nodes <= 0:
+            raise ValueError("virtual_nodes must be > 0")
+        self.num_slots: int = num_slots
+        points: List[Tuple[int, int]] = []
+        for slot in range(num_slots):
+            for node in range(virtual_nodes):
+                points.append((ConsistentHashRing.hash_key(f"{slot}#{node}"), slot))
+        points.sort()
+        self._hashes: List[int] = [point[0] for point in points]
+        self._slots: List[int] = [point[1] for point in points]
+
+    @staticmethod
+    def hash_key(key: object) -> int:
+        """
+        :param key: The key to hash. Non-string keys are hashed by their str().
+        :return: A stable 64-bit hash of the key
+        """
+        digest: bytes = blake2b(str(key).encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def get_slot(self, key: object) -> int:
+        """
+        :param key: The key to map. Non-string keys are mapped by their str().
+        :return: The slot index in [0, num_slots) the key belongs to
+        """
+        index: int = bisect_right(self._hashes, ConsistentHashRing.hash_key(key))
+        if index == len(self._hashes):
+            # Wrap around the ring
+            index = 0
+        return self._slots[index]
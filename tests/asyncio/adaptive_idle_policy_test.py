@@ -0,0 +1,121 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for AdaptiveIdlePolicy and its use by the AsyncioExecutorPool GC.
+"""
+from collections import deque
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from leaf_common.asyncio.adaptive_idle_policy import AdaptiveIdlePolicy
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+
+class AdaptiveIdlePolicyTest(TestCase):
+    """
+    Verifies the burst and gap moving averages, the decisions taken from them,
+    and how the pool GC follows those decisions.
+    """
+
+    @staticmethod
+    def burst(policy: AdaptiveIdlePolicy, start: float, peak: int, length: float = 1.0):
+        """
+        Feed the policy one burst ramping up to peak executors in use, then back to none.
+        """
+        for in_use in range(1, peak + 1):
+            policy.observe(in_use, start)
+        policy.observe(0, start + length)
+
+    def test_moving_averages(self):
+        """
+        Peaks and gaps are averaged per burst, and short gaps do not end a burst.
+        """
+        policy = AdaptiveIdlePolicy(alpha=0.5, merge_gap_seconds=1.0)
+        self.burst(policy, 0.0, 4)
+        # Back within merge_gap_seconds: same burst
+        self.burst(policy, 1.5, 6)
+        self.burst(policy, 30.0, 2)
+        self.burst(policy, 60.0, 2)
+        policy.decide(100.0, 180.0)
+
+        metrics = policy.get_metrics()
+        self.assertEqual(3, metrics["bursts"])
+        # Peaks 6, 2, 2
+        self.assertAlmostEqual(3.0, metrics["peak_ewma"])
+        self.assertEqual(3, metrics["predicted_peak"])
+        # Gaps 27.5, 29
+        self.assertAlmostEqual(28.25, metrics["gap_ewma_seconds"])
+
+    def test_decisions(self):
+        """
+        No prediction means the fixed timeout; then the predicted peak is kept,
+        until demand has stayed away for too long.
+        """
+        policy = AdaptiveIdlePolicy(alpha=0.5, quiet_factor=2.0)
+        self.burst(policy, 0.0, 3)
+        self.assertEqual((0, 180.0), policy.decide(10.0, 180.0))
+        self.assertEqual(AdaptiveIdlePolicy.MODE_FIXED, policy.get_metrics()["mode"])
+
+        self.burst(policy, 21.0, 3)
+        self.assertEqual((3, 20.0), policy.decide(30.0, 180.0))
+        self.assertEqual(AdaptiveIdlePolicy.MODE_ADAPTIVE, policy.get_metrics()["mode"])
+        self.assertEqual(3, policy.get_metrics()["keep"])
+
+        # In the middle of a burst, only what is not in use yet is kept
+        policy.observe(2, 40.0)
+        # The gap before this burst was 18s
+        self.assertEqual((1, 19.0), policy.decide(40.5, 180.0))
+        policy.observe(0, 41.0)
+
+        # Quiet for more than twice the predicted gap
+        self.assertEqual((0, 180.0), policy.decide(90.0, 180.0))
+        self.assertEqual(AdaptiveIdlePolicy.MODE_FIXED, policy.get_metrics()["mode"])
+
+    def test_pool_gc_follows_policy(self):
+        """
+        The GC keeps the predicted peak however idle, collects the excess
+        after the predicted gap, and counts how that differs from the fixed timeout.
+        """
+        # pylint: disable=protected-access
+        policy = AdaptiveIdlePolicy(alpha=0.5)
+        pool = AsyncioExecutorPool(idle_timeout_seconds=100.0, gc_sweep_interval_seconds=3600.0,
+                                   idle_policy=policy)
+        pool.shutdown()
+        self.burst(policy, 0.0, 2)
+        self.burst(policy, 11.0, 2)
+
+        executors = [MagicMock(name=f"executor-{index}") for index in range(4)]
+        with pool.lock:
+            pool.pool_available = deque(executors)
+            for index, executor in enumerate(executors):
+                pool._returned_at[id(executor)] = 12.0 + index
+
+        # Idle for 16 to 19 seconds: past the predicted gap of 10s, not the fixed timeout
+        pool._sweep_once(now=31.0)
+        self.assertEqual(executors[2:], list(pool.pool_available))
+        executors[0].shutdown.assert_called_once()
+        executors[3].shutdown.assert_not_called()
+
+        # Quiet for too long: back to the fixed timeout, and min_idle of 0
+        pool._sweep_once(now=200.0)
+        self.assertEqual(0, len(pool.pool_available))
+
+        metrics = pool.get_pool_metrics()
+        self.assertEqual(4, metrics["collected"])
+        self.assertEqual(2, metrics["idle_policy"]["collected_early"])
+        self.assertEqual(AdaptiveIdlePolicy.MODE_FIXED, metrics["idle_policy"]["mode"])
+        self.assertIn("asyncio_executor_pool_idle_policy_collected_early_total 2",
+                      pool.get_prometheus_metrics().splitlines())
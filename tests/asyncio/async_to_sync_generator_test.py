@@ -0,0 +1,91 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for AsyncToSyncGenerator.
+"""
+import asyncio
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.async_to_sync_generator import AsyncToSyncGenerator
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.time.timeout import Timeout
+from leaf_common.time.timeout_reached_exception import TimeoutReachedException
+
+
+async def stream_tokens(count: int, delay_seconds: float):
+    """
+    Yield the time each token is produced, as a token-streaming model would.
+    """
+    for _ in range(count):
+        await asyncio.sleep(delay_seconds)
+        yield time.monotonic()
+
+
+class AsyncToSyncGeneratorTest(TestCase):
+    """
+    Verifies that results are handed over as soon as they are ready,
+    and that the keep-alive and umbrella timeouts are honored.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        self.executor.shutdown(wait=True)
+
+    def test_items_are_not_delayed_by_polling(self):
+        """
+        Each item arrives well within the former polling interval of poll_seconds.
+        """
+        generator = AsyncToSyncGenerator(self.executor, "test", generated_type=float, poll_seconds=1.0)
+        latencies = []
+        for produced_at in generator.synchronously_generate(stream_tokens, 20, 0.005):
+            # The end of the stream is marked by one last keep_alive_result
+            if produced_at is not None:
+                latencies.append(time.monotonic() - produced_at)
+        self.assertEqual(20, len(latencies))
+        self.assertLess(max(latencies), 0.2)
+
+    def test_keep_alive_result_while_waiting(self):
+        """
+        A keep-alive result is yielded each keep_alive_timeout_seconds spent waiting for an item.
+        """
+        generator = AsyncToSyncGenerator(self.executor, "test", generated_type=float,
+                                         keep_alive_result="keep-alive", keep_alive_timeout_seconds=0.1)
+        start = time.monotonic()
+        results = list(generator.synchronously_generate(stream_tokens, 1, 0.35))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(["keep-alive"] * 3, results[:3])
+        self.assertIsInstance(results[3], float)
+
+    def test_umbrella_timeout(self):
+        """
+        The umbrella timeout ends the wait as soon as it is reached.
+        """
+        umbrella = Timeout("umbrella")
+        umbrella.set_limit_in_seconds(0.2)
+        generator = AsyncToSyncGenerator(self.executor, "test", generated_type=float, umbrella_timeout=umbrella)
+        start = time.monotonic()
+        with self.assertRaises(TimeoutReachedException):
+            list(generator.synchronously_generate(stream_tokens, 1, 1.0))
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 0.5)
@@ -0,0 +1,243 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for admission control on AsyncioExecutor:
+AdmissionController on its own, and as used by the executor.
+"""
+import asyncio
+import threading
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.admission_controller import AdmissionController
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.task_rejected_exception import TaskRejectedException
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+
+
+class AsyncioExecutorAdmissionTest(TestCase):
+    """
+    Verifies the overflow policies, per-submitter limits and metrics
+    of admission control.
+    """
+
+    def setUp(self):
+        """No executor by default; tests create one with the controller they need."""
+        self.executor = None
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def _start_executor(self, controller: AdmissionController) -> AsyncioExecutor:
+        self.executor = AsyncioExecutor(admission_controller=controller)
+        self.executor.start()
+        return self.executor
+
+    def test_controller_rejects_over_limit(self):
+        """
+        OVERFLOW_REJECT rejects right away, and releasing makes room again.
+        """
+        controller = AdmissionController(max_in_flight=2, overflow_policy=AdmissionController.OVERFLOW_REJECT)
+        first = controller.acquire("a")
+        controller.acquire("b")
+        with self.assertRaises(TaskRejectedException) as context:
+            controller.acquire("c")
+        self.assertEqual("c", context.exception.submitter_id)
+
+        controller.release(first)
+        # Releasing twice is harmless.
+        controller.release(first)
+        controller.acquire("c")
+
+        metrics = controller.get_metrics()
+        self.assertEqual(2, metrics["in_flight"])
+        self.assertEqual(3, metrics["admitted"])
+        self.assertEqual(1, metrics["rejected"])
+        self.assertEqual({"b": 1, "c": 1}, metrics["in_flight_by_submitter"])
+
+    def test_controller_per_submitter_limit(self):
+        """
+        The per-submitter limit does not hold back other submitters.
+        """
+        controller = AdmissionController(max_in_flight_per_submitter=1,
+                                         overflow_policy=AdmissionController.OVERFLOW_REJECT)
+        controller.acquire("a")
+        with self.assertRaises(TaskRejectedException):
+            controller.acquire("a")
+        controller.acquire("b")
+
+    def test_controller_block_times_out(self):
+        """
+        OVERFLOW_BLOCK waits up to block_timeout_seconds, then rejects.
+        """
+        controller = AdmissionController(max_in_flight=1, block_timeout_seconds=0.2)
+        controller.acquire("a")
+        start_time = time.monotonic()
+        with self.assertRaises(TaskRejectedException):
+            controller.acquire("b")
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.19)
+
+    def test_controller_block_admits_on_release(self):
+        """
+        OVERFLOW_BLOCK admits a waiting caller as soon as a ticket is released.
+        """
+        controller = AdmissionController(max_in_flight=1, block_timeout_seconds=5.0)
+        ticket = controller.acquire("a")
+        admitted = threading.Event()
+
+        def waiter():
+            controller.acquire("b")
+            admitted.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.1)
+        self.assertFalse(admitted.is_set())
+        self.assertEqual(1, controller.get_metrics()["waiting"])
+
+        controller.release(ticket)
+        self.assertTrue(admitted.wait(timeout=5.0))
+        thread.join(timeout=5.0)
+
+    def test_controller_acquire_async(self):
+        """
+        acquire_async() waits on the caller's event loop and is admitted on release.
+        """
+        controller = AdmissionController(max_in_flight=1, block_timeout_seconds=5.0)
+        ticket = controller.acquire("a")
+
+        async def acquire_while_releasing():
+            asyncio.get_running_loop().call_later(0.1, controller.release, ticket)
+            return await controller.acquire_async("b")
+
+        new_ticket = asyncio.run(acquire_while_releasing())
+        self.assertEqual("b", new_ticket.submitter_id)
+
+    def test_executor_rejects_over_limit(self):
+        """
+        The executor raises TaskRejectedException when over its limit,
+        and admits again once tasks are done.
+        """
+        controller = AdmissionController(max_in_flight=1, overflow_policy=AdmissionController.OVERFLOW_REJECT)
+        executor = self._start_executor(controller)
+        started = threading.Event()
+        task = executor.submit("limited", AsyncTestHelpers.cancellable_task_with_event, started)
+        self.assertTrue(started.wait(timeout=5.0))
+
+        with self.assertRaises(TaskRejectedException):
+            executor.submit("limited", AsyncTestHelpers.dummy_async_coroutine)
+        with self.assertRaises(TaskRejectedException):
+            executor.create_task(AsyncTestHelpers.dummy_async_coroutine(), "limited")
+
+        executor.cancel_current_tasks(timeout=5.0)
+        time.sleep(0.1)
+        self.assertTrue(task.cancelled())
+        metrics = executor.get_admission_metrics()
+        self.assertEqual(0, metrics["in_flight"])
+        self.assertEqual(2, metrics["rejected"])
+        executor.submit_nowait("limited", AsyncTestHelpers.dummy_async_coroutine).result(timeout=5.0)
+
+    def test_executor_sheds_oldest(self):
+        """
+        OVERFLOW_SHED_OLDEST cancels the oldest task to make room.
+        """
+        controller = AdmissionController(max_in_flight=2, overflow_policy=AdmissionController.OVERFLOW_SHED_OLDEST)
+        executor = self._start_executor(controller)
+        started = threading.Event()
+        cancelled = []
+        oldest = executor.submit("shed", AsyncTestHelpers.long_running_task_with_cancel, started, cancelled, 1)
+        self.assertTrue(started.wait(timeout=5.0))
+        executor.submit("shed", AsyncTestHelpers.cancellable_task_with_event, threading.Event())
+        executor.submit("shed", AsyncTestHelpers.cancellable_task_with_event, threading.Event())
+
+        time.sleep(0.2)
+        self.assertTrue(oldest.cancelled())
+        self.assertEqual([1], cancelled)
+        metrics = executor.get_admission_metrics()
+        self.assertEqual(1, metrics["shed"])
+        self.assertEqual(2, metrics["in_flight"])
+
+    def test_executor_submit_async_waits_for_admission(self):
+        """
+        submit_async() from a coroutine on the executor's own loop
+        waits for admission without blocking the loop.
+        """
+        # One ticket for the outer coroutine, one for the tasks it submits.
+        controller = AdmissionController(max_in_flight=2, block_timeout_seconds=5.0)
+        executor = self._start_executor(controller)
+
+        async def submit_twice():
+            first = await executor.submit_async("async", AsyncTestHelpers.named_function)
+            second = await executor.submit_async("async", AsyncTestHelpers.quick_task_with_event,
+                                                 threading.Event())
+            await second
+            return first.done()
+
+        self.assertTrue(executor.submit_and_wait("outer", submit_twice, timeout=5.0))
+
+    def test_executor_submit_async_cancelled_before_creation(self):
+        """
+        A submit_async() caller cancelled while task creation is still queued
+        gets no task created, and holds no admission afterwards.
+        """
+        controller = AdmissionController(max_in_flight=2, block_timeout_seconds=5.0)
+        executor = self._start_executor(controller)
+        unblock = threading.Event()
+        ran = []
+
+        async def block_loop():
+            # Blocks the whole event loop, so task creation stays queued.
+            unblock.wait(timeout=5.0)
+
+        async def work():
+            ran.append(True)
+
+        async def submit_and_cancel():
+            submitting = asyncio.ensure_future(executor.submit_async("cancelled", work))
+            await asyncio.sleep(0.1)
+            submitting.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await submitting
+
+        blocker = executor.submit_nowait("blocker", block_loop)
+        asyncio.run(submit_and_cancel())
+        unblock.set()
+        blocker.result(timeout=5.0)
+        executor.submit_nowait("after", AsyncTestHelpers.dummy_async_coroutine).result(timeout=5.0)
+
+        self.assertEqual([], ran)
+        self.assertEqual(0, executor.get_admission_metrics()["in_flight"])
+
+    def test_executor_submit_many_is_all_or_nothing(self):
+        """
+        A batch which does not fit is rejected as a whole.
+        """
+        controller = AdmissionController(max_in_flight=2, overflow_policy=AdmissionController.OVERFLOW_REJECT)
+        executor = self._start_executor(controller)
+        submissions = [(AsyncTestHelpers.named_function, None, None)] * 3
+        with self.assertRaises(TaskRejectedException):
+            executor.submit_many("batch", submissions)
+        self.assertEqual(0, executor.get_admission_metrics()["in_flight"])
+
+    def test_no_admission_metrics_without_controller(self):
+        """
+        Without an AdmissionController there is nothing to report.
+        """
+        executor = self._start_executor(None)
+        self.assertEqual({}, executor.get_admission_metrics())
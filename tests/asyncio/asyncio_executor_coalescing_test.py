@@ -0,0 +1,116 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for single-flight coalescing of submissions on AsyncioExecutor.
+"""
+import asyncio
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+
+
+class AsyncioExecutorCoalescingTest(TestCase):
+    """
+    Verifies that identical submissions share one task while it is in flight,
+    that results are reused within their ttl, and the hit/miss counters.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+        self.calls = []
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    async def load(self, name: str, seconds: float = 0.1) -> str:
+        """
+        Count the calls and return a result after some time.
+        """
+        self.calls.append(name)
+        await asyncio.sleep(seconds)
+        return f"loaded {name}"
+
+    async def load_failing(self, name: str):
+        """
+        Count the calls and raise after some time.
+        """
+        self.calls.append(name)
+        await asyncio.sleep(0.05)
+        raise ValueError(name)
+
+    def test_in_flight_submissions_share_one_task(self):
+        """
+        Submissions for a key already in flight get the same result without a new task.
+        """
+        results = [self.executor.submit_coalesced("req", "model-x", self.load, "x") for _ in range(5)]
+        other = self.executor.submit_coalesced("req", "model-y", self.load, "y")
+        self.assertEqual(["loaded x"] * 5, [result.result(5.0) for result in results])
+        self.assertEqual("loaded y", other.result(5.0))
+        self.assertEqual(["x", "y"], self.calls)
+
+        metrics = self.executor.get_coalescing_metrics()
+        self.assertEqual(4, metrics["hits"])
+        self.assertEqual(2, metrics["misses"])
+        self.assertEqual(0, metrics["in_flight"])
+
+        # Without a ttl, a later submission starts a new task.
+        self.executor.submit_coalesced("req", "model-x", self.load, "x", 0.0).result(5.0)
+        self.assertEqual(["x", "y", "x"], self.calls)
+
+    def test_ttl_reuses_result(self):
+        """
+        A successful result is reused within its ttl, and not after it, or once forgotten.
+        """
+        first = self.executor.submit_coalesced("req", "k", self.load, "k", 0.0, ttl=0.3)
+        self.assertEqual("loaded k", first.result(5.0))
+        self.assertEqual("loaded k", self.executor.submit_coalesced("req", "k", self.load, "k", ttl=0.3).result(5.0))
+        metrics = self.executor.get_coalescing_metrics()
+        self.assertEqual(1, metrics["cached_hits"])
+        self.assertEqual(1, metrics["cached"])
+
+        time.sleep(0.4)
+        self.executor.submit_coalesced("req", "k", self.load, "k", 0.0, ttl=0.3).result(5.0)
+        self.assertEqual(2, len(self.calls))
+        self.executor.forget_coalesced("k")
+        self.executor.submit_coalesced("req", "k", self.load, "k", 0.0, ttl=0.3).result(5.0)
+        self.assertEqual(3, len(self.calls))
+
+    def test_failures_are_shared_but_not_cached(self):
+        """
+        A failure reaches every submission sharing the task, but is not reused.
+        """
+        results = [self.executor.submit_coalesced("req", "bad", self.load_failing, "bad", ttl=60.0) for _ in range(2)]
+        for result in results:
+            with self.assertRaises(ValueError):
+                result.result(5.0)
+        with self.assertRaises(ValueError):
+            self.executor.submit_coalesced("req", "bad", self.load_failing, "bad", ttl=60.0).result(5.0)
+        self.assertEqual(2, len(self.calls))
+
+    def test_cancelling_one_caller_keeps_shared_task(self):
+        """
+        One caller cancelling its Future does not cancel the task for the others.
+        """
+        first = self.executor.submit_coalesced("req", "k", self.load, "k", 0.2)
+        second = self.executor.submit_coalesced("req", "k", self.load, "k", 0.2)
+        self.assertTrue(first.cancel())
+        self.assertEqual("loaded k", second.result(5.0))
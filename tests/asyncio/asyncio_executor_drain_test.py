@@ -0,0 +1,148 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for AsyncioExecutor.shutdown_gracefully().
+"""
+import asyncio
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+
+
+class AsyncioExecutorDrainTest(TestCase):
+    """
+    Verifies that in-flight tasks get until the drain deadline to finish,
+    and that whatever is left is cancelled and reported per submitter.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def test_idle_executor_drains_right_away(self):
+        """
+        With nothing in flight, the drain returns an empty report quickly.
+        """
+        report = self.executor.shutdown_gracefully(drain_timeout=5.0)
+        self.assertEqual(0, report["completed"])
+        self.assertEqual(0, report["cancelled"])
+        self.assertEqual({}, report["cancelled_by_submitter"])
+        self.assertLess(report["drain_seconds"], 1.0)
+
+    def test_short_tasks_finish_during_drain(self):
+        """
+        Tasks which finish before the deadline complete normally.
+        """
+        futures = [self.executor.submit_nowait("alpha", asyncio.sleep, 0.1, i) for i in range(3)]
+        report = self.executor.shutdown_gracefully(drain_timeout=5.0)
+        self.assertEqual(3, report["completed"])
+        self.assertEqual(0, report["cancelled"])
+        self.assertEqual([0, 1, 2], [future.result(0) for future in futures])
+
+    def test_long_tasks_cancelled_at_deadline(self):
+        """
+        Tasks still running at the deadline are cancelled and reported by submitter,
+        and the drain does not wait for them beyond the deadline.
+        """
+        quick = self.executor.submit_nowait("alpha", asyncio.sleep, 0.05)
+        slow_a = self.executor.submit_nowait("alpha", asyncio.sleep, 60)
+        slow_b1 = self.executor.submit_nowait("beta", asyncio.sleep, 60)
+        slow_b2 = self.executor.submit_nowait("beta", asyncio.sleep, 60)
+
+        start = time.monotonic()
+        report = self.executor.shutdown_gracefully(drain_timeout=0.5)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 5.0)
+        self.assertEqual(1, report["completed"])
+        self.assertEqual(3, report["cancelled"])
+        self.assertEqual({"alpha", "beta"}, set(report["cancelled_by_submitter"].keys()))
+        self.assertEqual(1, len(report["cancelled_by_submitter"]["alpha"]))
+        self.assertEqual(2, len(report["cancelled_by_submitter"]["beta"]))
+        self.assertIsNone(quick.result(0))
+        for future in (slow_a, slow_b1, slow_b2):
+            self.assertTrue(future.cancelled())
+
+    def test_drain_stays_within_both_timeouts(self):
+        """
+        Even with the event loop thread stuck, the whole call returns
+        within drain_timeout + cancel_timeout.
+        """
+        async def stuck_on_cancel():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                # Hold up the event loop thread well past both timeouts
+                time.sleep(2.0)
+
+        self.executor.submit_nowait("stuck", stuck_on_cancel)
+        start = time.monotonic()
+        self.executor.shutdown_gracefully(drain_timeout=0.2, cancel_timeout=0.5)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.2 + 0.5 + 0.2)
+
+    def test_tracked_tasks_are_drained(self):
+        """
+        Tasks given to track_task() are waited on, cancelled at the deadline
+        and reported like the tasks submitted to the executor.
+        """
+        async def create_foreign_task() -> asyncio.Task:
+            return asyncio.get_running_loop().create_task(asyncio.sleep(60), name="foreign")
+
+        foreign = self.executor.submit_and_wait("test", create_foreign_task, timeout=5.0)
+        self.executor.track_task(foreign)
+
+        report = self.executor.shutdown_gracefully(drain_timeout=0.2, cancel_timeout=1.0)
+
+        self.assertEqual(1, report["cancelled"])
+        self.assertEqual({"None": ["foreign"]}, report["cancelled_by_submitter"])
+        self.assertTrue(foreign.cancelled())
+
+    def test_event_loop_thread_stops_within_both_timeouts(self):
+        """
+        Tasks which keep ignoring their cancellation do not keep
+        the event loop thread from stopping by drain_timeout + cancel_timeout.
+        """
+        async def ignore_cancel():
+            while True:
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    pass
+
+        self.executor.submit_nowait("stubborn", ignore_cancel)
+        thread = self.executor._thread    # pylint: disable=protected-access
+        start = time.monotonic()
+        self.executor.shutdown_gracefully(drain_timeout=0.2, cancel_timeout=0.3)
+
+        thread.join(0.5)
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.monotonic() - start, 0.2 + 0.3 + 0.5)
+
+    def test_no_new_submissions_after_drain(self):
+        """
+        Submissions are refused once shutdown_gracefully() is called.
+        """
+        self.executor.shutdown_gracefully(drain_timeout=1.0)
+        with self.assertRaises(RuntimeError):
+            self.executor.submit("alpha", AsyncTestHelpers.dummy_async_coroutine)
+        with self.assertRaises(RuntimeError):
+            self.executor.shutdown_gracefully(drain_timeout=1.0)
@@ -0,0 +1,115 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for the min_idle warm-up and max_size bound of AsyncioExecutorPool.
+"""
+import threading
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+from leaf_common.asyncio.executor_pool_exhausted_exception import ExecutorPoolExhaustedException
+
+
+class AsyncioExecutorPoolBoundsTest(TestCase):
+    """
+    Verifies that the warmer keeps min_idle executors ready,
+    that the GC leaves them alone, and the behavior at max_size.
+    """
+
+    def setUp(self):
+        """No pool by default; tests create one with the bounds they need."""
+        self.pool = None
+
+    def tearDown(self):
+        """
+        Stop the background threads and shut down every executor of the pool.
+        """
+        if self.pool is None:
+            return
+        self.pool.shutdown()
+        for executor in list(self.pool.pool_used) + list(self.pool.pool_available):
+            executor.shutdown(wait=True)
+
+    def _wait_for_available(self, count: int):
+        deadline = time.monotonic() + 10.0
+        while len(self.pool.pool_available) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(count, len(self.pool.pool_available))
+
+    def test_warmer_keeps_min_idle(self):
+        """
+        The warmer starts min_idle executors ahead of time, and tops them up once one is taken.
+        """
+        self.pool = AsyncioExecutorPool(min_idle=2, gc_sweep_interval_seconds=60.0)
+        self._wait_for_available(2)
+        warm = list(self.pool.pool_available)
+
+        executor = self.pool.get_executor()
+        self.assertIn(executor, warm)
+        self.assertTrue(executor.get_event_loop().is_running())
+        self._wait_for_available(2)
+        self.pool.return_executor(executor)
+        self.assertTrue(self.pool.wait_for_resets(5.0))
+        self.assertEqual(3, len(self.pool.pool_available))
+
+    def test_gc_respects_min_idle(self):
+        """
+        The GC collects idle executors down to min_idle, and no further.
+        """
+        # pylint: disable=protected-access
+        self.pool = AsyncioExecutorPool(min_idle=1, idle_timeout_seconds=1.0, gc_sweep_interval_seconds=60.0)
+        self._wait_for_available(1)
+        first = self.pool.get_executor()
+        second = self.pool.get_executor()
+        # Let the warmer top up again before returning
+        self._wait_for_available(1)
+        self.pool.return_executor(first)
+        self.pool.return_executor(second)
+        self.assertTrue(self.pool.wait_for_resets(5.0))
+        self.assertEqual(3, len(self.pool.pool_available))
+
+        self.pool._sweep_once(now=time.monotonic() + 1000.0)
+        self.assertEqual(1, len(self.pool.pool_available))
+
+    def test_max_size(self):
+        """
+        At max_size, get_executor() raises right away by default,
+        or waits for an executor to be returned up to its timeout.
+        """
+        self.pool = AsyncioExecutorPool(max_size=2, gc_sweep_interval_seconds=60.0)
+        first = self.pool.get_executor()
+        self.pool.get_executor()
+        with self.assertRaises(ExecutorPoolExhaustedException):
+            self.pool.get_executor()
+        with self.assertRaises(ExecutorPoolExhaustedException):
+            self.pool.get_executor(timeout=0.1)
+
+        returner = threading.Timer(0.1, self.pool.return_executor, args=(first,))
+        returner.start()
+        self.assertIs(first, self.pool.get_executor(timeout=5.0))
+        returner.join()
+        self.assertEqual(2, len(self.pool.pool_used))
+
+    def test_invalid_bounds(self):
+        """
+        Inconsistent bounds are rejected.
+        """
+        with self.assertRaises(ValueError):
+            AsyncioExecutorPool(min_idle=3, max_size=2)
+        with self.assertRaises(ValueError):
+            AsyncioExecutorPool(reuse_mode=False, min_idle=1)
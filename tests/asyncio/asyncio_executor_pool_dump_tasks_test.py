@@ -31,14 +31,18 @@ run_coroutine_threadsafe end to end), and verify:
     the task in the result with correct name and coroutine identity;
   - multiple used executors -> one entry per executor;
   - a wedged loop -> loop_state="unresponsive_timeout" instead of
-    blocking the caller indefinitely;
-  - format_task_dump() covers the empty, responded, and unresponsive
-    branches without needing a live probe.
+    blocking the caller indefinitely, with the loop thread's stack;
+  - several wedged loops are probed in parallel, under one deadline;
+  - the summary mode counts tasks by coroutine qualname;
+  - format_task_dump() covers the empty, responded, summary and
+    unresponsive branches without needing a live probe.
 """
 import asyncio
+import threading
 import time
 from typing import List
 
+from concurrent.futures import Future
 from unittest import TestCase
 
 from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
@@ -190,7 +194,6 @@ class AsyncioExecutorPoolDumpTasksTest(TestCase):
         # callback that, once picked up, will monopolize the loop for
         # far longer than the probe timeout.
         wedge_seconds: float = 1.5
-        import threading  # pylint: disable=import-outside-toplevel
         wedge_started = threading.Event()
 
         def _wedge():
@@ -211,10 +214,79 @@ class AsyncioExecutorPoolDumpTasksTest(TestCase):
         self.assertEqual("unresponsive_timeout", entry["loop_state"],
                          f"Expected 'unresponsive_timeout' when loop is wedged; got {entry}")
         self.assertEqual([], entry["tasks"])
+        # The loop thread's stack shows what it is stuck on.
+        self.assertIn("_wedge", [frame["func"] for frame in entry["thread_stack"]])
+        self.assertIn("loop thread stack", AsyncioExecutorPool.format_task_dump(result))
 
         # Wait for the wedge to finish so tearDown can shut the loop cleanly.
         time.sleep(wedge_seconds)
 
+    def test_wedged_loops_are_probed_in_parallel(self):
+        """
+        Several wedged loops cost one timeout altogether, not one each.
+        """
+        wedge_seconds: float = 1.5
+        executors: List[AsyncioExecutor] = [self._acquire() for _ in range(3)]
+        for executor in executors:
+            wedge_started = threading.Event()
+
+            def _wedge(started=wedge_started):
+                started.set()
+                time.sleep(wedge_seconds)
+
+            executor.get_event_loop().call_soon_threadsafe(_wedge)
+            self.assertTrue(wedge_started.wait(timeout=0.5), "Wedge callback did not start in time")
+
+        start = time.monotonic()
+        result = self.pool.dump_tasks_in_used_executors(per_loop_timeout_s=0.3)
+        elapsed = time.monotonic() - start
+        self.assertLess(elapsed, 0.6, f"Probes should share one deadline; took {elapsed:.2f}s")
+        self.assertEqual(["unresponsive_timeout"] * 3,
+                         [result[str(id(executor))]["loop_state"] for executor in executors])
+
+        # Wait for the wedges to finish so tearDown can shut the loops cleanly.
+        time.sleep(wedge_seconds)
+
+    def test_summary_counts_tasks_by_coroutine(self):
+        """
+        The summary mode only counts tasks by coroutine qualname, without stacks.
+        """
+        executor: AsyncioExecutor = self._acquire()
+        for index in range(3):
+            self._schedule_sleeping_task(executor, name=f"sleeper-{index}")
+        time.sleep(0.1)
+
+        result = self.pool.dump_tasks_in_used_executors(per_loop_timeout_s=2.0, summary=True)
+        entry = result[str(id(executor))]
+        self.assertEqual("responded", entry["loop_state"])
+        self.assertNotIn("tasks", entry)
+        counts = {coro.rsplit(".", 1)[-1]: count for coro, count in entry["task_counts"].items()}
+        self.assertEqual({"_sleeper": 3}, counts)
+        self.assertIn("tasks=3", AsyncioExecutorPool.format_task_dump(result))
+
+    def test_probe_too_late_to_cancel_is_not_unresponsive(self):
+        """
+        A probe which already ran by the deadline, so can no longer be cancelled,
+        is reported by its result once delivered, and as unresponsive only
+        if that does not come in time.
+        """
+        executor: AsyncioExecutor = self._acquire()
+
+        delivered: Future = Future()
+        self.assertTrue(delivered.set_running_or_notify_cancel())
+        threading.Timer(0.01, delivered.set_result, ([],)).start()
+        # pylint: disable=protected-access
+        entry = self.pool._get_probe_entry(executor, delivered, summary=False)
+        self.assertEqual("responded", entry["loop_state"])
+        self.assertEqual([], entry["tasks"])
+
+        stuck: Future = Future()
+        self.assertTrue(stuck.set_running_or_notify_cancel())
+        entry = self.pool._get_probe_entry(executor, stuck, summary=False)
+        self.assertEqual("unresponsive_timeout", entry["loop_state"])
+        self.assertIn("thread_stack", entry)
+        stuck.set_result([])
+
 
 class AsyncioExecutorPoolFormatTaskDumpTest(TestCase):
     """
@@ -257,6 +329,16 @@ class AsyncioExecutorPoolFormatTaskDumpTest(TestCase):
         self.assertIn("/tmp/x.py", text)
         self.assertIn("line 17", text)
 
+    def test_summary_dump_renders_counts(self):
+        """
+        A summary entry renders one line per coroutine, with its count.
+        """
+        dump = {"5": {"loop_state": "responded", "task_counts": {"my.module.do_work": 12, "other": 1}}}
+        text = AsyncioExecutorPool.format_task_dump(dump)
+        self.assertIn("tasks=13", text)
+        self.assertIn("    12  my.module.do_work", text)
+        self.assertIn("     1  other", text)
+
     def test_unresponsive_dump_still_renders_cleanly(self):
         """
         An unresponsive_timeout entry has no tasks; format_task_dump
@@ -28,6 +28,7 @@ test exercises the periodic thread with a tight sweep interval.
 import threading
 import time
 
+from collections import deque
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -65,14 +66,14 @@ class AsyncioExecutorPoolGcTest(TestCase):
         self.pool = AsyncioExecutorPool(reuse_mode=True, idle_timeout_seconds=10.0)
         self.pool.shutdown()  # stop background GC; this test drives _sweep_once() manually
         mock_executor = MagicMock()
-        self.pool.pool_available = [mock_executor]
+        self.pool.pool_available = deque([mock_executor])
         self.pool._returned_at[id(mock_executor)] = 100.0
 
         # Simulate 100 seconds elapsed (> 10s threshold).
         self.pool._sweep_once(now=200.0)
 
         self.assertEqual(
-            [], self.pool.pool_available,
+            [], list(self.pool.pool_available),
             "Expected the stale executor to be removed from pool_available."
         )
         self.assertEqual(
@@ -90,14 +91,14 @@ class AsyncioExecutorPoolGcTest(TestCase):
         self.pool = AsyncioExecutorPool(reuse_mode=True, idle_timeout_seconds=10.0)
         self.pool.shutdown()  # stop background GC; this test drives _sweep_once() manually
         mock_executor = MagicMock()
-        self.pool.pool_available = [mock_executor]
+        self.pool.pool_available = deque([mock_executor])
         self.pool._returned_at[id(mock_executor)] = 100.0
 
         # 5 seconds elapsed (< 10s threshold).
         self.pool._sweep_once(now=105.0)
 
         self.assertEqual(
-            [mock_executor], self.pool.pool_available,
+            [mock_executor], list(self.pool.pool_available),
             "Expected the fresh executor to remain in pool_available."
         )
         self.assertIn(
@@ -119,7 +120,7 @@ class AsyncioExecutorPoolGcTest(TestCase):
         stale_b = MagicMock(name="stale_b")
         fresh_c = MagicMock(name="fresh_c")
         fresh_d = MagicMock(name="fresh_d")
-        self.pool.pool_available = [stale_a, stale_b, fresh_c, fresh_d]
+        self.pool.pool_available = deque([stale_a, stale_b, fresh_c, fresh_d])
         self.pool._returned_at = {
             id(stale_a): 100.0,
             id(stale_b): 101.0,
@@ -131,7 +132,7 @@ class AsyncioExecutorPoolGcTest(TestCase):
         self.pool._sweep_once(now=200.0)
 
         self.assertEqual(
-            [fresh_c, fresh_d], self.pool.pool_available,
+            [fresh_c, fresh_d], list(self.pool.pool_available),
             "Expected only the fresh executors to remain, in order."
         )
         self.assertEqual(
@@ -151,13 +152,13 @@ class AsyncioExecutorPoolGcTest(TestCase):
         # pylint: disable=attribute-defined-outside-init,protected-access
         self.pool = AsyncioExecutorPool(reuse_mode=False, idle_timeout_seconds=10.0)
         mock_executor = MagicMock()
-        self.pool.pool_available = [mock_executor]
+        self.pool.pool_available = deque([mock_executor])
         self.pool._returned_at[id(mock_executor)] = 100.0
 
         self.pool._sweep_once(now=10_000.0)
 
         self.assertEqual(
-            [mock_executor], self.pool.pool_available,
+            [mock_executor], list(self.pool.pool_available),
             "Expected non-reuse mode to skip GC entirely; pool_available untouched."
         )
         mock_executor.shutdown.assert_not_called()
@@ -185,12 +186,12 @@ class AsyncioExecutorPoolGcTest(TestCase):
 
         stale_executor = MagicMock(name="stale")
         with self.pool.lock:
-            self.pool.pool_available = [stale_executor]
+            self.pool.pool_available = deque([stale_executor])
             self.pool._returned_at[id(stale_executor)] = -10_000.0
 
         # Put a different executor through the get/return cycle.
         returning = MagicMock(name="returning")
-        self.pool.pool_used = [returning]
+        self.pool.pool_used = {returning}
         self.pool.return_executor(returning)
 
         # The stale executor is still there: no caller-side sweep.
@@ -200,12 +201,15 @@ class AsyncioExecutorPoolGcTest(TestCase):
         )
         stale_executor.shutdown.assert_not_called()
 
-        # get_executor() can reuse a stale entry, but still does not shut it down.
-        # FIFO order: stale_executor was added first, so it's at the head.
-        result = self.pool.get_executor()
+        # get_executor() reuses the most recently returned executor first,
+        # and can then reuse a stale entry, but still does not shut it down.
         self.assertIs(
-            result, stale_executor,
-            "Expected get_executor() to reuse the head entry without sweeping."
+            self.pool.get_executor(), returning,
+            "Expected get_executor() to reuse the warm end first."
+        )
+        self.assertIs(
+            self.pool.get_executor(), stale_executor,
+            "Expected get_executor() to reuse the stale entry without sweeping."
         )
         stale_executor.shutdown.assert_not_called()
 
@@ -230,7 +234,7 @@ class AsyncioExecutorPoolGcTest(TestCase):
 
         mock_executor.shutdown.side_effect = _mark_shutdown
         with self.pool.lock:
-            self.pool.pool_available = [mock_executor]
+            self.pool.pool_available = deque([mock_executor])
             # Backdate the entry so it's stale immediately.
             self.pool._returned_at[id(mock_executor)] = 0.0
 
@@ -302,7 +306,7 @@ class AsyncioExecutorPoolGcTest(TestCase):
 
         base = time.monotonic()
         with self.pool.lock:
-            self.pool.pool_available = [bad_executor, good_executor]
+            self.pool.pool_available = deque([bad_executor, good_executor])
             self.pool._returned_at = {
                 id(bad_executor): base,
                 id(good_executor): base,
@@ -313,7 +317,7 @@ class AsyncioExecutorPoolGcTest(TestCase):
 
         bad_executor.shutdown.assert_called_once_with(wait=True)
         good_executor.shutdown.assert_called_once_with(wait=True)
-        self.assertEqual([], self.pool.pool_available)
+        self.assertEqual([], list(self.pool.pool_available))
         self.assertTrue(
             self.pool._gc_thread.is_alive(),
             "Expected the GC thread itself to remain alive."
@@ -0,0 +1,158 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for AsyncioExecutorPool.lease().
+"""
+import asyncio
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+from leaf_common.asyncio.executor_lease import ExecutorLease
+from leaf_common.asyncio.executor_pool_exhausted_exception import ExecutorPoolExhaustedException
+
+
+async def add(first: int, second: int) -> int:
+    """
+    Trivial coroutine to run on a leased executor.
+    """
+    return first + second
+
+
+class AsyncioExecutorPoolLeaseTest(TestCase):
+    """
+    Verifies that leased executors are always returned, the waiting
+    and timing out at max_size, the async with form, and the lease metrics.
+    """
+
+    def setUp(self):
+        """Create a pool bounded to one executor."""
+        self.pool = AsyncioExecutorPool(max_size=1, gc_sweep_interval_seconds=60.0)
+
+    def tearDown(self):
+        """
+        Stop the background threads and shut down every executor of the pool.
+        """
+        self.pool.shutdown()
+        for executor in list(self.pool.pool_used) + list(self.pool.pool_available):
+            executor.shutdown(wait=True)
+
+    def test_lease_returns_on_exception(self):
+        """
+        The executor goes back to the pool even when the block raises.
+        """
+        with self.assertRaises(KeyError):
+            with self.pool.lease() as executor:
+                self.assertEqual(3, executor.submit_and_wait("test", add, 1, 2, timeout=5.0))
+                self.assertIn(executor, self.pool.pool_used)
+                raise KeyError("boom")
+        self.assertTrue(self.pool.wait_for_resets(5.0))
+        self.assertEqual(0, len(self.pool.pool_used))
+        self.assertEqual([executor], list(self.pool.pool_available))
+
+        lease = self.pool.lease()
+        with lease:
+            with self.assertRaises(RuntimeError):
+                with lease:
+                    pass
+
+    def test_lease_waits_then_times_out(self):
+        """
+        At max_size a lease waits for another to exit, or times out.
+        """
+        with self.pool.lease() as executor:
+            start = time.monotonic()
+            with self.assertRaises(ExecutorPoolExhaustedException):
+                with self.pool.lease(timeout=0.2):
+                    self.fail("No executor should be available")
+            self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+            waited = []
+
+            def waiter():
+                with self.pool.lease(timeout=5.0) as other:
+                    waited.append(other)
+
+            thread = threading.Thread(target=waiter)
+            thread.start()
+            time.sleep(0.1)
+            self.assertEqual([], waited)
+        thread.join(5.0)
+        self.assertEqual([executor], waited)
+
+    def test_async_lease(self):
+        """
+        The async with form leases and returns an executor without blocking the caller's loop.
+        """
+        async def use_lease() -> int:
+            async with self.pool.lease(timeout=5.0) as executor:
+                return await asyncio.wrap_future(executor.submit("test", add, 2, 3))
+
+        self.assertEqual(5, asyncio.run(use_lease()))
+        self.assertTrue(self.pool.wait_for_resets(5.0))
+        self.assertEqual(0, len(self.pool.pool_used))
+        self.assertEqual(1, len(self.pool.pool_available))
+
+    def test_async_lease_returns_when_cancelled_on_exit(self):
+        """
+        Cancelling the caller while the return of the executor is still queued
+        does not keep the executor from going back to the pool.
+        """
+        returned = threading.Event()
+        lease = ExecutorLease(lambda: "executor", lambda executor: returned.set())
+        unblock = threading.Event()
+
+        async def cancel_during_return() -> bool:
+            loop = asyncio.get_running_loop()
+            # A single worker thread, kept busy so the return stays queued.
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+            blockers = []
+
+            async def use_lease():
+                async with lease:
+                    blockers.append(loop.run_in_executor(None, unblock.wait, 5.0))
+
+            using = asyncio.ensure_future(use_lease())
+            await asyncio.sleep(0.1)
+            using.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await using
+            unblock.set()
+            return await loop.run_in_executor(None, returned.wait, 5.0)
+
+        self.assertTrue(asyncio.run(cancel_during_return()))
+
+    def test_lease_metrics(self):
+        """
+        Lease counts, timeouts, waits and durations are all reported.
+        """
+        with self.pool.lease():
+            self.assertEqual(1, self.pool.get_lease_metrics()["active"])
+            time.sleep(0.1)
+            with self.assertRaises(ExecutorPoolExhaustedException):
+                with self.pool.lease(timeout=0.0):
+                    pass
+
+        metrics = self.pool.get_lease_metrics()
+        self.assertEqual(1, metrics["leases"])
+        self.assertEqual(0, metrics["active"])
+        self.assertEqual(1, metrics["timeouts"])
+        self.assertEqual(1, metrics["wait"]["count"])
+        self.assertEqual(1, metrics["duration"]["count"])
+        self.assertGreaterEqual(metrics["duration"]["max_ms"], 90)
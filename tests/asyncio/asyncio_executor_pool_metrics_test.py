@@ -26,6 +26,7 @@ the aggregation arithmetic.
 """
 from typing import Tuple
 
+from collections import deque
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -91,9 +92,8 @@ class AsyncioExecutorPoolMetricsTest(TestCase):
         self.pool = AsyncioExecutorPool(reuse_mode=True)
         # Replace the freshly-acquired real executor with a mock so the
         # threads/running counts are deterministic.
-        self.pool.get_executor()
-        self.pool.pool_used[0].shutdown(wait=True)
-        self.pool.pool_used[0] = self.make_metrics_executor(threads=2, running=1)
+        self.pool.get_executor().shutdown(wait=True)
+        self.pool.pool_used = {self.make_metrics_executor(threads=2, running=1)}
 
         metrics = self.pool.get_threads_metrics()
 
@@ -118,11 +118,12 @@ class AsyncioExecutorPoolMetricsTest(TestCase):
         executor = self.pool.get_executor()
         # Swap in a mock with deterministic metrics, mirroring what would
         # happen if the real executor were idle after a return.
-        self.pool.pool_used[0].shutdown(wait=True)
+        executor.shutdown(wait=True)
         mock_executor = self.make_metrics_executor(threads=2, running=0)
-        self.pool.pool_used[0] = mock_executor
+        self.pool.pool_used = {mock_executor}
 
         self.pool.return_executor(mock_executor)
+        self.assertTrue(self.pool.wait_for_resets(5.0))
 
         metrics = self.pool.get_threads_metrics()
         self.assertEqual(
@@ -153,9 +154,9 @@ class AsyncioExecutorPoolMetricsTest(TestCase):
         executor = self.pool.get_executor()
         # Replace with a mock to make the assertion that shutdown() was
         # called clean and to avoid a real shutdown race.
-        self.pool.pool_used[0].shutdown(wait=True)
+        executor.shutdown(wait=True)
         mock_executor = self.make_metrics_executor(threads=2, running=1)
-        self.pool.pool_used[0] = mock_executor
+        self.pool.pool_used = {mock_executor}
 
         self.pool.return_executor(mock_executor)
 
@@ -182,15 +183,15 @@ class AsyncioExecutorPoolMetricsTest(TestCase):
         """
         # pylint: disable=attribute-defined-outside-init
         self.pool = AsyncioExecutorPool(reuse_mode=True)
-        self.pool.pool_used = [
+        self.pool.pool_used = {
             self.make_metrics_executor(threads=4, running=2),
             self.make_metrics_executor(threads=3, running=3),
             self.make_metrics_executor(threads=2, running=0),
-        ]
-        self.pool.pool_available = [
+        }
+        self.pool.pool_available = deque([
             self.make_metrics_executor(threads=5, running=0),
             self.make_metrics_executor(threads=1, running=0),
-        ]
+        ])
 
         metrics = self.pool.get_threads_metrics()
 
@@ -0,0 +1,143 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for the background reset of executors returned to AsyncioExecutorPool.
+"""
+import asyncio
+import threading
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+
+async def slow_to_cancel(started: threading.Event, seconds: float):
+    """
+    Take its time to acknowledge cancellation.
+    """
+    started.set()
+    try:
+        await asyncio.sleep(60.0)
+    except asyncio.CancelledError:
+        await asyncio.sleep(seconds)
+        raise
+
+
+async def wedge_loop(started: threading.Event, seconds: float):
+    """
+    Hold the event loop thread without yielding, once the submission has returned.
+    """
+    await asyncio.sleep(0)
+    started.set()
+    time.sleep(seconds)
+
+
+class AsyncioExecutorPoolResetTest(TestCase):
+    """
+    Verifies that return_executor() does not wait for the clean up,
+    that executors failing their reset are quarantined and replaced,
+    and that executors being reset count towards max_size.
+    """
+
+    def setUp(self):
+        """No pool by default; tests create one with the settings they need."""
+        self.pool = None
+
+    def tearDown(self):
+        """
+        Stop the background threads and shut down every executor of the pool.
+        """
+        if self.pool is None:
+            return
+        self.pool.wait_for_resets(10.0)
+        self.pool.shutdown()
+        for executor in list(self.pool.pool_used) + list(self.pool.pool_available):
+            executor.shutdown(wait=True)
+
+    def test_return_does_not_wait_for_drain(self):
+        """
+        The returning thread does not wait for tasks to drain;
+        the executor is available again once they have.
+        """
+        self.pool = AsyncioExecutorPool(gc_sweep_interval_seconds=60.0)
+        executor = self.pool.get_executor()
+        started = threading.Event()
+        executor.submit("test", slow_to_cancel, started, 0.3)
+        self.assertTrue(started.wait(5.0))
+
+        start = time.monotonic()
+        self.pool.return_executor(executor)
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(0, len(self.pool.pool_available))
+        self.assertEqual(1, self.pool.get_reset_metrics()["resetting"])
+
+        self.assertTrue(self.pool.wait_for_resets(5.0))
+        self.assertEqual([executor], list(self.pool.pool_available))
+        metrics = self.pool.get_reset_metrics()
+        self.assertEqual(0, metrics["resetting"])
+        self.assertEqual(1, metrics["resets"])
+        self.assertEqual(0, metrics["quarantined"])
+        self.assertGreaterEqual(metrics["reset_time"]["max_ms"], 250)
+
+    def test_wedged_executor_is_quarantined_and_replaced(self):
+        """
+        An executor whose tasks do not drain in time is shut down, and a new one takes its place.
+        """
+        self.pool = AsyncioExecutorPool(gc_sweep_interval_seconds=60.0, reset_timeout_seconds=0.2)
+        executor = self.pool.get_executor()
+        started = threading.Event()
+        executor.submit("test", wedge_loop, started, 1.0)
+        self.assertTrue(started.wait(5.0))
+
+        self.pool.return_executor(executor)
+        self.assertTrue(self.pool.wait_for_resets(5.0))
+        self.assertEqual(1, len(self.pool.pool_available))
+        replacement = self.pool.pool_available[0]
+        self.assertIsNot(executor, replacement)
+        self.assertTrue(replacement.is_healthy(5.0))
+        self.assertFalse(executor.is_healthy(0.1))
+
+        metrics = self.pool.get_reset_metrics()
+        self.assertEqual(1, metrics["quarantined"])
+        self.assertEqual(1, metrics["replaced"])
+
+    def test_resetting_counts_towards_max_size(self):
+        """
+        At max_size, get_executor() waits for the reset of a returned executor, and reuses it.
+        """
+        self.pool = AsyncioExecutorPool(max_size=1, gc_sweep_interval_seconds=60.0)
+        executor = self.pool.get_executor()
+        started = threading.Event()
+        executor.submit("test", slow_to_cancel, started, 0.3)
+        self.assertTrue(started.wait(5.0))
+
+        self.pool.return_executor(executor)
+        self.assertIs(executor, self.pool.get_executor(timeout=5.0))
+        self.assertEqual(1, self.pool.get_reset_metrics()["resets"])
+        self.pool.return_executor(executor)
+
+    def test_is_healthy(self):
+        """
+        An executor is healthy while its loop runs, and not once shut down.
+        """
+        executor = AsyncioExecutor()
+        self.assertFalse(executor.is_healthy(0.1))
+        executor.start()
+        self.assertTrue(executor.is_healthy(5.0))
+        executor.shutdown(wait=True)
+        self.assertFalse(executor.is_healthy(0.1))
@@ -0,0 +1,210 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for task priorities on AsyncioExecutor and AdmissionController.
+"""
+import asyncio
+import threading
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.admission_controller import AdmissionController
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.task_priority import TaskPriority
+from leaf_common.asyncio.task_rejected_exception import TaskRejectedException
+
+
+async def block_loop(started: threading.Event, seconds: float):
+    """
+    Hold the event loop thread without yielding.
+    """
+    started.set()
+    time.sleep(seconds)
+
+
+async def record(order: list, label: str):
+    """
+    Record the order in which tasks start.
+    """
+    order.append(label)
+
+
+async def wait_for_event(event: asyncio.Event):
+    """
+    Wait for an asyncio.Event set from the test.
+    """
+    await event.wait()
+
+
+class AsyncioExecutorPriorityTest(TestCase):
+    """
+    Verifies that more urgent submissions are created and admitted first,
+    cooperative yielding, and the starvation metrics.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_submissions_created_in_priority_order(self):
+        """
+        Submissions queued while the event loop is busy start most urgent first,
+        and in submission order within a priority.
+        """
+        started = threading.Event()
+        blocker = self.executor.submit_nowait("bulk", block_loop, started, 0.3)
+        self.assertTrue(started.wait(5.0))
+
+        order = []
+        results = [
+            self.executor.submit_nowait("bulk", record, order, "low-1", priority=TaskPriority.LOW),
+            self.executor.submit_nowait("bulk", record, order, "low-2", priority=TaskPriority.LOW),
+            self.executor.submit_nowait("user", record, order, "normal"),
+            self.executor.submit_nowait("health", record, order, "high", priority=TaskPriority.HIGH),
+        ]
+        blocker.result(5.0)
+        for result in results:
+            result.result(5.0)
+        self.assertEqual(["high", "normal", "low-1", "low-2"], order)
+
+        metrics = self.executor.get_priority_metrics()
+        self.assertEqual({"high", "normal", "low"}, set(metrics.keys()))
+        self.assertEqual(2, metrics["low"]["dequeued"])
+        self.assertEqual(0, metrics["low"]["waiting"])
+        self.assertGreater(metrics["low"]["queue_wait"]["max_ms"], 100)
+
+    def test_invalid_priority(self):
+        """
+        Unknown priorities are rejected.
+        """
+        with self.assertRaises(ValueError):
+            self.executor.submit_nowait("test", record, [], "x", priority=7)
+
+    def test_yield_waits_for_more_urgent_tasks(self):
+        """
+        yield_to_higher_priority() waits while a more urgent task is in flight,
+        resumes when it is done, and is bounded by max_wait.
+        """
+        event = asyncio.Event()
+        high = self.executor.submit_nowait("health", wait_for_event, event, priority=TaskPriority.HIGH)
+
+        async def yielding(max_wait: float) -> float:
+            start = time.monotonic()
+            await self.executor.yield_to_higher_priority(max_wait=max_wait)
+            return time.monotonic() - start
+
+        # Bounded by max_wait while the urgent task is still running
+        waited = self.executor.submit_and_wait("bulk", yielding, 0.1, priority=TaskPriority.LOW, timeout=5.0)
+        self.assertGreaterEqual(waited, 0.09)
+        self.assertEqual(1, self.executor.get_priority_metrics()["high"]["in_flight"])
+
+        # Resumes as soon as the urgent task is done
+        low = self.executor.submit_nowait("bulk", yielding, 10.0, priority=TaskPriority.LOW)
+        time.sleep(0.1)
+        self.assertFalse(low.done())
+        self.executor.get_event_loop().call_soon_threadsafe(event.set)
+        self.assertLess(low.result(5.0), 5.0)
+        high.result(5.0)
+
+        metrics = self.executor.get_priority_metrics()
+        self.assertEqual(0, metrics["high"]["in_flight"])
+        self.assertEqual(2, metrics["low"]["yield_wait"]["count"])
+
+        # Nothing more urgent in flight: no waiting
+        self.assertLess(self.executor.submit_and_wait("bulk", yielding, 10.0, priority=TaskPriority.LOW,
+                                                      timeout=5.0), 1.0)
+
+    def test_admission_prefers_more_urgent_waiters(self):
+        """
+        Under OVERFLOW_BLOCK, a freed slot goes to the most urgent waiter.
+        """
+        controller = AdmissionController(max_in_flight=1)
+        holder = controller.acquire("holder")
+        admitted = []
+
+        def waiter(label: str, priority: int):
+            ticket = controller.acquire(label, priority=priority)
+            admitted.append(label)
+            time.sleep(0.05)
+            controller.release(ticket)
+
+        low = threading.Thread(target=waiter, args=("low", TaskPriority.LOW))
+        low.start()
+        self._wait_for_waiting(controller, 1)
+        high = threading.Thread(target=waiter, args=("high", TaskPriority.HIGH))
+        high.start()
+        self._wait_for_waiting(controller, 2)
+        self.assertEqual({"high": 1, "normal": 0, "low": 1}, controller.get_metrics()["waiting_by_priority"])
+
+        controller.release(holder)
+        low.join(5.0)
+        high.join(5.0)
+        self.assertEqual(["high", "low"], admitted)
+
+    def test_admission_gives_up_wakes_less_urgent(self):
+        """
+        A more urgent waiter timing out does not leave less urgent ones stuck.
+        """
+        controller = AdmissionController(max_in_flight=1, block_timeout_seconds=0.2)
+        holder = controller.acquire("holder")
+        high_result = []
+
+        def high_waiter():
+            try:
+                controller.acquire("high", priority=TaskPriority.HIGH)
+            except TaskRejectedException as exception:
+                high_result.append(exception)
+
+        high = threading.Thread(target=high_waiter)
+        high.start()
+        self._wait_for_waiting(controller, 1)
+        high.join(5.0)
+        self.assertEqual(1, len(high_result))
+
+        controller.release(holder)
+        controller.acquire("low", priority=TaskPriority.LOW)
+
+    def test_shedding_prefers_least_urgent(self):
+        """
+        Under OVERFLOW_SHED_OLDEST, the least urgent task is shed, never a more urgent one.
+        """
+        controller = AdmissionController(max_in_flight=2, overflow_policy=AdmissionController.OVERFLOW_SHED_OLDEST)
+        shed = []
+        high = controller.acquire("a", priority=TaskPriority.HIGH)
+        controller.attach(high, lambda: shed.append("high"))
+        low = controller.acquire("b", priority=TaskPriority.LOW)
+        controller.attach(low, lambda: shed.append("low"))
+
+        normal = controller.acquire("c")
+        controller.attach(normal, lambda: shed.append("normal"))
+        self.assertEqual(["low"], shed)
+
+        with self.assertRaises(TaskRejectedException):
+            controller.acquire("d", priority=TaskPriority.LOW)
+        self.assertEqual(["low"], shed)
+
+    @staticmethod
+    def _wait_for_waiting(controller: AdmissionController, count: int):
+        deadline = time.monotonic() + 5.0
+        while controller.get_metrics()["waiting"] < count and time.monotonic() < deadline:
+            time.sleep(0.01)
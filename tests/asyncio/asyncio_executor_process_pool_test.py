@@ -0,0 +1,112 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for running CPU-bound functions of an AsyncioExecutor
+in an AsyncioProcessPoolExecutor.
+"""
+import os
+
+from multiprocessing import get_context
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.asyncio_process_pool_executor import AsyncioProcessPoolExecutor
+from tests.asyncio.sync_test_helpers import SyncTestHelpers
+
+
+class AsyncioExecutorProcessPoolTest(TestCase):
+    """
+    Verifies routing of marked functions to worker processes,
+    warm start, and process metrics.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Process pools are expensive to start, so share one across tests."""
+        cls.process_pool = AsyncioProcessPoolExecutor(max_workers=2, warm_start=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the shared process pool."""
+        cls.process_pool.shutdown(wait=True)
+
+    def setUp(self):
+        """Create and start a fresh executor using the shared process pool."""
+        self.executor = AsyncioExecutor(process_pool_executor=self.process_pool)
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_marker(self):
+        """
+        cpu_bound() marks the function and returns it unchanged.
+        """
+        self.assertTrue(AsyncioProcessPoolExecutor.is_cpu_bound(SyncTestHelpers.cpu_bound_sum_of_squares))
+        self.assertFalse(AsyncioProcessPoolExecutor.is_cpu_bound(SyncTestHelpers.current_pid))
+
+    def test_default_start_method(self):
+        """
+        Worker processes are spawned unless the caller asks otherwise,
+        since forking a process which already runs event loop threads is not safe.
+        """
+        # pylint: disable=protected-access
+        self.assertEqual("spawn", self.process_pool._mp_context.get_start_method())
+        forking_pool = AsyncioProcessPoolExecutor(max_workers=1, mp_context=get_context("fork"))
+        try:
+            self.assertEqual("fork", forking_pool._mp_context.get_start_method())
+        finally:
+            forking_pool.shutdown(wait=True)
+
+    def test_warm_start_starts_all_processes(self):
+        """
+        A warm-started pool has all its worker processes up before any work.
+        """
+        num_processes, num_running = self.executor.get_processes_metrics()
+        self.assertEqual(2, num_processes)
+        self.assertEqual(0, num_running)
+
+    def test_marked_function_runs_in_worker_process(self):
+        """
+        A cpu_bound function runs in another process and its result comes back.
+        """
+        pid, result = self.executor.submit_and_wait(
+            "cpu", SyncTestHelpers.cpu_bound_sum_of_squares, 4, timeout=10.0)
+        self.assertNotEqual(os.getpid(), pid)
+        self.assertEqual(0 + 1 + 4 + 9, result)
+
+    def test_unmarked_function_runs_in_worker_thread(self):
+        """
+        Functions which are not marked keep running in worker threads.
+        """
+        pid = self.executor.submit_and_wait("io", SyncTestHelpers.current_pid, timeout=10.0)
+        self.assertEqual(os.getpid(), pid)
+
+    def test_no_process_pool(self):
+        """
+        Without a process pool, marked functions run in worker threads
+        and process metrics are zero.
+        """
+        executor = AsyncioExecutor()
+        executor.start()
+        try:
+            pid, _ = executor.submit_and_wait("cpu", SyncTestHelpers.cpu_bound_sum_of_squares, 4, timeout=10.0)
+            self.assertEqual(os.getpid(), pid)
+            self.assertEqual((0, 0), executor.get_processes_metrics())
+        finally:
+            executor.shutdown(wait=True)
@@ -0,0 +1,136 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for per-submitter rate limits on AsyncioExecutor.
+"""
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.token_bucket import TokenBucket
+
+
+async def started_at() -> float:
+    """
+    Return when the task started.
+    """
+    return time.monotonic()
+
+
+class AsyncioExecutorRateLimitTest(TestCase):
+    """
+    Verifies token buckets, and that rate limited submitters wait
+    inside the event loop without holding back other submitters.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_token_bucket(self):
+        """
+        A full bucket allows a burst, then spaces reservations out at its rate.
+        """
+        bucket = TokenBucket(rate=10.0, burst=2, now=100.0)
+        self.assertEqual(0.0, bucket.reserve(100.0))
+        self.assertEqual(0.0, bucket.reserve(100.0))
+        self.assertAlmostEqual(0.1, bucket.reserve(100.0))
+        self.assertAlmostEqual(0.2, bucket.reserve(100.0))
+        # Refills, but never beyond the burst
+        self.assertEqual(0.0, bucket.reserve(200.0))
+        self.assertEqual(0.0, bucket.reserve(200.0))
+        self.assertGreater(bucket.reserve(200.0), 0.0)
+        # Refunds undo a reservation, also never beyond the burst
+        bucket.refund(200.0)
+        self.assertAlmostEqual(0.1, bucket.reserve(200.0))
+        bucket.refund(300.0)
+        self.assertEqual(2, bucket.tokens)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0.0, burst=1, now=0.0)
+
+    def test_limited_submitter_is_spaced_out(self):
+        """
+        Tasks over the limit start at the limited rate, without blocking the submitting thread
+        or other submitters, and the throttling shows up in the metrics.
+        """
+        self.executor.set_rate_limit("expensive", rate=20.0, burst=1)
+        submitted_at = time.monotonic()
+        limited = [self.executor.submit_nowait("expensive", started_at) for _ in range(5)]
+        self.assertLess(time.monotonic() - submitted_at, 0.1)
+        other = self.executor.submit_nowait("cheap", started_at)
+
+        starts = [result.result(5.0) for result in limited]
+        self.assertLess(other.result(5.0) - submitted_at, 0.1)
+        self.assertGreaterEqual(starts[-1] - starts[0], 0.19)
+
+        metrics = self.executor.get_rate_limit_metrics()
+        self.assertEqual({"expensive"}, set(metrics.keys()))
+        self.assertEqual(5, metrics["expensive"]["started"])
+        self.assertEqual(4, metrics["expensive"]["throttled"])
+        self.assertGreater(metrics["expensive"]["throttled_seconds"], 0.4)
+        self.assertEqual(20.0, metrics["expensive"]["rate"])
+
+    def test_throttled_task_can_be_cancelled(self):
+        """
+        A task waiting for its turn can be cancelled, and removing the limit lifts it for new tasks.
+        """
+        self.executor.set_rate_limit("expensive", rate=0.5, burst=1)
+        self.executor.submit_nowait("expensive", started_at).result(5.0)
+        waiting = self.executor.submit_nowait("expensive", started_at)
+        time.sleep(0.1)
+        self.assertFalse(waiting.done())
+        self.assertTrue(waiting.cancel())
+
+        self.executor.remove_rate_limit("expensive")
+        self.executor.submit_nowait("expensive", started_at).result(1.0)
+        self.assertEqual({}, self.executor.get_rate_limit_metrics())
+
+    def test_cancelled_throttled_task_gives_back_its_token(self):
+        """
+        A task cancelled while waiting for its turn does not use up
+        the submitter's rate budget: the next task takes its place.
+        """
+        self.executor.set_rate_limit("expensive", rate=2.0, burst=1)
+        self.executor.submit_nowait("expensive", started_at).result(5.0)
+        waiting = self.executor.submit_nowait("expensive", started_at)
+        time.sleep(0.1)
+        self.assertTrue(waiting.cancel())
+        time.sleep(0.1)
+
+        submitted_at = time.monotonic()
+        # Would be pushed back to a full second after the first task without the refund
+        self.assertLess(self.executor.submit_nowait("expensive", started_at).result(5.0) - submitted_at, 0.45)
+
+        metrics = self.executor.get_rate_limit_metrics()["expensive"]
+        self.assertEqual(2, metrics["started"])
+        self.assertEqual(1, metrics["throttled"])
+        self.assertEqual(1, metrics["refunded"])
+
+    def test_sync_functions_are_limited(self):
+        """
+        Synchronous functions run in worker threads are limited too.
+        """
+        self.executor.set_rate_limit("sync", rate=20.0, burst=1)
+        starts = [self.executor.submit_nowait("sync", time.monotonic) for _ in range(3)]
+        results = [result.result(5.0) for result in starts]
+        self.assertGreaterEqual(results[-1] - results[0], 0.09)
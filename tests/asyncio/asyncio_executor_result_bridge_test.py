@@ -0,0 +1,123 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for the cross-thread result bridge on AsyncioExecutor:
+submit_and_wait() and get_result_future().
+"""
+import threading
+import time
+
+from concurrent import futures
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+from tests.asyncio.sync_test_helpers import SyncTestHelpers
+
+
+class AsyncioExecutorResultBridgeTest(TestCase):
+    """
+    Verifies that synchronous callers on other threads can wait on
+    results of tasks in the executor's event loop without polling.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_submit_and_wait_returns_result(self):
+        """
+        submit_and_wait() returns the result of the function.
+        """
+        result_holder = []
+        result = self.executor.submit_and_wait(
+            "bridge", AsyncTestHelpers.async_function_with_result, result_holder, 4, timeout=5.0)
+        self.assertEqual(8, result)
+
+        result = self.executor.submit_and_wait(
+            "bridge", SyncTestHelpers.sync_with_args_and_result, result_holder, 1, 2, multiplier=3)
+        self.assertIsNone(result)
+        self.assertEqual([4, 9], result_holder)
+
+    def test_submit_and_wait_raises_function_exception(self):
+        """
+        Exceptions from the function are raised in the caller.
+        """
+        with self.assertRaises(ValueError):
+            self.executor.submit_and_wait("bridge", AsyncTestHelpers.failing_async_function, timeout=5.0)
+
+    def test_submit_and_wait_timeout_cancels_task(self):
+        """
+        Reaching the timeout raises TimeoutError and cancels the task,
+        which is counted as a timeout like for the other submit methods.
+        """
+        started = threading.Event()
+        cancelled = []
+        start_time = time.monotonic()
+        with self.assertRaises(futures.TimeoutError):
+            self.executor.submit_and_wait(
+                "bridge", AsyncTestHelpers.long_running_task_with_cancel, started, cancelled, 3, timeout=0.2)
+        self.assertLess(time.monotonic() - start_time, 2.0)
+
+        time.sleep(0.2)
+        self.assertEqual([3], cancelled)
+        self.assertEqual(1, self.executor.get_task_metrics()["bridge"]["timeouts"])
+
+    def test_get_result_future_for_submitted_task(self):
+        """
+        get_result_future() bridges a Task returned by submit().
+        """
+        result_holder = []
+        task = self.executor.submit("bridge", AsyncTestHelpers.async_function_with_result, result_holder, 5)
+        future = self.executor.get_result_future(task)
+        self.assertIsInstance(future, futures.Future)
+        self.assertEqual(10, future.result(timeout=5.0))
+
+        # Bridging an already finished task works too.
+        future = self.executor.get_result_future(task)
+        self.assertEqual(10, future.result(timeout=5.0))
+
+    def test_get_result_future_cancel_propagates(self):
+        """
+        Cancelling the bridged Future cancels the Task.
+        """
+        started = threading.Event()
+        task = self.executor.submit("bridge", AsyncTestHelpers.cancellable_task_with_event, started)
+        self.assertTrue(started.wait(timeout=5.0))
+        future = self.executor.get_result_future(task)
+        # Give the loop a chance to chain the future to the task.
+        time.sleep(0.1)
+        self.assertTrue(future.cancel())
+        time.sleep(0.2)
+        self.assertTrue(task.cancelled())
+
+    def test_get_result_future_reports_task_cancellation(self):
+        """
+        A Task cancelled in the executor shows up as a cancelled Future.
+        """
+        started = threading.Event()
+        task = self.executor.submit("bridge", AsyncTestHelpers.cancellable_task_with_event, started)
+        future = self.executor.get_result_future(task)
+        self.assertTrue(started.wait(timeout=5.0))
+        self.executor.cancel_current_tasks(timeout=5.0)
+        with self.assertRaises(futures.CancelledError):
+            future.result(timeout=5.0)
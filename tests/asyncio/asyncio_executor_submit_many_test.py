@@ -0,0 +1,118 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for AsyncioExecutor.submit_many().
+"""
+import threading
+import time
+
+from asyncio import Task
+from concurrent import futures
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+from tests.asyncio.sync_test_helpers import SyncTestHelpers
+
+
+class AsyncioExecutorSubmitManyTest(TestCase):
+    """
+    Verifies batched submission in both its blocking (list of Tasks)
+    and non-blocking (list of result Futures) flavors.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_returns_tasks_in_order(self):
+        """
+        The blocking flavor returns one Task per submission, in order,
+        all of them tracked by the executor.
+        """
+        started = threading.Event()
+        result_holder = []
+        submissions = [
+            (AsyncTestHelpers.simple_task_with_event, (started,), None),
+            (SyncTestHelpers.sync_function_with_result, (result_holder, 3), {}),
+            (AsyncTestHelpers.kwargs_function_with_result, (result_holder, 1, 2), {"c": 3}),
+        ]
+        tasks = self.executor.submit_many("batch", submissions)
+
+        self.assertEqual(3, len(tasks))
+        for task in tasks:
+            self.assertIsInstance(task, Task)
+        self.assertIn("simple_task_with_event", tasks[0].get_name())
+        self.assertIn("sync_function_with_result", tasks[1].get_name())
+        self.assertIn("kwargs_function_with_result", tasks[2].get_name())
+        self.assertTrue(started.wait(timeout=5.0))
+        # pylint: disable=protected-access
+        self.assertIn(id(tasks[0]), self.executor._background_tasks)
+
+        time.sleep(0.5)
+        self.assertEqual(sorted([3, (1, 2, 3)], key=str), sorted(result_holder, key=str))
+
+    def test_creation_failure_is_all_or_nothing(self):
+        """
+        If one item cannot be created, the blocking flavor raises
+        and cancels the tasks already created for the batch.
+        """
+        started = threading.Event()
+        cancelled = []
+        submissions = [
+            (AsyncTestHelpers.long_running_task_with_cancel, (started, cancelled, 1), None),
+            # Wrong number of arguments for a coroutine function fails at creation.
+            (AsyncTestHelpers.dummy_async_coroutine, (1, 2), None),
+        ]
+        with self.assertRaises(TypeError):
+            self.executor.submit_many("batch", submissions)
+
+        time.sleep(0.2)
+        self.assertEqual([1], cancelled)
+
+    def test_result_futures(self):
+        """
+        The non-blocking flavor returns thread-safe Futures for each result,
+        failing only the items which fail.
+        """
+        result_holder = []
+        submissions = [
+            (AsyncTestHelpers.async_function_with_result, (result_holder, 1), None),
+            (AsyncTestHelpers.failing_async_function, None, None),
+            (SyncTestHelpers.sync_function_with_result, (result_holder, 4), None),
+        ]
+        result_futures = self.executor.submit_many("batch", submissions, result_futures=True)
+
+        self.assertEqual(3, len(result_futures))
+        for future in result_futures:
+            self.assertIsInstance(future, futures.Future)
+        self.assertEqual(2, result_futures[0].result(timeout=5.0))
+        with self.assertRaises(ValueError):
+            result_futures[1].result(timeout=5.0)
+        self.assertEqual(8, result_futures[2].result(timeout=5.0))
+
+    def test_empty_batch(self):
+        """
+        An empty batch yields an empty list.
+        """
+        self.assertEqual([], self.executor.submit_many("batch", []))
+        self.assertEqual([], self.executor.submit_many("batch", [], result_futures=True))
@@ -0,0 +1,113 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for AsyncioExecutor.submit_nowait().
+"""
+import threading
+import time
+
+from concurrent import futures
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+from tests.asyncio.sync_test_helpers import SyncTestHelpers
+
+
+class AsyncioExecutorSubmitNowaitTest(TestCase):
+    """
+    Verifies that submit_nowait() hands back a thread-safe Future for the
+    eventual result of the submitted function, and that the underlying
+    Task is still tracked by the executor.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_async_function_result(self):
+        """
+        The returned Future holds the result of an async function.
+        """
+        result_holder = []
+        future = self.executor.submit_nowait(
+            "nowait", AsyncTestHelpers.async_function_with_result, result_holder, 21)
+        self.assertIsInstance(future, futures.Future)
+        self.assertEqual(42, future.result(timeout=5.0))
+        self.assertEqual([21], result_holder)
+
+    def test_sync_function_result(self):
+        """
+        The returned Future holds the result of a sync function run in a worker thread.
+        """
+        result_holder = []
+        future = self.executor.submit_nowait(
+            "nowait", SyncTestHelpers.sync_function_with_result, result_holder, 5)
+        self.assertEqual(10, future.result(timeout=5.0))
+
+    def test_exception_is_propagated(self):
+        """
+        An exception raised by the submitted function is set on the Future.
+        """
+        future = self.executor.submit_nowait("nowait", AsyncTestHelpers.failing_async_function)
+        with self.assertRaises(ValueError):
+            future.result(timeout=5.0)
+
+    def test_cancel_future_cancels_task(self):
+        """
+        Cancelling the returned Future cancels the Task in the event loop.
+        """
+        started = threading.Event()
+        cancelled = []
+        future = self.executor.submit_nowait(
+            "nowait", AsyncTestHelpers.long_running_task_with_cancel, started, cancelled, 7)
+        self.assertTrue(started.wait(timeout=5.0))
+        self.assertTrue(future.cancel())
+
+        deadline = time.monotonic() + 5.0
+        while not cancelled and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([7], cancelled)
+
+    def test_task_is_tracked_until_done(self):
+        """
+        The Task created behind the Future is tracked in the background tasks
+        table while it runs, and removed once it is done.
+        """
+        started = threading.Event()
+        future = self.executor.submit_nowait("nowait", AsyncTestHelpers.simple_task_with_event, started)
+        self.assertTrue(started.wait(timeout=5.0))
+        # pylint: disable=protected-access
+        self.assertEqual(1, len(self.executor._background_tasks))
+
+        future.result(timeout=5.0)
+        time.sleep(0.1)
+        self.assertEqual(0, len(self.executor._background_tasks))
+
+    def test_raises_after_shutdown(self):
+        """
+        submit_nowait() raises RuntimeError after shutdown.
+        """
+        self.executor.shutdown(wait=True)
+        with self.assertRaises(RuntimeError):
+            self.executor.submit_nowait("nowait", AsyncTestHelpers.dummy_async_coroutine)
+        self.executor = None
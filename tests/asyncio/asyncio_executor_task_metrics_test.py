@@ -0,0 +1,97 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for AsyncioExecutor.get_task_metrics().
+"""
+import threading
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.task_metrics import TaskMetrics
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+from tests.asyncio.sync_test_helpers import SyncTestHelpers
+
+
+class AsyncioExecutorTaskMetricsTest(TestCase):
+    """
+    Verifies per-submitter counts and timings of finished tasks.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_no_metrics_before_any_task(self):
+        """
+        Nothing is reported before any task finishes.
+        """
+        self.assertEqual({}, self.executor.get_task_metrics())
+
+    def test_counts_by_outcome_and_submitter(self):
+        """
+        Successful, failing and cancelled tasks are counted per submitter.
+        """
+        self.executor.submit_nowait("alpha", AsyncTestHelpers.async_function_with_result, [], 1).result(5.0)
+        self.executor.submit_nowait("alpha", SyncTestHelpers.sync_function_with_result, [], 1).result(5.0)
+        failing = self.executor.submit_nowait("alpha", AsyncTestHelpers.failing_async_function)
+        self.assertIsNotNone(failing.exception(timeout=5.0))
+
+        started = threading.Event()
+        self.executor.submit("beta", AsyncTestHelpers.cancellable_task_with_event, started)
+        self.assertTrue(started.wait(timeout=5.0))
+        self.executor.cancel_current_tasks(timeout=5.0)
+        time.sleep(0.1)
+
+        metrics = self.executor.get_task_metrics()
+        self.assertEqual({"alpha", "beta"}, set(metrics.keys()))
+        self.assertEqual(3, metrics["alpha"]["count"])
+        self.assertEqual(1, metrics["alpha"]["errors"])
+        self.assertEqual(0, metrics["alpha"]["cancelled"])
+        self.assertEqual(1, metrics["beta"]["count"])
+        self.assertEqual(1, metrics["beta"]["cancelled"])
+
+    def test_run_time_is_measured(self):
+        """
+        The run time of a 100 ms task is reported as roughly 100 ms.
+        """
+        self.executor.submit_nowait("timed", AsyncTestHelpers.async_function_with_result, [], 1).result(5.0)
+        time.sleep(0.05)
+
+        run_time = self.executor.get_task_metrics()["timed"]["run_time"]
+        self.assertEqual(1, run_time["count"])
+        self.assertGreaterEqual(run_time["max_ms"], 90.0)
+        self.assertLess(run_time["max_ms"], 1000.0)
+        queue_delay = self.executor.get_task_metrics()["timed"]["queue_delay"]
+        self.assertLess(queue_delay["max_ms"], run_time["max_ms"])
+
+    def test_submitters_are_bounded(self):
+        """
+        Submitters beyond max_submitters are aggregated together.
+        """
+        metrics = TaskMetrics(max_submitters=2)
+        for submitter_id in ("a", "b", "c", "d"):
+            metrics.record(submitter_id, TaskMetrics.OUTCOME_OK, 0.0, 1.0, 2.0)
+        result = metrics.get_metrics()
+        self.assertEqual({"a", "b", TaskMetrics.OTHER_SUBMITTER}, set(result.keys()))
+        self.assertEqual(2, result[TaskMetrics.OTHER_SUBMITTER]["count"])
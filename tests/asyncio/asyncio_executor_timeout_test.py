@@ -0,0 +1,147 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for per-submission timeouts on AsyncioExecutor.
+"""
+import asyncio
+import time
+
+from concurrent import futures
+from unittest import TestCase
+
+from leaf_common.asyncio.admission_controller import AdmissionController
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+
+
+async def sleep_for(seconds: float) -> float:
+    """
+    Sleep and return the number of seconds slept.
+    """
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+class AsyncioExecutorTimeoutTest(TestCase):
+    """
+    Verifies that tasks are cancelled at their deadline, that tasks finishing
+    in time are unaffected, and that timeouts are counted apart from cancellations.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_submit_nowait_times_out(self):
+        """
+        A task running past its timeout is cancelled, and its result Future raises TimeoutError.
+        """
+        start = time.monotonic()
+        result_future = self.executor.submit_nowait("slow", sleep_for, 10.0, timeout=0.1)
+        with self.assertRaises(futures.TimeoutError):
+            result_future.result(5.0)
+        self.assertLess(time.monotonic() - start, 5.0)
+
+        metrics = self.executor.get_task_metrics()["slow"]
+        self.assertEqual(1, metrics["timeouts"])
+        self.assertEqual(0, metrics["cancelled"])
+
+    def test_submit_and_create_task_time_out(self):
+        """
+        submit() and create_task() tasks are cancelled at their deadline,
+        while tasks finishing in time are unaffected.
+        """
+        slow = self.executor.submit("mixed", sleep_for, 10.0, timeout=0.1)
+        created = self.executor.create_task(sleep_for(10.0), "mixed", timeout=0.2)
+        fast = self.executor.submit_nowait("mixed", sleep_for, 0.01, timeout=5.0)
+        self.assertEqual(0.01, fast.result(5.0))
+
+        deadline = time.monotonic() + 5.0
+        while not (slow.done() and created.done()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(slow.cancelled())
+        self.assertTrue(created.cancelled())
+
+        metrics = self.executor.get_task_metrics()["mixed"]
+        self.assertEqual(3, metrics["count"])
+        self.assertEqual(2, metrics["timeouts"])
+
+    def test_task_swallowing_timeout_keeps_its_result(self):
+        """
+        A task which catches the cancellation at its deadline and returns
+        a value has that value as its result, and is not counted as a timeout.
+        """
+        async def swallow_cancel() -> str:
+            try:
+                await asyncio.sleep(10.0)
+            except asyncio.CancelledError:
+                return "swallowed"
+            return "slept"
+
+        result_future = self.executor.submit_nowait("swallow", swallow_cancel, timeout=0.1)
+        self.assertEqual("swallowed", result_future.result(5.0))
+
+        metrics = self.executor.get_task_metrics()["swallow"]
+        self.assertEqual(0, metrics["timeouts"])
+        self.assertEqual(0, metrics["cancelled"])
+
+    def test_earlier_deadline_rearms_timer(self):
+        """
+        A deadline earlier than every pending one is honoured right away.
+        """
+        late = self.executor.submit_nowait("order", sleep_for, 10.0, timeout=3.0)
+        early = self.executor.submit_nowait("order", sleep_for, 10.0, timeout=0.1)
+        with self.assertRaises(futures.TimeoutError):
+            early.result(1.0)
+        self.assertFalse(late.done())
+        late.cancel()
+
+    def test_many_finished_tasks_are_compacted(self):
+        """
+        Deadlines of tasks which finish in time do not pile up.
+        """
+        submissions = [(sleep_for, (0.0,), None)] * 200
+        results = self.executor.submit_many("batch", submissions, result_futures=True, timeout=60.0)
+        for result in results:
+            result.result(5.0)
+        self.assertLess(len(self.executor._deadlines), 200)    # pylint: disable=protected-access
+
+    def test_negative_timeout(self):
+        """
+        Negative timeouts are rejected.
+        """
+        with self.assertRaises(ValueError):
+            self.executor.submit_nowait("test", sleep_for, 0.0, timeout=-1.0)
+
+    def test_negative_timeout_holds_no_admission(self):
+        """
+        A submit_async() rejected for its negative timeout leaves no admission behind.
+        """
+        controller = AdmissionController(max_in_flight=1, overflow_policy=AdmissionController.OVERFLOW_REJECT)
+        executor = AsyncioExecutor(admission_controller=controller)
+        executor.start()
+        try:
+            with self.assertRaises(ValueError):
+                asyncio.run(executor.submit_async("test", sleep_for, 0.0, timeout=-1.0))
+            self.assertEqual(0, executor.get_admission_metrics()["in_flight"])
+            self.assertEqual(0.0, executor.submit_nowait("test", sleep_for, 0.0).result(5.0))
+        finally:
+            executor.shutdown()
@@ -24,9 +24,11 @@ non-Windows test runner without requiring a Windows-only CI job.
 import asyncio
 import sys
 
+from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import patch
 
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
 from leaf_common.asyncio.event_loop_factory import EventLoopFactory
 
 
@@ -46,18 +48,22 @@ class EventLoopFactoryTest(TestCase):
 
     def test_loop_factory_returns_none_on_linux(self):
         """
-        On Linux (sys.platform == 'linux'), loop_factory() returns None so
+        On Linux (sys.platform == 'linux') with the asyncio implementation
+        selected, loop_factory() returns None so
         callers defer to asyncio's platform default.
         """
-        with patch.object(sys, "platform", "linux"):
+        with patch.object(sys, "platform", "linux"), \
+                patch.dict("os.environ", {EventLoopFactory.ENV_VAR: "asyncio"}):
             self.assertIsNone(EventLoopFactory.loop_factory())
 
     def test_loop_factory_returns_none_on_macos(self):
         """
-        On macOS (sys.platform == 'darwin'), loop_factory() returns None so
+        On macOS (sys.platform == 'darwin') with the asyncio implementation
+        selected, loop_factory() returns None so
         callers defer to asyncio's platform default.
         """
-        with patch.object(sys, "platform", "darwin"):
+        with patch.object(sys, "platform", "darwin"), \
+                patch.dict("os.environ", {EventLoopFactory.ENV_VAR: "asyncio"}):
             self.assertIsNone(EventLoopFactory.loop_factory())
 
     def test_loop_factory_returns_none_on_cygwin(self):
@@ -66,7 +72,8 @@ class EventLoopFactoryTest(TestCase):
         loop_factory() returns None: only the exact value 'win32' triggers
         the Selector override.
         """
-        with patch.object(sys, "platform", "cygwin"):
+        with patch.object(sys, "platform", "cygwin"), \
+                patch.dict("os.environ", {EventLoopFactory.ENV_VAR: "asyncio"}):
             self.assertIsNone(EventLoopFactory.loop_factory())
 
     def test_new_event_loop_constructs_selector_loop_on_emulated_windows(self):
@@ -92,3 +99,73 @@ class EventLoopFactoryTest(TestCase):
                 self.assertIsInstance(loop, asyncio.AbstractEventLoop)
             finally:
                 loop.close()
+
+    def test_asyncio_implementation_returns_none(self):
+        """
+        Asking for the asyncio implementation, by argument or environment variable,
+        defers to asyncio's platform default even when uvloop is installed.
+        """
+        fake_uvloop = SimpleNamespace(new_event_loop=asyncio.new_event_loop)
+        with patch.object(sys, "platform", "linux"), \
+                patch("leaf_common.asyncio.event_loop_factory.import_module", return_value=fake_uvloop):
+            self.assertIsNone(EventLoopFactory.loop_factory("asyncio"))
+            with patch.dict("os.environ", {EventLoopFactory.ENV_VAR: "asyncio"}):
+                self.assertIsNone(EventLoopFactory.loop_factory())
+
+    def test_uvloop_used_when_installed(self):
+        """
+        With uvloop importable, auto and uvloop selections return its loop constructor.
+        """
+        fake_uvloop = SimpleNamespace(new_event_loop=asyncio.new_event_loop)
+        with patch.object(sys, "platform", "linux"), \
+                patch("leaf_common.asyncio.event_loop_factory.import_module", return_value=fake_uvloop):
+            self.assertIs(EventLoopFactory.loop_factory("auto"), fake_uvloop.new_event_loop)
+            self.assertIs(EventLoopFactory.loop_factory("uvloop"), fake_uvloop.new_event_loop)
+            with patch.dict("os.environ", {EventLoopFactory.ENV_VAR: "UVLOOP"}):
+                self.assertIs(EventLoopFactory.loop_factory(), fake_uvloop.new_event_loop)
+
+    def test_uvloop_falls_back_when_missing(self):
+        """
+        Asking for uvloop when it is not installed falls back to asyncio with a warning.
+        """
+        with patch.object(sys, "platform", "linux"), \
+                patch("leaf_common.asyncio.event_loop_factory.import_module", side_effect=ImportError):
+            with self.assertLogs("EventLoopFactory", level="WARNING"):
+                self.assertIsNone(EventLoopFactory.loop_factory("uvloop"))
+            self.assertIsNone(EventLoopFactory.loop_factory("auto"))
+
+    def test_windows_ignores_uvloop(self):
+        """
+        On Windows the SelectorEventLoop is used no matter what is asked for.
+        """
+        with patch.object(sys, "platform", "win32"):
+            self.assertIs(EventLoopFactory.loop_factory("uvloop"), asyncio.SelectorEventLoop)
+
+    def test_unknown_implementation_raises(self):
+        """
+        An unknown implementation name is an error.
+        """
+        with self.assertRaises(ValueError):
+            EventLoopFactory.loop_factory("trio")
+
+    def test_unknown_implementation_raises_on_windows(self):
+        """
+        An unknown implementation name is an error on Windows too,
+        even though the choice of implementation does not apply there.
+        """
+        with patch.object(sys, "platform", "win32"), \
+                patch.dict("os.environ", {EventLoopFactory.ENV_VAR: "uvlopo"}):
+            with self.assertRaises(ValueError):
+                EventLoopFactory.loop_factory()
+
+    def test_executor_uses_selected_implementation(self):
+        """
+        AsyncioExecutor runs on the event loop implementation it is given.
+        """
+        executor = AsyncioExecutor(event_loop="asyncio")
+        executor.start()
+        try:
+            self.assertIsInstance(executor.get_event_loop(), asyncio.BaseEventLoop)
+            self.assertIsNone(executor.submit_and_wait("test", asyncio.sleep, 0, timeout=5.0))
+        finally:
+            executor.shutdown()
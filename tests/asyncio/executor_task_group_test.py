@@ -0,0 +1,112 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for ExecutorTaskGroup, as returned by AsyncioExecutor.submit_group().
+"""
+import asyncio
+import time
+
+from concurrent import futures
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.executor_task_group import ExecutorTaskGroup
+
+
+async def sleep_for(seconds: float) -> float:
+    """
+    Sleep and return the number of seconds slept.
+    """
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+class ExecutorTaskGroupTest(TestCase):
+    """
+    Verifies waiting on and cancelling groups of tasks,
+    independently of other tasks on the same executor.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_wait_all(self):
+        """
+        wait() returns once all the tasks of the group are done.
+        """
+        group = self.executor.submit_group("request")
+        group.submit(sleep_for, 0.01)
+        group.submit_many([(sleep_for, (0.02,), None), (sleep_for, (0.03,), None)])
+        done, not_done = group.wait(timeout=5.0)
+        self.assertEqual(3, len(done))
+        self.assertEqual(set(), not_done)
+        self.assertEqual([0.01, 0.02, 0.03], [future.result() for future in group.get_futures()])
+
+    def test_wait_first_then_cancel_only_group(self):
+        """
+        wait() for the first task returns early, and cancel() cancels
+        the rest of the group but not other tasks on the executor.
+        """
+        other = self.executor.submit_nowait("other", sleep_for, 0.3)
+        group = self.executor.submit_group("request")
+        fast = group.submit(sleep_for, 0.01)
+        slow = group.submit(sleep_for, 10.0)
+
+        done, not_done = group.wait(timeout=5.0, return_when=ExecutorTaskGroup.FIRST_COMPLETED)
+        self.assertEqual({fast}, done)
+        self.assertEqual({slow}, not_done)
+
+        self.assertEqual(1, group.cancel())
+        self.assertTrue(slow.cancelled())
+        self.assertEqual(0.3, other.result(5.0))
+        with self.assertRaises(RuntimeError):
+            group.submit(sleep_for, 0.01)
+
+    def test_wait_timeout_and_context_manager(self):
+        """
+        wait() gives up at its timeout, and leaving the with block cancels what is left.
+        """
+        with self.executor.submit_group("request") as group:
+            slow = group.submit(sleep_for, 10.0)
+            start = time.monotonic()
+            done, not_done = group.wait(timeout=0.1)
+            self.assertLess(time.monotonic() - start, 5.0)
+            self.assertEqual((set(), {slow}), (done, not_done))
+        with self.assertRaises(futures.CancelledError):
+            slow.result(5.0)
+
+    def test_wait_async_on_executor_loop(self):
+        """
+        A coroutine on the executor's own loop can fan out and wait with wait_async(),
+        while the synchronous wait() refuses to deadlock.
+        """
+        async def fan_out() -> int:
+            group = self.executor.submit_group("request")
+            for seconds in (0.01, 0.02):
+                group.submit(sleep_for, seconds)
+            with self.assertRaises(RuntimeError):
+                group.wait()
+            done, _ = await group.wait_async(timeout=5.0)
+            return len(done)
+
+        self.assertEqual(2, self.executor.submit_and_wait("outer", fan_out, timeout=5.0))
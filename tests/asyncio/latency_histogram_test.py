@@ -0,0 +1,93 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for LatencyHistogram.
+"""
+from unittest import TestCase
+
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTest(TestCase):
+    """
+    Verifies percentile estimates stay within one bucket of the truth.
+    """
+
+    # Relative error allowed for 4 buckets per doubling
+    TOLERANCE: float = 2.0 ** 0.25
+
+    def test_empty_histogram(self):
+        """
+        An empty histogram reports zeroes.
+        """
+        metrics = LatencyHistogram().get_metrics()
+        self.assertEqual(0, metrics["count"])
+        self.assertEqual(0.0, metrics["p99_ms"])
+        self.assertEqual(0.0, metrics["mean_ms"])
+
+    def test_percentiles_of_uniform_samples(self):
+        """
+        Percentiles of 1..1000 ms are estimated within bucket resolution.
+        """
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000.0)
+
+        for fraction, expected in ((0.50, 0.500), (0.95, 0.950), (0.99, 0.990)):
+            estimate = histogram.get_percentile(fraction)
+            self.assertGreaterEqual(estimate * self.TOLERANCE, expected)
+            self.assertLessEqual(estimate, expected * self.TOLERANCE)
+
+        metrics = histogram.get_metrics()
+        self.assertEqual(1000, metrics["count"])
+        self.assertAlmostEqual(500.5, metrics["mean_ms"])
+        self.assertAlmostEqual(1000.0, metrics["max_ms"])
+
+    def test_estimates_never_exceed_max(self):
+        """
+        A single sample reports itself for every percentile.
+        """
+        histogram = LatencyHistogram()
+        histogram.record(0.0123)
+        self.assertAlmostEqual(0.0123, histogram.get_percentile(0.5))
+        self.assertAlmostEqual(0.0123, histogram.get_percentile(0.99))
+
+    def test_overflow_and_negative_samples(self):
+        """
+        Samples beyond the last bucket and negative samples are both handled.
+        """
+        histogram = LatencyHistogram()
+        histogram.record(-1.0)
+        histogram.record(1e6)
+        self.assertLessEqual(histogram.get_percentile(0.01), LatencyHistogram.MIN_SECONDS)
+        self.assertEqual(1e6, histogram.get_percentile(1.0))
+
+    def test_cumulative_buckets(self):
+        """
+        Cumulative buckets count the samples at or below each bound, one bound per doubling.
+        """
+        histogram = LatencyHistogram()
+        histogram.record(1e-6)
+        histogram.record(3e-6)
+        histogram.record(1e6)
+        buckets = histogram.get_cumulative_buckets()
+        self.assertEqual(31, len(buckets))
+        self.assertEqual((LatencyHistogram.MIN_SECONDS, 1), buckets[0])
+        self.assertAlmostEqual(2e-6, buckets[1][0])
+        self.assertEqual(1, buckets[1][1])
+        self.assertEqual(2, buckets[2][1])
+        self.assertEqual(2, buckets[-2][1])
+        self.assertEqual((float("inf"), 3), buckets[-1])
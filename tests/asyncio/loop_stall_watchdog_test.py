@@ -0,0 +1,113 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for LoopStallWatchdog.
+"""
+import threading
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.loop_stall_watchdog import LoopStallWatchdog
+
+
+def wedge_loop(started: threading.Event, seconds: float):
+    """
+    Hold the event loop thread in synchronous code.
+    """
+    started.set()
+    time.sleep(seconds)
+
+
+class LoopStallWatchdogTest(TestCase):
+    """
+    Verifies stall detection, stack capture, rate limiting and the ring buffer.
+    """
+
+    def setUp(self):
+        """No executor by default; tests create one with the watchdog they need."""
+        self.watchdog = None
+        self.executor = None
+
+    def tearDown(self):
+        """Always stop the threads so they do not leak between tests."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        if self.watchdog is not None:
+            self.watchdog.stop()
+
+    def _start(self, **kwargs) -> AsyncioExecutor:
+        self.watchdog = LoopStallWatchdog(interval_seconds=0.05, stall_threshold_seconds=0.2, **kwargs)
+        self.executor = AsyncioExecutor(stall_watchdog=self.watchdog)
+        self.executor.start()
+        return self.executor
+
+    def _wedge(self, seconds: float):
+        started = threading.Event()
+        self.executor.get_event_loop().call_soon_threadsafe(wedge_loop, started, seconds)
+        self.assertTrue(started.wait(5.0))
+        time.sleep(seconds + 0.2)
+
+    def test_stall_captures_loop_stack(self):
+        """
+        A wedged loop gets its thread's stack captured, and the capture
+        is completed with the length of the stall once the loop recovers.
+        """
+        self._start()
+        self._wedge(0.6)
+
+        stalls = self.watchdog.get_stalls()
+        self.assertEqual(1, len(stalls))
+        self.assertEqual(str(id(self.executor)), stalls[0]["loop"])
+        self.assertIn("wedge_loop", [frame["func"] for frame in stalls[0]["stack"]])
+        self.assertGreaterEqual(stalls[0]["stalled_seconds"], 0.2)
+        self.assertGreaterEqual(stalls[0]["stall_seconds"], 0.4)
+        self.assertIn("wedge_loop", LoopStallWatchdog.format_stalls(stalls))
+        self.assertEqual({"loops": 1, "stalls": 1, "captures": 1, "suppressed": 0}, self.watchdog.get_metrics())
+
+    def test_captures_are_rate_limited(self):
+        """
+        A second stall within min_capture_interval_seconds is counted but not captured.
+        """
+        self._start(min_capture_interval_seconds=60.0)
+        self._wedge(0.4)
+        self._wedge(0.4)
+        metrics = self.watchdog.get_metrics()
+        self.assertEqual(2, metrics["stalls"])
+        self.assertEqual(1, metrics["suppressed"])
+        self.assertEqual(1, len(self.watchdog.get_stalls()))
+
+    def test_ring_buffer_is_bounded(self):
+        """
+        Only the most recent max_captures captures are kept.
+        """
+        self._start(min_capture_interval_seconds=0.0, max_captures=1)
+        self._wedge(0.4)
+        self._wedge(0.4)
+        self.assertEqual(2, self.watchdog.get_metrics()["captures"])
+        self.assertEqual(1, len(self.watchdog.get_stalls()))
+
+    def test_shutdown_stops_watching(self):
+        """
+        A responsive loop is not reported, and shutting down the executor stops watching it.
+        """
+        executor = self._start()
+        time.sleep(0.3)
+        self.assertEqual([], self.watchdog.get_stalls())
+        executor.shutdown()
+        self.executor = None
+        self.assertEqual(0, self.watchdog.get_metrics()["loops"])
@@ -0,0 +1,100 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for PrometheusTextWriter and AsyncioExecutorPool.get_prometheus_metrics().
+"""
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+from leaf_common.asyncio.prometheus_text_writer import PrometheusTextWriter
+
+
+class PrometheusTextWriterTest(TestCase):
+    """
+    Verifies the text exposition format, and the pool metrics exposed in it.
+    """
+
+    def test_counters_and_gauges(self):
+        """
+        Samples of one metric are grouped under one header, with escaped labels.
+        """
+        writer = PrometheusTextWriter("svc", {"pool": 'a"b\\c'})
+        writer.add_counter("requests", "Requests\nhandled.", 3, {"code": "200"})
+        writer.add_gauge("ratio", "A ratio.", 0.25)
+        writer.add_counter("requests", "Requests\nhandled.", 1, {"code": "500"})
+        self.assertEqual(
+            "# HELP svc_requests_total Requests\\nhandled.\n"
+            "# TYPE svc_requests_total counter\n"
+            'svc_requests_total{pool="a\\"b\\\\c",code="200"} 3\n'
+            'svc_requests_total{pool="a\\"b\\\\c",code="500"} 1\n'
+            "# HELP svc_ratio A ratio.\n"
+            "# TYPE svc_ratio gauge\n"
+            'svc_ratio{pool="a\\"b\\\\c"} 0.25\n',
+            writer.get_text())
+
+        with self.assertRaises(ValueError):
+            writer.add_gauge("requests_total", "Clash.", 1)
+        self.assertEqual("", PrometheusTextWriter().get_text())
+
+    def test_histogram(self):
+        """
+        Histograms get cumulative buckets ending with +Inf, a sum and a count.
+        """
+        histogram = LatencyHistogram()
+        histogram.record(0.001)
+        histogram.record(2.0)
+        writer = PrometheusTextWriter()
+        writer.add_histogram("latency_seconds", "Latency.", histogram)
+        lines = writer.get_text().splitlines()
+        self.assertEqual("# TYPE latency_seconds histogram", lines[1])
+        self.assertIn('latency_seconds_bucket{le="0.001024"} 1', lines)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 2', lines)
+        self.assertEqual("latency_seconds_sum 2.001", lines[-2])
+        self.assertEqual("latency_seconds_count 2", lines[-1])
+
+    def test_pool_metrics(self):
+        """
+        The pool counts creations, reuse, returns and leases, and exposes them.
+        """
+        pool = AsyncioExecutorPool(gc_sweep_interval_seconds=60.0)
+        try:
+            executor = pool.get_executor()
+            pool.return_executor(executor)
+            self.assertTrue(pool.wait_for_resets(5.0))
+            with pool.lease():
+                pass
+
+            metrics = pool.get_pool_metrics()
+            self.assertEqual(1, metrics["created"])
+            self.assertEqual(1, metrics["creation_time"]["count"])
+            self.assertEqual(1, metrics["reuse_hits"])
+            self.assertEqual(1, metrics["reuse_misses"])
+            self.assertEqual(0.5, metrics["reuse_hit_rate"])
+            self.assertEqual(2, metrics["returns"])
+
+            lines = pool.get_prometheus_metrics(labels={"pool": "test"}).splitlines()
+            self.assertIn('asyncio_executor_pool_executors_created_total{pool="test"} 1', lines)
+            self.assertIn('asyncio_executor_pool_executor_gets_total{pool="test",result="reuse"} 1', lines)
+            self.assertIn('asyncio_executor_pool_reuse_hit_ratio{pool="test"} 0.5', lines)
+            self.assertIn('asyncio_executor_pool_leases_total{pool="test"} 1', lines)
+            self.assertIn('asyncio_executor_pool_lease_duration_seconds_count{pool="test"} 1', lines)
+            self.assertIn('asyncio_executor_pool_executor_creation_seconds_bucket{pool="test",le="+Inf"} 1', lines)
+        finally:
+            pool.wait_for_resets(5.0)
+            pool.shutdown()
+            for executor in list(pool.pool_used) + list(pool.pool_available):
+                executor.shutdown(wait=True)
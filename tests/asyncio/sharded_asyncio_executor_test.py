@@ -0,0 +1,140 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for ShardedAsyncioExecutor and the ConsistentHashRing it routes with.
+"""
+import threading
+
+from collections import Counter
+from unittest import TestCase
+
+from leaf_common.asyncio.sharded_asyncio_executor import ShardedAsyncioExecutor
+from leaf_common.asyncio.task_executor import TaskExecutor
+from leaf_common.utils.consistent_hash_ring import ConsistentHashRing
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+from tests.asyncio.sync_test_helpers import SyncTestHelpers
+
+
+class ShardedAsyncioExecutorTest(TestCase):
+    """
+    Verifies key-affinity routing over several event loop threads,
+    and aggregation of metrics across shards.
+    """
+
+    def setUp(self):
+        """Create and start a fresh sharded executor."""
+        self.executor = ShardedAsyncioExecutor(num_shards=4)
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop threads terminate cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_ring_is_deterministic_and_balanced(self):
+        """
+        The same key always maps to the same slot, and many keys
+        spread over all slots roughly evenly.
+        """
+        ring = ConsistentHashRing(4)
+        self.assertEqual(ring.get_slot("session-42"), ConsistentHashRing(4).get_slot("session-42"))
+
+        counts = Counter(ring.get_slot(f"key-{i}") for i in range(4000))
+        self.assertEqual({0, 1, 2, 3}, set(counts.keys()))
+        for count in counts.values():
+            self.assertGreater(count, 500)
+
+    def test_ring_growth_moves_few_keys(self):
+        """
+        Adding a slot only moves a fraction of the keys.
+        """
+        before = ConsistentHashRing(4)
+        after = ConsistentHashRing(5)
+        moved = sum(1 for i in range(4000) if before.get_slot(i) != after.get_slot(i))
+        self.assertLess(moved, 4000 * 0.35)
+
+    def test_is_task_executor(self):
+        """
+        ShardedAsyncioExecutor honors the TaskExecutor interface.
+        """
+        self.assertIsInstance(self.executor, TaskExecutor)
+        self.assertEqual(4, self.executor.get_num_shards())
+        self.assertIsNone(self.executor.get_event_loop())
+
+    def test_same_submitter_same_loop(self):
+        """
+        Tasks from the same submitter run on the same shard's event loop,
+        and a shard sees its own loop from get_event_loop().
+        """
+        shard = self.executor.get_shard("tenant-a")
+        loop = None
+        for _ in range(5):
+            task = self.executor.submit("tenant-a", AsyncTestHelpers.dummy_async_coroutine)
+            self.assertIs(shard.get_event_loop(), task.get_loop())
+            loop = task.get_loop()
+
+        seen = shard.submit_and_wait("tenant-a", self._get_executor_loop, timeout=5.0)
+        self.assertIs(loop, seen)
+
+    async def _get_executor_loop(self):
+        return self.executor.get_event_loop()
+
+    def test_submitters_spread_over_shards(self):
+        """
+        Many submitters use more than one shard.
+        """
+        loops = set()
+        for i in range(32):
+            task = self.executor.submit(f"tenant-{i}", AsyncTestHelpers.dummy_async_coroutine)
+            loops.add(id(task.get_loop()))
+        self.assertGreater(len(loops), 1)
+
+    def test_create_task_routes_by_submitter(self):
+        """
+        create_task() routes by submitter_id just like submit().
+        """
+        result_holder = []
+        task = self.executor.create_task(AsyncTestHelpers.awaitable_function_with_result(result_holder), "tenant-b")
+        self.assertIs(self.executor.get_shard("tenant-b").get_event_loop(), task.get_loop())
+
+    def test_threads_metrics_are_aggregated(self):
+        """
+        Thread metrics are summed over the shards.
+        """
+        start_event = threading.Event()
+        release_event = threading.Event()
+        shard = self.executor.get_shard("blocker")
+        shard.submit("blocker", SyncTestHelpers.block_on_event, start_event, release_event)
+        self.assertTrue(start_event.wait(timeout=5.0))
+
+        num_threads, num_running = self.executor.get_threads_metrics()
+        release_event.set()
+        self.assertGreaterEqual(num_threads, 1)
+        self.assertEqual(1, num_running)
+
+    def test_lag_monitors(self):
+        """
+        With monitor_lag=True there is one lag readout per shard,
+        and shutdown still completes.
+        """
+        executor = ShardedAsyncioExecutor(num_shards=2, monitor_lag=True)
+        executor.start()
+        try:
+            lag_metrics = executor.get_lag_metrics()
+            self.assertEqual(2, len(lag_metrics))
+        finally:
+            executor.shutdown(wait=True)
+        self.assertEqual([], self.executor.get_lag_metrics())
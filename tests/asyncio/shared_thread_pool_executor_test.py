@@ -0,0 +1,123 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for SharedThreadPoolExecutor, ThreadPoolShare,
+and their use by AsyncioExecutor and AsyncioExecutorPool.
+"""
+import threading
+import time
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+from leaf_common.asyncio.shared_thread_pool_executor import SharedThreadPoolExecutor
+
+
+class SharedThreadPoolExecutorTest(TestCase):
+    """
+    Verifies the thread ceiling of the shared pool, the accounting of each share,
+    and the shared and per-executor thread metrics of the pool.
+    """
+
+    def setUp(self):
+        """Create a shared pool of two threads."""
+        self.shared = SharedThreadPoolExecutor(max_workers=2)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        """Let any blocked work finish, then shut the shared pool down."""
+        self.release.set()
+        self.shared.shutdown(wait=True)
+
+    def _wait_for_running(self, count: int):
+        deadline = time.monotonic() + 5.0
+        while self.shared.get_threads_metrics()[1] < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(count, self.shared.get_threads_metrics()[1])
+
+    def test_shares_are_accounted_for_separately(self):
+        """
+        Work from all shares runs on at most max_workers threads, and each share
+        knows how much of its own work is running or queued.
+        """
+        share_a = self.shared.new_share("a")
+        share_b = self.shared.new_share("b")
+        futures = [share_a.submit(self.release.wait, 5.0) for _ in range(2)]
+        futures.append(share_b.submit(self.release.wait, 5.0))
+        self._wait_for_running(2)
+
+        metrics = self.shared.get_usage_metrics()
+        self.assertEqual(2, metrics["max_workers"])
+        self.assertEqual(2, metrics["work_threads"])
+        self.assertEqual({"submitted": 2, "running": 2, "queued": 0, "completed": 0}, metrics["per_share"]["a"])
+        self.assertEqual({"submitted": 1, "running": 0, "queued": 1, "completed": 0}, metrics["per_share"]["b"])
+        self.assertEqual((2, 2), share_a.get_threads_metrics())
+
+        self.release.set()
+        for future in futures:
+            self.assertTrue(future.result(5.0))
+        self.assertEqual(1, share_b.get_usage_metrics()["completed"])
+
+    def test_share_shutdown_cancels_only_its_own_work(self):
+        """
+        Shutting a share down cancels its queued work and refuses more,
+        while the shared pool keeps running the work of the other shares.
+        """
+        share_a = self.shared.new_share("a")
+        share_b = self.shared.new_share("b")
+        running = [share_b.submit(self.release.wait, 5.0) for _ in range(2)]
+        self._wait_for_running(2)
+        queued_a = share_a.submit(self.release.wait, 5.0)
+        queued_b = share_b.submit(self.release.wait, 5.0)
+
+        share_a.shutdown(wait=False, cancel_futures=True)
+        self.assertTrue(queued_a.cancelled())
+        with self.assertRaises(RuntimeError):
+            share_a.submit(self.release.wait, 5.0)
+        self.assertNotIn("a", self.shared.get_usage_metrics()["per_share"])
+
+        self.release.set()
+        for future in running + [queued_b]:
+            self.assertTrue(future.result(5.0))
+
+    def test_pool_executors_share_threads(self):
+        """
+        All the executors of a pool run synchronous functions on the shared threads,
+        and get_threads_metrics() reports the shared totals and per-executor usage.
+        """
+        pool = AsyncioExecutorPool(gc_sweep_interval_seconds=60.0, shared_thread_pool=self.shared)
+        try:
+            executors = [pool.get_executor() for _ in range(3)]
+            results = [executor.submit_nowait("test", self.release.wait, 5.0) for executor in executors]
+            self._wait_for_running(2)
+
+            metrics = pool.get_threads_metrics()
+            self.assertEqual(2, metrics["used"]["work_threads"])
+            self.assertEqual(2, metrics["shared"]["work_threads"])
+            self.assertEqual(2, metrics["shared"]["threads_running"])
+            per_executor = metrics["shared"]["per_executor"]
+            self.assertEqual({str(id(executor)) for executor in executors}, set(per_executor.keys()))
+            self.assertEqual(1, sum(usage["queued"] for usage in per_executor.values()))
+            self.assertIn("asyncio_executor_pool_shared_work_queued 1", pool.get_prometheus_metrics().splitlines())
+
+            self.release.set()
+            for result in results:
+                self.assertTrue(result.result(5.0))
+        finally:
+            pool.shutdown()
+            for executor in list(pool.pool_used) + list(pool.pool_available):
+                executor.shutdown(wait=True)
+        self.assertEqual(2, self.shared.get_threads_metrics()[0])
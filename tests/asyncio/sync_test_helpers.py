@@ -17,6 +17,9 @@
 """
 Synchronous helper functions for AsyncioExecutor unit tests.
 """
+import os
+
+from leaf_common.asyncio.asyncio_process_pool_executor import AsyncioProcessPoolExecutor
 
 
 class SyncTestHelpers:
@@ -75,3 +78,19 @@ class SyncTestHelpers:
         """
         start_event.set()
         release_event.wait(timeout=5.0)
+
+    @staticmethod
+    @AsyncioProcessPoolExecutor.cpu_bound
+    def cpu_bound_sum_of_squares(count):
+        """
+        CPU-bound function marked for running in a process pool.
+        Returns the pid of the process it ran in along with its result.
+        """
+        return os.getpid(), sum(i * i for i in range(count))
+
+    @staticmethod
+    def current_pid():
+        """
+        Unmarked function returning the pid of the process it ran in.
+        """
+        return os.getpid()
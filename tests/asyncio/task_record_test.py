@@ -0,0 +1,107 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Unit tests for TaskRecord and its use in the AsyncioExecutor background tasks table.
+"""
+import asyncio
+import threading
+
+from unittest import TestCase
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.task_priority import TaskPriority
+from leaf_common.asyncio.task_record import TaskRecord
+from tests.asyncio.async_test_helpers import AsyncTestHelpers
+
+
+class TaskRecordTest(TestCase):
+    """
+    Verifies that TaskRecord stays compact and carries the task's bookkeeping.
+    """
+
+    def setUp(self):
+        """Create and start a fresh executor."""
+        self.executor = AsyncioExecutor()
+        self.executor.start()
+
+    def tearDown(self):
+        """Always shutdown so the event-loop thread terminates cleanly."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def test_record_has_no_instance_dict(self):
+        """
+        Records use __slots__ only.
+        """
+        record = TaskRecord("submitter", TaskPriority.LOW, None, 1.0)
+        self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.unexpected = True  # pylint: disable=assigning-non-slot
+        self.assertEqual(1.0, record.started_at)
+        self.assertIsNone(record.task)
+
+    def test_tracked_tasks_have_records(self):
+        """
+        Tasks submitted to the executor are tracked with their TaskRecord.
+        """
+        started = threading.Event()
+        task = self.executor.create_task(AsyncTestHelpers.simple_task_with_event(started), "tracked",
+                                         raise_exception=True, priority=TaskPriority.HIGH)
+        self.assertTrue(started.wait(5.0))
+
+        # pylint: disable=protected-access
+        with self.executor._background_tasks_lock:
+            record = self.executor._background_tasks[id(task)]
+        self.assertIsInstance(record, TaskRecord)
+        self.assertIs(task, record.task)
+        self.assertEqual("tracked", record.submitter_id)
+        self.assertEqual(TaskPriority.HIGH, record.priority)
+        self.assertTrue(record.raise_exception)
+        self.assertGreaterEqual(record.started_at, record.submitted_at)
+
+    def test_one_registry_from_creation_until_done(self):
+        """
+        A task is in the background tasks table from its creation in the event loop,
+        without the submitting thread having to track it, until it is done.
+        """
+        async def find_own_record() -> TaskRecord:
+            await asyncio.sleep(0)
+            # pylint: disable=protected-access
+            with self.executor._background_tasks_lock:
+                return self.executor._background_tasks.get(id(asyncio.current_task()))
+
+        record = self.executor.submit_nowait("registry", find_own_record).result(5.0)
+        self.assertIsInstance(record, TaskRecord)
+        self.assertEqual("registry", record.submitter_id)
+
+        # The done callback has run by the time the event loop gets to the next call
+        self.executor.submit_and_wait("registry", asyncio.sleep, 0, timeout=5.0)
+        # pylint: disable=protected-access
+        with self.executor._background_tasks_lock:
+            self.assertNotIn(id(record.task), self.executor._background_tasks)
+        self.assertEqual(0, self.executor.get_priority_metrics()[TaskPriority.NAMES[TaskPriority.NORMAL]]["in_flight"])
+        self.assertEqual(2, self.executor.get_task_metrics()["registry"]["count"])
+
+    def test_track_task_of_foreign_task(self):
+        """
+        track_task() still accepts tasks created outside of submit().
+        """
+        task = self.executor.submit_and_wait("test", self._create_foreign_task, timeout=5.0)
+        tracked = self.executor.track_task(task)
+        self.assertIs(task, tracked)
+
+    async def _create_foreign_task(self):
+        return self.executor.get_event_loop().create_task(AsyncTestHelpers.dummy_async_coroutine())
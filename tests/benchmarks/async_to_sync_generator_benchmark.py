@@ -0,0 +1,126 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Benchmark of the per-item latency of AsyncToSyncGenerator on a token-streaming
+workload: an async generator yields tokens at a steady pace, as a model
+streaming its output would, and a synchronous caller consumes them.
+
+Latency is measured from the moment a token is produced in the event loop
+to the moment the synchronous caller gets it, for the event-driven wait of
+AsyncToSyncGenerator, and for the former wait polling every poll_seconds.
+
+Usage:
+    python -m tests.benchmarks.async_to_sync_generator_benchmark [--tokens N] [--interval_ms M]
+"""
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import Type
+
+import argparse
+
+from asyncio import Future
+from asyncio import sleep as async_sleep
+from time import perf_counter
+from time import sleep
+from time import time
+
+from leaf_common.asyncio.async_to_sync_generator import AsyncToSyncGenerator
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+from leaf_common.time.timeout import Timeout
+
+
+class PollingAsyncToSyncGenerator(AsyncToSyncGenerator):
+    """
+    AsyncToSyncGenerator waiting the way it formerly did, polling the future
+    every poll_seconds, for comparison.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def wait_for_future(self, future: Future, result_type: Type, timeout_seconds: float = 0.0,
+                        done_event: Any = None) -> Any:
+        start_time: float = time()
+        while not future.done():
+            Timeout.check_if_not_none(self.umbrella_timeout)
+            sleep(self.poll_seconds)
+            if 0.0 < timeout_seconds <= time() - start_time:
+                raise TimeoutError
+        return super().wait_for_future(future, result_type, timeout_seconds)
+
+
+async def stream_tokens(count: int, interval_seconds: float) -> AsyncIterator[float]:
+    """
+    Yield the perf_counter() at which each token is produced.
+    """
+    for _ in range(count):
+        await async_sleep(interval_seconds)
+        yield perf_counter()
+
+
+def run_benchmark(generator: AsyncToSyncGenerator, tokens: int, interval_seconds: float) -> Dict[str, Any]:
+    """
+    :param generator: The AsyncToSyncGenerator to benchmark
+    :param tokens: Number of tokens to stream
+    :param interval_seconds: Time between tokens
+    :return: A dictionary of results
+    """
+    histogram = LatencyHistogram()
+    start: float = perf_counter()
+    for produced_at in generator.synchronously_generate(stream_tokens, tokens, interval_seconds):
+        # The end of the stream is marked by one last keep_alive_result
+        if produced_at is not None:
+            histogram.record(perf_counter() - produced_at)
+    elapsed: float = perf_counter() - start
+    return {
+        "tokens_per_sec": histogram.count / elapsed,
+        "latency": histogram.get_metrics(),
+    }
+
+
+def main():
+    """
+    Main entry point
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=200,
+                        help="Number of tokens to stream")
+    parser.add_argument("--interval_ms", type=float, default=20.0,
+                        help="Milliseconds between tokens")
+    parser.add_argument("--poll_seconds", type=float, default=0.1,
+                        help="Polling interval of the former wait, for comparison")
+    args = parser.parse_args()
+
+    executor = AsyncioExecutor()
+    executor.start()
+    try:
+        generators: Dict[str, AsyncToSyncGenerator] = {
+            "event-driven": AsyncToSyncGenerator(executor, "benchmark", generated_type=float),
+            "polling": PollingAsyncToSyncGenerator(executor, "benchmark", generated_type=float,
+                                                   poll_seconds=args.poll_seconds),
+        }
+        print(f"{'wait':<16}{'tokens/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for name, generator in generators.items():
+            results: Dict[str, Any] = run_benchmark(generator, args.tokens, args.interval_ms / 1000.0)
+            latency: Dict[str, Any] = results["latency"]
+            print(f"{name:<16}{results['tokens_per_sec']:>12.1f}{latency['p50_ms']:>10.3f}"
+                  f"{latency['p99_ms']:>10.3f}{latency['max_ms']:>10.3f}")
+    finally:
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
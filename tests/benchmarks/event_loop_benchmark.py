@@ -0,0 +1,167 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Benchmark comparing event loop implementations selectable with EventLoopFactory,
+as used by AsyncioExecutor:
+  - submit round trip: latency of submit_and_wait() of a trivial coroutine
+    from a caller thread, which is the per-request overhead the executor adds.
+  - socket throughput: bytes per second echoed over a loopback TCP connection
+    with asyncio streams, both ends in the executor's event loop.
+
+Implementations which are not installed are skipped.
+
+Usage:
+    python -m tests.benchmarks.event_loop_benchmark [--round_trips N] [--megabytes M]
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+import argparse
+
+from asyncio import StreamReader
+from asyncio import StreamWriter
+from asyncio import open_connection
+from asyncio import start_server
+from importlib.util import find_spec
+from time import perf_counter
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.event_loop_factory import EventLoopFactory
+from leaf_common.asyncio.latency_histogram import LatencyHistogram
+
+CHUNK_SIZE: int = 64 * 1024
+
+
+async def noop():
+    """
+    Trivial coroutine for round trip measurements
+    """
+    return None
+
+
+async def echo(reader: StreamReader, writer: StreamWriter):
+    """
+    Server side of the socket benchmark: echo everything back.
+    """
+    while True:
+        data: bytes = await reader.read(CHUNK_SIZE)
+        if not data:
+            break
+        writer.write(data)
+        await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+async def measure_socket_throughput(megabytes: int) -> float:
+    """
+    :param megabytes: Number of megabytes to send through the echo server
+    :return: Echoed megabytes per second
+    """
+    server = await start_server(echo, "127.0.0.1", 0)
+    port: int = server.sockets[0].getsockname()[1]
+    reader, writer = await open_connection("127.0.0.1", port)
+    chunk: bytes = b"x" * CHUNK_SIZE
+    total: int = megabytes * 1024 * 1024
+
+    start: float = perf_counter()
+    received: int = 0
+    sent: int = 0
+    while sent < total:
+        writer.write(chunk)
+        sent += CHUNK_SIZE
+        await writer.drain()
+        while received < sent - 4 * CHUNK_SIZE:
+            received += len(await reader.read(CHUNK_SIZE))
+    writer.write_eof()
+    while received < sent:
+        data: bytes = await reader.read(CHUNK_SIZE)
+        if not data:
+            break
+        received += len(data)
+    elapsed: float = perf_counter() - start
+
+    writer.close()
+    await writer.wait_closed()
+    server.close()
+    await server.wait_closed()
+    return (received / (1024 * 1024)) / elapsed
+
+
+def run_benchmark(implementation: str, round_trips: int, megabytes: int) -> Dict[str, Any]:
+    """
+    :param implementation: The EventLoopFactory implementation to benchmark
+    :param round_trips: Number of submit round trips to time
+    :param megabytes: Number of megabytes for the socket throughput measurement
+    :return: A dictionary of results
+    """
+    executor = AsyncioExecutor(event_loop=implementation)
+    executor.start()
+    try:
+        # Warm up
+        for _ in range(min(100, round_trips)):
+            executor.submit_and_wait("benchmark", noop)
+
+        histogram = LatencyHistogram()
+        start: float = perf_counter()
+        for _ in range(round_trips):
+            submitted_at: float = perf_counter()
+            executor.submit_and_wait("benchmark", noop)
+            histogram.record(perf_counter() - submitted_at)
+        elapsed: float = perf_counter() - start
+
+        throughput: float = executor.submit_and_wait("benchmark", measure_socket_throughput, megabytes)
+        return {
+            "implementation": implementation,
+            "loop_class": type(executor.get_event_loop()).__name__,
+            "round_trips_per_sec": round_trips / elapsed,
+            "round_trip": histogram.get_metrics(),
+            "socket_mb_per_sec": throughput,
+        }
+    finally:
+        executor.shutdown()
+
+
+def main():
+    """
+    Main entry point
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--round_trips", type=int, default=10000,
+                        help="Number of submit round trips to time")
+    parser.add_argument("--megabytes", type=int, default=256,
+                        help="Number of megabytes to echo for the socket throughput measurement")
+    args = parser.parse_args()
+
+    implementations: List[str] = [EventLoopFactory.IMPLEMENTATION_ASYNCIO]
+    if find_spec("uvloop") is not None:
+        implementations.append(EventLoopFactory.IMPLEMENTATION_UVLOOP)
+    else:
+        print("uvloop is not installed, benchmarking asyncio only")
+
+    print(f"{'implementation':<16}{'loop class':<24}{'submits/s':>12}"
+          f"{'p50 ms':>10}{'p99 ms':>10}{'socket MB/s':>14}")
+    for implementation in implementations:
+        results: Dict[str, Any] = run_benchmark(implementation, args.round_trips, args.megabytes)
+        round_trip: Dict[str, Any] = results["round_trip"]
+        print(f"{results['implementation']:<16}{results['loop_class']:<24}"
+              f"{results['round_trips_per_sec']:>12.0f}{round_trip['p50_ms']:>10.3f}"
+              f"{round_trip['p99_ms']:>10.3f}{results['socket_mb_per_sec']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+# Copyright © 2019-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Microbenchmark of the per-task bookkeeping AsyncioExecutor keeps for tracked tasks,
+comparing the previous layout against TaskRecord:
+  - dicts:      a submission dictionary created by the caller, plus a second
+                {"task", "raise_exception"} dictionary in the background tasks table
+  - TaskRecord: one __slots__ record shared by every table
+
+For each layout, reports bytes per task held while tasks are in flight
+(measured with tracemalloc), and nanoseconds per task for the create/track/untrack
+cycle under the background tasks lock.
+
+The registry path each task goes through from creation until done is compared too:
+  - two tables: the background tasks table under its lock plus a separate
+                table of unfinished tasks, each with its own done callback
+  - one table:  the single background tasks table with a single done callback
+
+Also reports, on a running executor, nanoseconds per task from submit() to done
+in the event loop thread, bytes per task in flight, and the end-to-end cost
+per task of submit_many() from another thread.
+
+Usage:
+    python -m tests.benchmarks.task_registry_benchmark [--tasks N]
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import argparse
+import asyncio
+import tracemalloc
+
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from functools import partial
+from threading import Lock
+from time import monotonic
+from time import perf_counter_ns
+
+from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
+from leaf_common.asyncio.task_priority import TaskPriority
+from leaf_common.asyncio.task_record import TaskRecord
+
+
+def new_dict_entry(task: Any) -> Dict[str, Any]:
+    """
+    :return: The per-task bookkeeping of the previous dictionary layout.
+             Only the tracking dictionary is returned; it refers to the submission one
+             here so that both are kept alive, as the executor did.
+    """
+    submission: Dict[str, Any] = {
+        "submitter_id": "benchmark",
+        "submitted_at": monotonic(),
+        "admission_ticket": None,
+        "priority": TaskPriority.NORMAL,
+    }
+    submission["started_at"] = monotonic()
+    return {
+        "task": task,
+        "raise_exception": False,
+        "submission": submission,
+    }
+
+
+def new_record_entry(task: Any) -> TaskRecord:
+    """
+    :return: The per-task bookkeeping with TaskRecord
+    """
+    record = TaskRecord("benchmark", TaskPriority.NORMAL, None, monotonic())
+    record.task = task
+    record.started_at = monotonic()
+    return record
+
+
+def measure_bytes(new_entry: Callable[[Any], Any], num_tasks: int) -> float:
+    """
+    :param new_entry: Function creating the bookkeeping for one task
+    :param num_tasks: Number of tasks to hold at once
+    :return: Bytes per task
+    """
+    task = object()
+    table: Dict[int, Any] = {}
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    for task_id in range(num_tasks):
+        table[task_id] = new_entry(task)
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / num_tasks
+
+
+def measure_ns(new_entry: Callable[[Any], Any], num_tasks: int, repeats: int = 5) -> float:
+    """
+    :param new_entry: Function creating the bookkeeping for one task
+    :param num_tasks: Number of create/track/untrack cycles to time
+    :param repeats: Number of times to repeat the measurement
+    :return: Nanoseconds per task, best of the repeats
+    """
+    task = object()
+    table: Dict[int, Any] = {}
+    lock = Lock()
+    best: float = float("inf")
+    for _ in range(repeats):
+        start: int = perf_counter_ns()
+        for task_id in range(num_tasks):
+            entry = new_entry(task)
+            with lock:
+                table[task_id] = entry
+            with lock:
+                table.pop(task_id, None)
+        best = min(best, (perf_counter_ns() - start) / num_tasks)
+    return best
+
+
+def run_two_tables(loop: AbstractEventLoop, num_tasks: int) -> None:
+    """
+    The registry path of the previous layout: two tables and two done callbacks per task.
+    :param loop: The event loop to run the done callbacks in
+    :param num_tasks: Number of tasks to go through
+    """
+    background: Dict[int, TaskRecord] = {}
+    unfinished: Dict[Future, TaskRecord] = {}
+    lock = Lock()
+
+    def finished(_record: TaskRecord, future: Future):
+        unfinished.pop(future, None)
+
+    def done(future: Future):
+        with lock:
+            background.pop(id(future), None)
+
+    pending: List[Future] = []
+    for _ in range(num_tasks):
+        future: Future = loop.create_future()
+        record: TaskRecord = new_record_entry(future)
+        unfinished[future] = record
+        future.add_done_callback(partial(finished, record))
+        with lock:
+            background[id(future)] = record
+        future.add_done_callback(done)
+        pending.append(future)
+    for future in pending:
+        future.set_result(None)
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def run_one_table(loop: AbstractEventLoop, num_tasks: int) -> None:
+    """
+    The registry path of the current layout: one table and one done callback per task.
+    :param loop: The event loop to run the done callbacks in
+    :param num_tasks: Number of tasks to go through
+    """
+    background: Dict[int, TaskRecord] = {}
+    lock = Lock()
+
+    def done(_record: TaskRecord, future: Future):
+        with lock:
+            background.pop(id(future), None)
+
+    pending: List[Future] = []
+    for _ in range(num_tasks):
+        future: Future = loop.create_future()
+        record: TaskRecord = new_record_entry(future)
+        with lock:
+            background[id(future)] = record
+        future.add_done_callback(partial(done, record))
+        pending.append(future)
+    for future in pending:
+        future.set_result(None)
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def measure_registry_ns(run_path: Callable[[AbstractEventLoop, int], None], num_tasks: int,
+                        repeats: int = 5) -> float:
+    """
+    :param run_path: Function taking num_tasks through a registry path
+    :param num_tasks: Number of tasks per repeat
+    :param repeats: Number of times to repeat the measurement
+    :return: Nanoseconds per task, best of the repeats
+    """
+    loop: AbstractEventLoop = asyncio.new_event_loop()
+    best: float = float("inf")
+    try:
+        for _ in range(repeats):
+            start: int = perf_counter_ns()
+            run_path(loop, num_tasks)
+            best = min(best, (perf_counter_ns() - start) / num_tasks)
+    finally:
+        loop.close()
+    return best
+
+
+async def noop():
+    """
+    Trivial coroutine for the end-to-end measurement
+    """
+    return None
+
+
+def measure_executor_ns(num_tasks: int) -> float:
+    """
+    :param num_tasks: Number of tasks to submit
+    :return: Nanoseconds per task for submit_many() on a running executor,
+             until all the tasks are done
+    """
+    executor = AsyncioExecutor()
+    executor.start()
+    try:
+        batch_size: int = 1000
+        start: int = perf_counter_ns()
+        for _ in range(0, num_tasks, batch_size):
+            futures: List[Any] = executor.submit_many("benchmark", [(noop, None, None)] * batch_size,
+                                                      result_futures=True)
+            for future in futures:
+                future.result()
+        return (perf_counter_ns() - start) / num_tasks
+    finally:
+        executor.shutdown()
+
+
+async def submit_until_done(executor: AsyncioExecutor, num_tasks: int) -> float:
+    """
+    :param executor: The running executor whose event loop this runs in
+    :param num_tasks: Number of tasks to submit
+    :return: Nanoseconds per task from submit() to done, in the event loop thread
+    """
+    start: int = perf_counter_ns()
+    for _ in range(num_tasks):
+        executor.submit("benchmark", noop)
+    # Let every done callback run
+    await asyncio.sleep(0)
+    return (perf_counter_ns() - start) / num_tasks
+
+
+async def hold_in_flight(executor: AsyncioExecutor, num_tasks: int) -> float:
+    """
+    :param executor: The running executor whose event loop this runs in
+    :param num_tasks: Number of tasks to hold in flight at once
+    :return: Bytes per task in flight, including the Task and coroutine themselves
+    """
+    release = asyncio.Event()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    for _ in range(num_tasks):
+        executor.submit("benchmark", release.wait)
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    release.set()
+    await asyncio.sleep(0)
+    return (after - before) / num_tasks
+
+
+def measure_in_loop(num_tasks: int) -> Dict[str, float]:
+    """
+    :param num_tasks: Number of tasks per measurement
+    :return: A dictionary with "ns_per_task" from submit() to done in the event loop thread,
+             and "bytes_per_task" held in flight
+    """
+    executor = AsyncioExecutor()
+    executor.start()
+    try:
+        return {
+            "ns_per_task": executor.submit_and_wait("driver", submit_until_done, executor, num_tasks),
+            "bytes_per_task": executor.submit_and_wait("driver", hold_in_flight, executor, num_tasks),
+        }
+    finally:
+        executor.shutdown()
+
+
+def main():
+    """
+    Main entry point
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=200000,
+                        help="Number of tasks per measurement")
+    args = parser.parse_args()
+
+    print(f"{'layout':<12}{'bytes/task':>12}{'ns/task':>10}")
+    for name, new_entry in (("dicts", new_dict_entry), ("TaskRecord", new_record_entry)):
+        print(f"{name:<12}{measure_bytes(new_entry, args.tasks):>12.1f}{measure_ns(new_entry, args.tasks):>10.1f}")
+    print()
+    print(f"{'registry':<12}{'ns/task':>10}")
+    for name, run_path in (("two tables", run_two_tables), ("one table", run_one_table)):
+        print(f"{name:<12}{measure_registry_ns(run_path, args.tasks):>10.1f}")
+    print()
+    in_loop: Dict[str, float] = measure_in_loop(args.tasks)
+    print(f"submit() to done in the event loop: {in_loop['ns_per_task']:.0f} ns/task, "
+          f"{in_loop['bytes_per_task']:.0f} bytes/task in flight")
+    print(f"submit_many() end to end: {measure_executor_ns(args.tasks):.0f} ns/task")
+
+
+if __name__ == "__main__":
+    main()